@@ -1,3 +1,4 @@
+from datetime import datetime
 from fastapi import Query
 
 class QueryUserDataFilterByPassport:
@@ -28,9 +29,13 @@ class QueryUserDataFilterByStudy:
         study_direction_name: str = Query(None),
         education_type: str = Query(None),
         study_type: str = Query(None),
+        created_from: datetime = Query(None),
+        created_to: datetime = Query(None),
     ):
         self.study_language = study_language
         self.study_form = study_form
         self.study_direction_name = study_direction_name
         self.education_type = education_type
         self.study_type = study_type
+        self.created_from = created_from
+        self.created_to = created_to
@@ -1,27 +1,48 @@
+import logging
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles 
 from src.api import api_router
+from src.api.health import health_router
+from src.api.uploads import uploads_router
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from src.core.docs_auth import DocsAuthMiddleware
+from src.core.instrumentation import QueryStatsMiddleware
+from src.core.metrics import MetricsMiddleware, render_metrics, reset_multiprocess_dir
+from src.core.admission import AdmissionMiddleware
+from src.core.middleware import RequestIdMiddleware, TimingMiddleware
 from src.core.model_config import configure_models
+from src.core.server import server_options, log_concurrency_report
+from src.core.openapi import install_cached_openapi
+from src.core.lifespan import lifespan
+from src.core.config import settings
+
+# Runs in the supervisor and in every worker, which import this module too.
+logging.basicConfig(
+    level=settings.log_level.upper(),
+    format="%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s",
+)
 
 # Configure models before creating the FastAPI app
 configure_models()
 
-app = FastAPI(title="Sharq Admissions API", description="API for the Admissions system")
-
-# Mount the uploads directory to serve static files
-app.mount("/uploads", StaticFiles(directory="uploads/"), name="uploads")
-
+app = FastAPI(title="Sharq Admissions API", description="API for the Admissions system", lifespan=lifespan)
 
 app.include_router(api_router)
+app.include_router(health_router)
+app.include_router(uploads_router)
+install_cached_openapi(app)
+app.add_middleware(AdmissionMiddleware)
 app.add_middleware(DocsAuthMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TimingMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
-@app.get("/health", include_in_schema=False)
-def health_check():
-    return {"status": "ok"}
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return render_metrics()
 
 @app.get("/", include_in_schema=False)
 def root():
@@ -43,7 +64,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "Retry-After"],
 )
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8082, reload=False)
+    log_concurrency_report()
+    reset_multiprocess_dir()
+    uvicorn.run("main:app", **server_options())
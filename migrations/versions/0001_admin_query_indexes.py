@@ -0,0 +1,115 @@
+"""Indexes for admin list, lookup and login queries
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+All indexes are built CONCURRENTLY outside a transaction, so they can be
+applied to a live database without blocking writes.
+"""
+from typing import NamedTuple
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+class Index(NamedTuple):
+    name: str
+    table: str
+    columns: list
+    unique: bool = False
+
+
+def _prefix(column: str) -> sa.TextClause:
+    # Serves lower(col) LIKE 'x%' from src.service.filters regardless of collation.
+    return sa.text(f"lower({column}) text_pattern_ops")
+
+
+# Table names at this revision; migrations must not follow later model changes.
+AMOCRM_LEAD = "amocrm_leads"
+CONTRACT = "contracts"
+PASSPORT = "passport_data"
+STUDY_INFO = "study_info"
+USERS = "users"
+
+INDEXES = [
+    Index("ix_study_info_user_id", STUDY_INFO, ["user_id"]),
+    Index("ix_study_info_create_at", STUDY_INFO, ["create_at"]),
+    Index("uq_contract_user_id_contract_type", CONTRACT, ["user_id", "contract_type"], unique=True),
+    Index("ix_contract_created_at", CONTRACT, ["created_at"]),
+    Index("ix_amocrm_lead_user_id", AMOCRM_LEAD, ["user_id"]),
+    Index("uq_passport_data_jshshir", PASSPORT, ["jshshir"], unique=True),
+    Index("ix_passport_data_passport_series_number", PASSPORT, ["passport_series_number"]),
+    Index("ix_users_phone_number", USERS, ["phone_number"]),
+    Index("ix_passport_data_first_name_prefix", PASSPORT, [_prefix("first_name")]),
+    Index("ix_passport_data_last_name_prefix", PASSPORT, [_prefix("last_name")]),
+    Index("ix_passport_data_third_name_prefix", PASSPORT, [_prefix("third_name")]),
+    Index("ix_passport_data_region_prefix", PASSPORT, [_prefix("region")]),
+    Index("ix_passport_data_series_number_prefix", PASSPORT, [_prefix("passport_series_number")]),
+    Index("ix_passport_data_jshshir_prefix", PASSPORT, [_prefix("jshshir")]),
+]
+
+
+def _ensure_no_duplicates(index: Index) -> None:
+    """Fail early instead of leaving an INVALID index behind."""
+    columns = ", ".join(index.columns)
+    not_null = " AND ".join(f"{column} IS NOT NULL" for column in index.columns)
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT count(*) FROM (SELECT 1 FROM {index.table} WHERE {not_null} "
+            f"GROUP BY {columns} HAVING count(*) > 1) AS dup"
+        )
+    ).scalar_one()
+    if duplicates:
+        raise RuntimeError(
+            f"{index.table} has {duplicates} duplicated ({columns}) values; "
+            f"clean them up before creating {index.name}"
+        )
+
+
+def _drop_if_invalid(name: str) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an invalid index that
+    # IF NOT EXISTS would otherwise silently keep.
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    for index in INDEXES:
+        if index.unique:
+            _ensure_no_duplicates(index)
+
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            _drop_if_invalid(index.name)
+            op.create_index(
+                index.name,
+                index.table,
+                index.columns,
+                unique=index.unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index in reversed(INDEXES):
+            op.drop_index(
+                index.name,
+                table_name=index.table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
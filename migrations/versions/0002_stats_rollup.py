@@ -0,0 +1,81 @@
+"""Materialized rollup behind /api/stats/breakdown
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+The view is refreshed by a background task in the app; the refresh time is
+kept in stats_rollup_refresh so every worker reports the same value.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+ROLLUP_VIEW = "stats_application_rollup"
+REFRESH_TABLE = "stats_rollup_refresh"
+
+# Table names at this revision; migrations must not follow later model changes.
+CONTRACT = "contracts"
+PASSPORT = "passport_data"
+STUDY_DIRECTION = "study_directions"
+STUDY_FORM = "study_forms"
+STUDY_INFO = "study_info"
+STUDY_LANGUAGE = "study_languages"
+
+# Read by src.service.stats through its `rollup` table clause.
+ROLLUP_SQL = f"""
+SELECT
+    CAST(date_trunc('day', si.create_at) AS DATE) AS day,
+    coalesce(si.study_direction_id, 0) AS study_direction_id,
+    sd.name AS study_direction,
+    coalesce(si.study_form_id, 0) AS study_form_id,
+    sf.name AS study_form,
+    coalesce(si.study_language_id, 0) AS study_language_id,
+    sl.name AS study_language,
+    coalesce(pd.region, '') AS region,
+    count(*) AS applications,
+    count(cu.user_id) AS approved
+FROM {STUDY_INFO} AS si
+LEFT JOIN {STUDY_DIRECTION} AS sd ON sd.id = si.study_direction_id
+LEFT JOIN {STUDY_FORM} AS sf ON sf.id = si.study_form_id
+LEFT JOIN {STUDY_LANGUAGE} AS sl ON sl.id = si.study_language_id
+LEFT JOIN {PASSPORT} AS pd ON pd.user_id = si.user_id
+LEFT JOIN (SELECT DISTINCT user_id FROM {CONTRACT}) AS cu ON cu.user_id = si.user_id
+GROUP BY
+    CAST(date_trunc('day', si.create_at) AS DATE),
+    coalesce(si.study_direction_id, 0),
+    sd.name,
+    coalesce(si.study_form_id, 0),
+    sf.name,
+    coalesce(si.study_language_id, 0),
+    sl.name,
+    coalesce(pd.region, '')
+"""
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {ROLLUP_VIEW} AS {ROLLUP_SQL}")
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    op.execute(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {ROLLUP_VIEW}_key ON {ROLLUP_VIEW} "
+        "(day, study_direction_id, study_form_id, study_language_id, region)"
+    )
+    op.create_table(
+        REFRESH_TABLE,
+        sa.Column("view_name", sa.Text, primary_key=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+    op.execute(
+        f"INSERT INTO {REFRESH_TABLE} (view_name, refreshed_at) "
+        f"VALUES ('{ROLLUP_VIEW}', now()) ON CONFLICT (view_name) DO NOTHING"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(REFRESH_TABLE, if_exists=True)
+    op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {ROLLUP_VIEW}")
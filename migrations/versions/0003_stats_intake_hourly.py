@@ -0,0 +1,34 @@
+"""Hourly intake counters behind /api/stats/intake
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+Maintained incrementally by the app (src.models.IntakeHourly); run
+IntakeAnalyticsService.rebuild() once after upgrading to backfill it.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+TABLE = "stats_intake_hourly"
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE,
+        sa.Column("bucket", sa.DateTime, nullable=False),
+        sa.Column("study_direction_id", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("study_form_id", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("applications", sa.Integer, nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("bucket", "study_direction_id", "study_form_id"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE, if_exists=True)
@@ -0,0 +1,73 @@
+"""One StudyInfo per user, enforced by a unique index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+
+The bulk import upserts with ON CONFLICT (user_id), which needs a unique
+index. It replaces the plain ix_study_info_user_id from 0001. Built
+CONCURRENTLY outside a transaction, like 0001.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# Table name at this revision.
+STUDY_INFO = "study_info"
+
+UNIQUE_INDEX = "uq_study_info_user_id"
+PLAIN_INDEX = "ix_study_info_user_id"
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT count(*) FROM (SELECT 1 FROM {STUDY_INFO} WHERE user_id IS NOT NULL "
+            "GROUP BY user_id HAVING count(*) > 1) AS dup"
+        )
+    ).scalar_one()
+    if duplicates:
+        raise RuntimeError(
+            f"{STUDY_INFO} has {duplicates} users with several rows; "
+            f"clean them up before creating {UNIQUE_INDEX}"
+        )
+
+    with op.get_context().autocommit_block():
+        invalid = op.get_bind().execute(
+            sa.text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": UNIQUE_INDEX},
+        ).first()
+        if invalid:
+            op.drop_index(UNIQUE_INDEX, postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            UNIQUE_INDEX,
+            STUDY_INFO,
+            ["user_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            PLAIN_INDEX, table_name=STUDY_INFO, postgresql_concurrently=True, if_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            PLAIN_INDEX,
+            STUDY_INFO,
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            UNIQUE_INDEX, table_name=STUDY_INFO, postgresql_concurrently=True, if_exists=True
+        )
@@ -10,6 +10,8 @@ from .auth import auth_router
 from .role import role_router
 from .user_data import user_data_router
 from .contract import contract_router
+from .stats import stats_router
+from .uploads import upload_links_router
 
 
 api_router = APIRouter(prefix="/api")
@@ -25,4 +27,6 @@ api_router.include_router(passport_data_router)
 api_router.include_router(role_router)
 api_router.include_router(user_data_router)
 api_router.include_router(contract_router)
+api_router.include_router(stats_router)
+api_router.include_router(upload_links_router)
 
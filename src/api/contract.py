@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException 
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
-import os
+import posixpath
 
 from src.core.db import get_db
+from src.core.uploads import signed_file_url, upload_response
 from src.service.contract import ContractService
 from sharq_models.models import User  # type: ignore
 from src.utils.auth import require_roles
@@ -28,42 +29,49 @@ async def generate_contracts(
     _: Annotated[User, Depends(require_roles(["admin"]))],
 ):
     urls = await service.generate_contracts(user_id=request.user_id, edu_course_level=request.edu_course_level)
-    return {"message": "Generated successfully", "urls": urls}
+    return {
+        "message": "Generated successfully",
+        "urls": urls,
+        # /uploads needs a token; these work as plain browser links until they expire.
+        "signed_urls": [signed_file_url(url) for url in urls],
+    }
 
 
 @contract_router.get("/download/ikki/{user_id}")
 async def download_ikki_pdf(
     user_id: int,
+    request: Request,
     service: Annotated[ContractService, Depends(get_contract_service)],
     _: Annotated[User, Depends(require_roles(["admin"]))],
 ):
     file_path = await service.get_or_create_contract(user_id=user_id, contract_type="two_side")
 
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(
-        path=file_path,
-        filename=os.path.basename(file_path),
-        media_type="application/pdf"
+    return await upload_response(
+        request,
+        file_path,
+        filename=posixpath.basename(file_path),
+        media_type="application/pdf",
+        # The URL is per user, not per file: a regenerated contract must not be cached.
+        cache="private, no-cache",
     )
 
 
 @contract_router.get("/download/uch/{user_id}")  
 async def download_uch_pdf(
     user_id: int,
+    request: Request,
     service: Annotated[ContractService, Depends(get_contract_service)],
     _: Annotated[User, Depends(require_roles(["admin"]))],
 ):
     file_path = await service.get_or_create_contract(user_id=user_id, contract_type="three_side")
 
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(
-        path=file_path,
-        filename=os.path.basename(file_path),
-        media_type="application/pdf"
+    return await upload_response(
+        request,
+        file_path,
+        filename=posixpath.basename(file_path),
+        media_type="application/pdf",
+        # The URL is per user, not per file: a regenerated contract must not be cached.
+        cache="private, no-cache",
     )
 
 
@@ -72,7 +80,11 @@ async def get_all_contract_data(
     service: Annotated[ContractService, Depends(get_contract_service)],
     _: Annotated[User, Depends(require_roles(["admin"]))],
 ):
-    return await service.get_contracts()
+    contracts = await service.get_contracts()
+    return [
+        {**jsonable_encoder(contract), "signed_url": signed_file_url(contract.file_url)}
+        for contract in contracts
+    ]
 
 
 
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends
 from src.utils.auth import require_roles
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, List
 from sharq_models import User #type: ignore
 from src.service.education_type import EducationTypeCrud
 from src.schemas.education_type import (
     EducationTypeBase,
     EducationTypeUpdate,
     EducationTypeResponse,
+    EducationTypeBulkUpdate,
     EducationTypeFilter,
 )
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.core.db import get_db
 
 education_type_router = APIRouter(prefix="/education_type", tags=["Education Type"])
@@ -28,6 +30,33 @@ async def create_study_form(
     return await service.create_education_type(obj=item)
 
 
+@education_type_router.post("/bulk_create", response_model=List[EducationTypeResponse])
+async def bulk_create_education_types(
+    items: List[EducationTypeBase],
+    service: Annotated[EducationTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_education_types(items=items)
+
+
+@education_type_router.put("/bulk_update", response_model=List[EducationTypeResponse])
+async def bulk_update_education_types(
+    items: List[EducationTypeBulkUpdate],
+    service: Annotated[EducationTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_education_types(items=items)
+
+
+@education_type_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_education_types(
+    request: BulkDeleteRequest,
+    service: Annotated[EducationTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_education_types(ids=request.ids)
+
+
 @education_type_router.get("/get_by_id/{education_type_id}", response_model=EducationTypeResponse)
 async def get_by_study_education_type_id(
     education_type_id: int,
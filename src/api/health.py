@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from src.core.health import readiness_report
+
+health_router = APIRouter(prefix="/health", include_in_schema=False)
+
+
+@health_router.get("")
+@health_router.get("/live")
+def liveness():
+    return {"status": "ok"}
+
+
+@health_router.get("/ready")
+async def readiness():
+    report = await readiness_report()
+    status_code = 200 if report["status"] == "ok" else 503
+    return JSONResponse(content=report, status_code=status_code)
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query
 from src.utils.auth import require_roles
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, Any
 from sharq_models import User #type: ignore
 from src.service.passport_data import PassportDataCrud
 from src.schemas.passport_data import (
     PassportDataUpdate,
     PassportDataResponse,
+    PassportBulkUpsertReport,
 )
 from src.core.db import get_db
 
@@ -44,6 +45,17 @@ async def get_all_passport_datas(
     )
 
 
+@passport_data_router.post("/bulk_upsert", response_model=PassportBulkUpsertReport)
+async def bulk_upsert_passport_data(
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    service: Annotated[PassportDataCrud, Depends(get_service_crud)],
+    payload: list[dict[str, Any]] = Body(...),
+    # 17 columns per row must stay under asyncpg's 32767 bind parameters.
+    chunk_size: int = Query(1000, ge=1, le=1500),
+):
+    return await service.bulk_upsert_passport_data(payload=payload, chunk_size=chunk_size)
+
+
 @passport_data_router.put("/update/{passport_data_id}", response_model=PassportDataResponse)
 async def update_passport_data(
     passport_data_id: int,
@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from sharq_models.models import User
 from src.service.role import RoleService
-from src.schemas.role import RoleCreate, RoleUpdate, RoleResponse, UserRoleUpdate
+from src.schemas.role import RoleCreate, RoleUpdate, RoleResponse, UserRoleUpdate, RoleBulkUpdate
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.utils.auth import require_roles
 from src.core.db import get_db
 
@@ -24,6 +25,33 @@ async def create_role(
     return await service.create_role(role_data)
 
 
+@role_router.post("/bulk_create", response_model=List[RoleResponse])
+async def bulk_create_roles(
+    items: List[RoleCreate],
+    service: Annotated[RoleService, Depends(get_role_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_roles(items=items)
+
+
+@role_router.put("/bulk_update", response_model=List[RoleResponse])
+async def bulk_update_roles(
+    items: List[RoleBulkUpdate],
+    service: Annotated[RoleService, Depends(get_role_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_roles(items=items)
+
+
+@role_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_roles(
+    request: BulkDeleteRequest,
+    service: Annotated[RoleService, Depends(get_role_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_roles(ids=request.ids)
+
+
 @role_router.get("/{role_id}", response_model=RoleResponse)
 async def get_role(
     role_id: int,
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+from datetime import date, datetime
+
+from sharq_models import User  # type: ignore
+from src.core.db import get_db
+from src.service.stats import StatsService
+from src.service.analytics import IntakeAnalyticsService
+from src.schemas.stats import (
+    IntakeGranularity,
+    IntakeGroupBy,
+    IntakeSeriesResponse,
+    StatsBreakdownResponse,
+    StatsDimension,
+    StatsSummaryResponse,
+)
+from src.utils.auth import require_roles
+
+stats_router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+def get_stats_service(db: AsyncSession = Depends(get_db)):
+    return StatsService(db)
+
+
+def get_intake_service(db: AsyncSession = Depends(get_db)):
+    return IntakeAnalyticsService(db)
+
+
+@stats_router.get("/summary", response_model=StatsSummaryResponse)
+async def get_stats_summary(
+    service: Annotated[StatsService, Depends(get_stats_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.get_summary()
+
+
+@stats_router.get("/breakdown/{dimension}", response_model=StatsBreakdownResponse)
+async def get_stats_breakdown(
+    dimension: StatsDimension,
+    service: Annotated[StatsService, Depends(get_stats_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    date_from: date | None = None,
+    date_to: date | None = None,
+):
+    return await service.get_breakdown(
+        dimension=dimension, date_from=date_from, date_to=date_to
+    )
+
+
+@stats_router.post("/refresh")
+async def refresh_stats(
+    service: Annotated[StatsService, Depends(get_stats_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    refreshed_at = await service.refresh_rollup()
+    return {"refreshed_at": refreshed_at}
+
+
+@stats_router.get("/intake", response_model=IntakeSeriesResponse)
+async def get_intake_series(
+    date_from: datetime,
+    date_to: datetime,
+    service: Annotated[IntakeAnalyticsService, Depends(get_intake_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    granularity: IntakeGranularity = IntakeGranularity.day,
+    group_by: list[IntakeGroupBy] = Query([]),
+    study_direction_id: int | None = None,
+    study_form_id: int | None = None,
+    compare_previous: bool = False,
+):
+    return await service.get_intake(
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+        group_by=group_by,
+        study_direction_id=study_direction_id,
+        study_form_id=study_form_id,
+        compare_previous=compare_previous,
+    )
+
+
+@stats_router.post("/intake/rebuild")
+async def rebuild_intake_rollup(
+    service: Annotated[IntakeAnalyticsService, Depends(get_intake_service)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    buckets = await service.rebuild()
+    return {"buckets": buckets}
@@ -7,7 +7,9 @@ from src.schemas.study_direction import (
     StudyDirectionBase,
     StudyDirectionUpdate,
     StudyDirectionResponse,
+    StudyDirectionBulkUpdate,
 )
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.core.db import get_db
 from typing import Annotated, List
 
@@ -28,6 +30,33 @@ async def create_study_direction(
     return await service.create_study_direction(obj=item)
 
 
+@study_direction_router.post("/bulk_create", response_model=List[StudyDirectionResponse])
+async def bulk_create_study_directions(
+    items: List[StudyDirectionBase],
+    service: Annotated[StudyDirectionCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_study_directions(items=items)
+
+
+@study_direction_router.put("/bulk_update", response_model=List[StudyDirectionResponse])
+async def bulk_update_study_directions(
+    items: List[StudyDirectionBulkUpdate],
+    service: Annotated[StudyDirectionCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_study_directions(items=items)
+
+
+@study_direction_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_study_directions(
+    request: BulkDeleteRequest,
+    service: Annotated[StudyDirectionCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_study_directions(ids=request.ids)
+
+
 @study_direction_router.get(
     "/get_by_id/{direction_id}", response_model=StudyDirectionResponse
 )
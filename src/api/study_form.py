@@ -8,8 +8,10 @@ from src.schemas.study_form import (
     StudyFormBase,
     StudyFormUpdate,
     StudyFormResponse,
+    StudyFormBulkUpdate,
     StudyFormFilter,
 )
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.core.db import get_db
 
 study_form_router = APIRouter(prefix="/study_form", tags=["Study Form"])
@@ -28,6 +30,33 @@ async def create_study_form(
     return await service.create_study_form(obj=item)
 
 
+@study_form_router.post("/bulk_create", response_model=List[StudyFormResponse])
+async def bulk_create_study_forms(
+    items: List[StudyFormBase],
+    service: Annotated[StudyFormCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_study_forms(items=items)
+
+
+@study_form_router.put("/bulk_update", response_model=List[StudyFormResponse])
+async def bulk_update_study_forms(
+    items: List[StudyFormBulkUpdate],
+    service: Annotated[StudyFormCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_study_forms(items=items)
+
+
+@study_form_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_study_forms(
+    request: BulkDeleteRequest,
+    service: Annotated[StudyFormCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_study_forms(ids=request.ids)
+
+
 @study_form_router.get("/get_by_id/{form_id}", response_model=StudyFormResponse)
 async def get_by_study_form_id(
     form_id: int,
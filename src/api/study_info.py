@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends , Query
+from fastapi import APIRouter, Depends , Query, UploadFile, File, HTTPException
 from src.service.study_info import StudyInfoCrud
+from src.service.study_info_import import StudyInfoImporter
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.schemas.study_info import StudyInfoResponse, StudyInfoCreate , StudyInfoListResponse
+from src.schemas.study_info import StudyInfoResponse, StudyInfoCreate , StudyInfoListResponse, StudyInfoImportReport
 from src.schemas.user_data import UserDataFilterByPassportData , UserDataFilterByStudyInfo
 from dto.study_info_filter import QueryUserDataFilterByPassport , QueryUserDataFilterByStudy
 from src.core.db import get_db
@@ -17,6 +18,10 @@ def get_service_crud(db: AsyncSession = Depends(get_db)):
     return StudyInfoCrud(db)
 
 
+def get_importer(db: AsyncSession = Depends(get_db)):
+    return StudyInfoImporter(db)
+
+
 @study_info_router.get("/get_by_id/{study_info_id}")
 async def get_by_study_info_id(
     study_info_id: int,
@@ -72,6 +77,18 @@ async def create_study_info(
 
 
 
+@study_info_router.post("/import", response_model=StudyInfoImportReport)
+async def import_study_info(
+    importer: Annotated[StudyInfoImporter, Depends(get_importer)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    file: UploadFile = File(...),
+):
+    try:
+        return await importer.import_file(file.file, file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @study_info_router.delete("/delete")
 async def delete_study_info(
     service: Annotated[StudyInfoCrud, Depends(get_service_crud)],
@@ -9,8 +9,10 @@ from src.schemas.study_language import (
     StudyLanguageBase,
     StudyLanguageUpdate,
     StudyLanguageResponse,
+    StudyLanguageBulkUpdate,
     StudyLanguageFilter,
 )
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.core.db import get_db
 
 study_language_router = APIRouter(prefix="/study_language", tags=["Study Language"])
@@ -29,6 +31,33 @@ async def create_study_language(
     return await service.create_study_language(obj=item)
 
 
+@study_language_router.post("/bulk_create", response_model=List[StudyLanguageResponse])
+async def bulk_create_study_languages(
+    items: List[StudyLanguageBase],
+    service: Annotated[StudyLanguageCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_study_languages(items=items)
+
+
+@study_language_router.put("/bulk_update", response_model=List[StudyLanguageResponse])
+async def bulk_update_study_languages(
+    items: List[StudyLanguageBulkUpdate],
+    service: Annotated[StudyLanguageCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_study_languages(items=items)
+
+
+@study_language_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_study_languages(
+    request: BulkDeleteRequest,
+    service: Annotated[StudyLanguageCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_study_languages(ids=request.ids)
+
+
 @study_language_router.get(
     "/get_by_id/{language_id}", response_model=StudyLanguageResponse
 )
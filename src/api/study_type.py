@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from src.utils.auth import require_roles
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, List
 from sharq_models import User #type: ignore
 from src.service.study_type import StudyTypeCrud
 from src.schemas.study_form import (
@@ -10,6 +10,12 @@ from src.schemas.study_form import (
     StudyFormResponse,
     StudyFormFilter,
 )
+from src.schemas.study_type import (
+    StudyTypeBase,
+    StudyTypeResponse,
+    StudyTypeBulkUpdate,
+)
+from src.schemas.bulk import BulkDeleteRequest, BulkDeleteResponse
 from src.core.db import get_db
 
 study_type_router = APIRouter(prefix="/study_type", tags=["Study Type"])
@@ -28,6 +34,33 @@ async def create_study_type(
     return await service.create_study_type(obj=item)
 
 
+@study_type_router.post("/bulk_create", response_model=List[StudyTypeResponse])
+async def bulk_create_study_types(
+    items: List[StudyTypeBase],
+    service: Annotated[StudyTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_create_study_types(items=items)
+
+
+@study_type_router.put("/bulk_update", response_model=List[StudyTypeResponse])
+async def bulk_update_study_types(
+    items: List[StudyTypeBulkUpdate],
+    service: Annotated[StudyTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_update_study_types(items=items)
+
+
+@study_type_router.post("/bulk_delete", response_model=BulkDeleteResponse)
+async def bulk_delete_study_types(
+    request: BulkDeleteRequest,
+    service: Annotated[StudyTypeCrud, Depends(get_service_crud)],
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+):
+    return await service.bulk_delete_study_types(ids=request.ids)
+
+
 @study_type_router.get("/get_by_id/{form_id}", response_model=StudyFormResponse)
 async def get_by_study_type_id(
     type_id: int,
@@ -0,0 +1,60 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sharq_models.models import User  # type: ignore
+from src.core.db import get_db
+from src.core.uploads import find_upload, signed_upload_url, upload_response, verify_upload_signature
+from src.utils.auth import get_current_user_with_role, require_roles
+
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+# Mounted on the app itself so existing "/uploads/..." links keep working.
+uploads_router = APIRouter(prefix="/uploads", include_in_schema=False)
+
+upload_links_router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+async def authorize_upload(
+    file_path: str,
+    request: Request,
+    token: Annotated[str | None, Depends(optional_oauth2_scheme)],
+    db: AsyncSession = Depends(get_db),
+) -> None:
+    """Allow a valid signed URL, otherwise require an admin bearer token."""
+    expires = request.query_params.get("expires")
+    signature = request.query_params.get("signature")
+    if expires and signature:
+        if verify_upload_signature(file_path, expires, signature):
+            return
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Havola muddati tugagan yoki noto'g'ri",
+        )
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    await get_current_user_with_role(["admin"], token=token, db=db)
+
+
+@uploads_router.api_route("/{file_path:path}", methods=["GET", "HEAD"])
+async def serve_upload(
+    file_path: str,
+    request: Request,
+    _: Annotated[None, Depends(authorize_upload)],
+):
+    return await upload_response(request, file_path)
+
+
+@upload_links_router.get("/signed_url")
+async def get_signed_upload_url(
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    path: str = Query(..., description="Path as stored, e.g. uploads/contracts/two_side/<uuid>.pdf"),
+):
+    await find_upload(path)
+    return {"url": signed_upload_url(path)}
@@ -1,7 +1,12 @@
 from fastapi import APIRouter, Depends, Query
 from src.service.user_data import UserData
 from src.core.db import get_db
-from src.schemas.user_data import UserDataFilterByPassportData, UserDataFilterByStudyInfo
+from src.schemas.user_data import (
+    UserDataFilterByPassportData,
+    UserDataFilterByStudyInfo,
+    UserDataResponse,
+    UserProfilesRequest,
+)
 from sharq_models import User  # type: ignore
 from src.utils.auth import require_roles
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,6 +32,15 @@ async def get_user_data(
     return await service.get_user_data_by_id(user_id=user_id)
 
 
+@user_data_router.post("/profiles", response_model=list[UserDataResponse])
+async def get_user_profiles(
+    payload: UserProfilesRequest,
+    _: Annotated[User, Depends(require_roles(["admin"]))],
+    service: Annotated[UserData, Depends(get_user_data_service)],
+):
+    return await service.get_user_profiles(user_ids=payload.user_ids)
+
+
 @user_data_router.get("/get_user_data_by_passport_data_filter")
 async def get_user_data_by_passport_data_filter(
     _: Annotated[User, Depends(require_roles(["admin"]))],
@@ -0,0 +1,89 @@
+"""Requests/sec of a trivial endpoint with and without the middleware stack.
+
+Requests are driven straight through the ASGI interface, so the numbers are
+pure middleware overhead with no network or server in the way.
+
+Usage: python -m src.cli.bench_middleware [--requests 20000]
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.docs_auth import DocsAuthMiddleware
+from src.core.instrumentation import QueryStatsMiddleware
+from src.core.metrics import MetricsMiddleware
+from src.core.middleware import RequestIdMiddleware, TimingMiddleware
+
+PURE_STACK = [DocsAuthMiddleware, QueryStatsMiddleware, MetricsMiddleware, TimingMiddleware, RequestIdMiddleware]
+
+
+class _Passthrough(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def build_app(middlewares) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+
+async def requests_per_second(app, count: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/ping",
+        "raw_path": b"/api/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return count / (time.perf_counter() - started)
+
+
+async def run(count: int) -> None:
+    variants = {
+        "no middleware": [],
+        "pure ASGI stack": PURE_STACK,
+        f"{len(PURE_STACK)} x BaseHTTPMiddleware": [_Passthrough] * len(PURE_STACK),
+    }
+    for name, middlewares in variants.items():
+        rps = await requests_per_second(build_app(middlewares), count)
+        print(f"{name:<28}{rps:>10.0f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
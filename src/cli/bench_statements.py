@@ -0,0 +1,87 @@
+"""Measure per-call Python overhead of building vs. reusing hot statements.
+
+No database is needed: each iteration does what execute() does before any I/O,
+i.e. builds the statement (or reuses the prebuilt one) and generates its cache
+key, then looks the compiled form up in a SQLAlchemy LRU cache.
+
+Usage: python -m src.cli.bench_statements [--iterations 20000]
+"""
+import argparse
+import timeit
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import joinedload
+from sqlalchemy.util import LRUCache
+
+from sharq_models.models import Contract, StudyInfo, User  # type: ignore
+from src.core.model_config import configure_models
+
+
+def _fresh_statements() -> dict:
+    return {
+        "get_user": lambda: select(User)
+        .options(joinedload(User.role))
+        .where(User.phone_number == "+998900000000"),
+        "_get_contract": lambda: select(Contract)
+        .options(
+            joinedload(Contract.user).joinedload(User.passport_data),
+            joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_form),
+            joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_type),
+            joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_direction),
+        )
+        .where(Contract.user_id == 1, Contract.contract_type == "two_side"),
+        "_get_with_join": lambda: select(StudyInfo)
+        .options(
+            joinedload(StudyInfo.study_language),
+            joinedload(StudyInfo.study_form),
+            joinedload(StudyInfo.study_direction),
+            joinedload(StudyInfo.education_type),
+            joinedload(StudyInfo.study_type),
+            joinedload(StudyInfo.user).joinedload(User.passport_data),
+        )
+        .where(StudyInfo.id == 1),
+    }
+
+
+def _prebuilt_statements() -> dict:
+    from src.service.contract.builder import CONTRACT_BY_USER_AND_TYPE
+    from src.service.study_info import STUDY_INFO_BY_ID
+    from src.utils.auth import USER_BY_PHONE
+
+    return {
+        "get_user": USER_BY_PHONE,
+        "_get_contract": CONTRACT_BY_USER_AND_TYPE,
+        "_get_with_join": STUDY_INFO_BY_ID,
+    }
+
+
+def _lookup(stmt, cache: LRUCache, dialect) -> None:
+    key = stmt._generate_cache_key()
+    if key not in cache:
+        cache[key] = stmt.compile(dialect=dialect)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    configure_models()
+    dialect = postgresql.dialect()
+    prebuilt = _prebuilt_statements()
+
+    print(f"{'query':<16}{'rebuilt µs':>12}{'prebuilt µs':>13}{'speedup':>9}")
+    for name, build in _fresh_statements().items():
+        cache = LRUCache(500)
+        rebuilt = timeit.timeit(lambda: _lookup(build(), cache, dialect), number=args.iterations)
+        reused = timeit.timeit(lambda: _lookup(prebuilt[name], cache, dialect), number=args.iterations)
+        per_call = lambda total: total / args.iterations * 1e6
+        print(
+            f"{name:<16}{per_call(rebuilt):>12.1f}{per_call(reused):>13.1f}"
+            f"{rebuilt / reused:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
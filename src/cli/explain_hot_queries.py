@@ -0,0 +1,84 @@
+"""Print PostgreSQL plans for the hot admin and login queries.
+
+Run it before and after ``alembic upgrade head`` and diff the output:
+
+    python -m src.cli.explain_hot_queries --analyze > before.txt
+    alembic upgrade head
+    python -m src.cli.explain_hot_queries --analyze > after.txt
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from sharq_models.models import (  # type: ignore
+    AMOCrmLead,
+    Contract,
+    PassportData,
+    StudyInfo,
+    User,
+)
+from src.core.db import AsyncSessionLocal
+from src.core.model_config import configure_models
+from src.service.filters import predicate
+
+
+def hot_queries(args) -> dict:
+    since = datetime.now() - timedelta(days=args.days)
+    return {
+        "login: user by phone_number": select(User).where(User.phone_number == args.phone),
+        "profile: study_info by user_id": select(StudyInfo).where(StudyInfo.user_id == args.user_id),
+        "contract: by (user_id, contract_type)": select(Contract).where(
+            Contract.user_id == args.user_id, Contract.contract_type == "two_side"
+        ),
+        "contracts: latest page": select(Contract).order_by(Contract.created_at.desc()).limit(100),
+        "contract: AmoCRM lead by user_id": select(AMOCrmLead).where(AMOCrmLead.user_id == args.user_id),
+        "passport: by jshshir": select(PassportData).where(PassportData.jshshir == args.jshshir),
+        "passport: by series number": select(PassportData).where(
+            PassportData.passport_series_number == args.series
+        ),
+        "applications: page": select(StudyInfo).order_by(StudyInfo.id.desc()).limit(100),
+        "applications: created range count": select(func.count(StudyInfo.id)).where(
+            StudyInfo.create_at >= since
+        ),
+        "applications: name prefix search": select(StudyInfo)
+        .join(StudyInfo.user)
+        .join(User.passport_data)
+        .where(predicate(PassportData.last_name, "prefix", args.name))
+        .order_by(StudyInfo.id.desc())
+        .limit(100),
+    }
+
+
+async def run(args) -> None:
+    configure_models()
+    options = "ANALYZE, BUFFERS" if args.analyze else "COSTS"
+    async with AsyncSessionLocal() as session:
+        for title, stmt in hot_queries(args).items():
+            sql = stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            rows = await session.execute(text(f"EXPLAIN ({options}) {sql}"))
+            print(f"== {title}")
+            print("\n".join(row[0] for row in rows))
+            print()
+        # EXPLAIN ANALYZE executes the statements; never keep their effects.
+        await session.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--analyze", action="store_true", help="run EXPLAIN ANALYZE")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--phone", default="+998900000000")
+    parser.add_argument("--jshshir", default="00000000000000")
+    parser.add_argument("--series", default="AA0000000")
+    parser.add_argument("--name", default="a", help="last name prefix")
+    parser.add_argument("--days", type=int, default=7, help="created range width")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Generate thumbnails and previews for images already in storage.
+
+Only images whose variants are missing are processed unless --force is given.
+Works against whichever backend STORAGE_BACKEND selects.
+
+Usage: python -m src.cli.generate_thumbnails [--prefix contracts/] [--workers 4] [--force]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from src.core import images
+from src.core.config import settings
+from src.core.storage import close_storage, get_storage
+
+
+async def run(prefix: str, workers: int, force: bool) -> None:
+    settings.image_workers = workers
+    semaphore = asyncio.Semaphore(workers * 2)
+    created = failed = seen = 0
+
+    async def process(key: str) -> None:
+        nonlocal created, failed
+        async with semaphore:
+            try:
+                created += len(await images.process_image(key, force=force))
+            except Exception as e:
+                failed += 1
+                print(f"failed: {key}: {e}")
+
+    started = time.perf_counter()
+    tasks = []
+    async for key in get_storage().iter_keys(prefix):
+        if images.is_image(key) and images.original_path(key) is None:
+            seen += 1
+            tasks.append(asyncio.create_task(process(key)))
+    await asyncio.gather(*tasks)
+    await asyncio.to_thread(images.shutdown_pool)
+    await close_storage()
+
+    elapsed = time.perf_counter() - started
+    print(f"{seen} image(s): created {created} variant(s), {failed} failure(s) in {elapsed:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefix", default="", help="only keys starting with this")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="regenerate existing variants")
+    args = parser.parse_args()
+    asyncio.run(run(args.prefix, args.workers, args.force))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Insert or update StudyInfo rows from a CSV or XLSX file.
+
+Usage: python -m src.cli.import_study_info applications.xlsx
+"""
+import argparse
+import asyncio
+
+from src.core.db import AsyncSessionLocal
+from src.core.model_config import configure_models
+from src.service.study_info_import import StudyInfoImporter
+
+
+async def run(path: str) -> None:
+    configure_models()
+    async with AsyncSessionLocal() as session:
+        with open(path, "rb") as stream:
+            report = await StudyInfoImporter(session).import_file(stream, path)
+    print(report.model_dump_json(indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="CSV or XLSX file with a header row")
+    args = parser.parse_args()
+    asyncio.run(run(args.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Break down the import time of the app by module.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+aggregates the cumulative times per top-level package and per module.
+
+Usage: python -m src.cli.startup_report [--top 25] [--module main]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def collect(module: str) -> list[tuple[str, int, int]]:
+    """``(module, self_us, cumulative_us)`` for every imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(result.returncode)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main", help="module to import")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    rows = collect(args.module)
+    total_us = sum(self_us for _, self_us, _ in rows)
+
+    by_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"Importing {args.module}: {total_us / 1000:.0f} ms, {len(rows)} modules\n")
+    print(f"{'package':<40}{'ms':>10}{'share':>8}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{package:<40}{self_us / 1000:>10.1f}{self_us / total_us:>8.1%}")
+
+    print(f"\n{'module (cumulative)':<60}{'ms':>10}")
+    for name, _, cumulative_us in sorted(rows, key=lambda row: -row[2])[: args.top]:
+        print(f"{name:<60}{cumulative_us / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
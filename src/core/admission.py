@@ -0,0 +1,266 @@
+"""Admission control: per-client token buckets and per-route-class concurrency caps.
+
+Every request is classified into a route class. Its client (the ``sub`` of a
+valid access token, or the IP address otherwise) must take a token from the class's bucket,
+otherwise the answer is 429. Heavy classes also have a concurrency cap shared
+by all clients, and a request over that cap gets 503. Both answers carry
+Retry-After.
+
+State lives in an ``AdmissionStore``. ``MemoryStore`` limits each worker
+process on its own. ``RedisStore`` makes the limits hold across workers and
+hosts.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+import jwt
+from jwt.exceptions import InvalidTokenError
+
+from starlette.datastructures import QueryParams
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RouteClass:
+    name: str
+    rate_per_minute: int
+    burst: int
+    # Requests of this class running at once across all clients; 0 = unlimited.
+    concurrency: int = 0
+
+
+DEFAULT = RouteClass("default", settings.admission_default_rate_per_minute, settings.admission_default_burst)
+CONTRACT = RouteClass("contract", settings.admission_contract_rate_per_minute, 3, settings.admission_contract_concurrency)
+EXPORT = RouteClass("export", settings.admission_export_rate_per_minute, 1, settings.admission_export_concurrency)
+SEARCH = RouteClass("search", settings.admission_search_rate_per_minute, 10, settings.admission_search_concurrency)
+BULK = RouteClass("bulk", settings.admission_bulk_rate_per_minute, 2, settings.admission_bulk_concurrency)
+
+_BULK_DICTIONARIES = (
+    "study_language", "education_type", "study_type", "study_form", "study_direction", "role",
+)
+_BULK_PATHS = frozenset({
+    "/api/study_info/import",
+    "/api/passport_data/bulk_upsert",
+    *(
+        f"/api/{dictionary}/{action}"
+        for dictionary in _BULK_DICTIONARIES
+        for action in ("bulk_create", "bulk_update", "bulk_delete")
+    ),
+})
+
+
+def classify(method: str, path: str, query_string: bytes) -> RouteClass:
+    if method == "POST" and path == "/api/contract":
+        return CONTRACT
+    if path == "/api/study_info/study-info/excel":
+        return EXPORT
+    if method in ("POST", "PUT") and path in _BULK_PATHS:
+        return BULK
+    if path == "/api/study_info/applications" and QueryParams(query_string).get("search"):
+        return SEARCH
+    return DEFAULT
+
+
+def client_key(authorization: Optional[bytes], host: Optional[str]) -> str:
+    """Bucket key: the verified token subject, else the client IP.
+
+    Behind the reverse proxy ``host`` is the X-Forwarded-For address, set by
+    uvicorn for peers in SERVER_FORWARDED_ALLOW_IPS (see server_options).
+
+    Unverified header bytes are never used, so rotating garbage tokens
+    does not buy a fresh bucket.
+    """
+    if authorization:
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                payload = jwt.decode(
+                    token, settings.access_secret_key, algorithms=[settings.algorithm]
+                )
+            except InvalidTokenError:
+                payload = {}
+            subject = payload.get("sub")
+            if subject:
+                return f"u:{subject}"
+    return f"ip:{host or 'unknown'}"
+
+
+class AdmissionStore(Protocol):
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        """Take one token; return 0 on success, else seconds until one is available."""
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        """Take a concurrency slot if fewer than ``limit`` are held."""
+
+    async def release(self, key: str) -> None:
+        ...
+
+
+class MemoryStore:
+    """Per-process state; limits multiply by the number of workers."""
+
+    MAX_BUCKETS = 50_000
+
+    def __init__(self):
+        # LRU order: when full, the least recently seen client is forgotten
+        # (at worst it regains its burst a little early).
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._slots: dict[str, int] = {}
+
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate_per_second)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate_per_second
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.MAX_BUCKETS:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        held = self._slots.get(key, 0)
+        if held >= limit:
+            return False
+        self._slots[key] = held + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        self._slots[key] = max(0, self._slots.get(key, 0) - 1)
+
+
+# KEYS[1] bucket; ARGV: rate per second, burst, now (seconds). Returns wait in ms.
+_TAKE_SCRIPT = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = math.ceil((1 - tokens) / rate * 1000) end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return wait
+"""
+
+
+class RedisStore:
+    """Shared state in Redis so limits hold across worker processes."""
+
+    # A worker killed mid-request never releases its slot; let it expire.
+    SLOT_TTL_SECONDS = 600
+
+    def __init__(self, url: str, prefix: str = "sharq:admission:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "ADMISSION_REDIS_URL is set but the redis package is not installed"
+            ) from e
+
+        self._redis = redis.from_url(url)
+        self._take = self._redis.register_script(_TAKE_SCRIPT)
+        self._prefix = prefix
+
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        wait_ms = await self._take(
+            keys=[self._prefix + "bucket:" + key], args=[rate_per_second, burst, time.time()]
+        )
+        return int(wait_ms) / 1000
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        slot = self._prefix + "slots:" + key
+        async with self._redis.pipeline(transaction=True) as pipe:
+            held, _ = await pipe.incr(slot).expire(slot, self.SLOT_TTL_SECONDS).execute()
+        if held > limit:
+            await self._redis.decr(slot)
+            return False
+        return True
+
+    async def release(self, key: str) -> None:
+        await self._redis.decr(self._prefix + "slots:" + key)
+
+
+def create_store() -> AdmissionStore:
+    if settings.admission_redis_url:
+        return RedisStore(settings.admission_redis_url)
+    return MemoryStore()
+
+
+def _reject(status_code: int, retry_after: float, detail: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def _exempt(path: str) -> bool:
+    return path == "/metrics" or path.startswith("/health")
+
+
+class AdmissionMiddleware:
+    def __init__(self, app: ASGIApp, store: Optional[AdmissionStore] = None):
+        self.app = app
+        self.store = store or create_store()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.admission_enabled or _exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify(scope["method"], scope["path"], scope["query_string"])
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+        client = client_key(authorization, scope["client"][0] if scope.get("client") else None)
+
+        try:
+            wait = await self.store.take(
+                f"{route_class.name}:{client}",
+                route_class.rate_per_minute / 60,
+                route_class.burst,
+            )
+            if wait > 0:
+                response = _reject(429, wait, "So'rovlar soni chegaradan oshdi")
+                await response(scope, receive, send)
+                return
+
+            if route_class.concurrency and not await self.store.acquire(
+                route_class.name, route_class.concurrency
+            ):
+                response = _reject(
+                    503, settings.admission_retry_after_seconds, "Server band, keyinroq urinib ko'ring"
+                )
+                await response(scope, receive, send)
+                return
+        except Exception as e:
+            # Never turn a limiter outage into an API outage.
+            logger.warning(f"Admission store unavailable, admitting request: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        if not route_class.concurrency:
+            await self.app(scope, receive, send)
+            return
+
+        # The app returns only after the whole body is sent, so streamed
+        # exports hold their slot for their full duration.
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await self.store.release(route_class.name)
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+from typing import Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+_jobs: set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine, name: Optional[str] = None) -> asyncio.Task:
+    """Run ``coro`` in the background and keep it until shutdown drains it."""
+    task = asyncio.create_task(coro, name=name)
+    _jobs.add(task)
+    task.add_done_callback(_finished)
+    return task
+
+
+def _finished(task: asyncio.Task) -> None:
+    _jobs.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background job {task.get_name()} failed", exc_info=task.exception())
+
+
+async def drain(timeout: float) -> None:
+    """Wait up to ``timeout`` seconds for running jobs, then cancel the rest."""
+    if not _jobs:
+        return
+    logger.info(f"Waiting for {len(_jobs)} background job(s)")
+    done, pending = await asyncio.wait(set(_jobs), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(f"Cancelled {len(pending)} background job(s) still running after {timeout}s")
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+from .db import AsyncSessionLocal, ReplicaSessionLocal
+from .replica import on_replica
+
+Read = Callable[[AsyncSession], Awaitable[Any]]
+
+
+# Process-wide, so DB_READ_FANOUT bounds the extra connections of all
+# concurrent requests together, not of each call.
+_fanout: dict[bool, asyncio.Semaphore] = {}
+
+
+def _semaphore(replica: bool) -> asyncio.Semaphore:
+    if replica not in _fanout:
+        _fanout[replica] = asyncio.Semaphore(settings.db_read_fanout)
+    return _fanout[replica]
+
+
+async def gather_reads(*reads: Read, session: AsyncSession | None = None) -> list:
+    """Run independent read-only callables concurrently.
+
+    An ``AsyncSession`` cannot run statements concurrently, so each read needs
+    its own connection. Pass the request's session as ``session`` and the
+    first read runs on it; the session stays open and owned by its
+    dependency. Every other read gets a separate pooled session, and at most
+    DB_READ_FANOUT of those are held across the process, so concurrent
+    requests cannot drain the pool between them.
+
+    Inside a ``replica_safe`` call the extra reads go to the replica too.
+    Results come back in argument order; ORM objects from the extra sessions
+    are detached, so everything the caller needs must be loaded eagerly.
+    """
+    replica = on_replica()
+    session_factory = ReplicaSessionLocal if replica else AsyncSessionLocal
+    semaphore = _semaphore(replica)
+
+    async def run(read: Read):
+        async with semaphore, session_factory() as extra:
+            return await read(extra)
+
+    if session is not None and reads:
+        first, *rest = reads
+        calls = [first(session), *(run(read) for read in rest)]
+    else:
+        calls = [run(read) for read in reads]
+    return list(await asyncio.gather(*calls))
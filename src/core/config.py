@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +10,12 @@ class Settings(BaseSettings):
     db_password: str
     db_name: str
 
+    # Optional streaming replica used for list, report and export reads.
+    db_replica_host: str | None = None
+    db_replica_port: int | None = None
+    db_replica_max_lag_seconds: float = 10.0
+    db_replica_lag_check_seconds: float = 5.0
+
     access_token_expire_minutes: int = 30
     access_secret_key: str
     algorithm: str = "HS256"
@@ -20,13 +28,139 @@ class Settings(BaseSettings):
     
     base_url: str
 
+    server_host: str = "0.0.0.0"
+    server_port: int = 8082
+    web_concurrency: int = 4
+    server_loop: str = "uvloop"
+    server_http: str = "httptools"
+    # Peers whose X-Forwarded-For/-Proto are trusted (comma-separated IPs or
+    # CIDRs, "*" for any). Only the reverse proxy belongs here: the client IP
+    # keys the admission rate limits.
+    server_forwarded_allow_ips: str = "127.0.0.1"
+    log_level: str = "INFO"
+
+    # Total connections this service may hold across all worker processes.
+    db_max_connections: int = 120
+    db_pool_overflow_ratio: float = 0.3
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 3600
+    db_statement_timeout_ms: int = 30000
+    db_prepared_statement_cache_size: int = 256
+    # Max pooled connections used for parallel reads by all requests of a process.
+    db_read_fanout: int = 4
+
+    slow_query_threshold_ms: float = 200.0
+    # How long dictionary (id, name) lists used by list filters are cached.
+    reference_cache_seconds: int = 60
+
+    stats_refresh_seconds: int = 300
+    # Offset used to compare an intake curve with the previous admission campaign.
+    stats_campaign_offset_days: int = 365
+
+    health_check_timeout_seconds: float = 2.0
+    health_cache_seconds: float = 5.0
+    health_max_pool_saturation: float = 0.9
+    health_min_free_disk_mb: int = 500
+    health_check_weasyprint: bool = False
+
+    # "local" keeps files under UPLOAD_DIR; "s3" uses an S3-compatible store
+    # (AWS, MinIO) so several app nodes can share the same files.
+    storage_backend: Literal["local", "s3"] = "local"
+    s3_bucket: str | None = None
+    s3_endpoint_url: str | None = None
+    s3_region: str = "us-east-1"
+    s3_access_key_id: str | None = None
+    s3_secret_access_key: str | None = None
+    s3_key_prefix: str = ""
+    s3_multipart_part_mb: int = 8
+    # Redirect downloads to a presigned URL instead of proxying the bytes.
+    storage_redirect_downloads: bool = True
+
+    upload_dir: str = "uploads"
+    # HMAC key for signed upload URLs; falls back to ACCESS_SECRET_KEY.
+    upload_signing_key: str | None = None
+    upload_url_ttl_seconds: int = 900
+    upload_cache_max_age_seconds: int = 31536000
+    # e.g. "/protected-uploads/": nginx serves the file from an internal location.
+    uploads_accel_redirect_prefix: str | None = None
+    # Processes generating thumbnails/previews of uploaded images.
+    image_workers: int = 2
+    image_thumbnail_size: int = 320
+    image_preview_size: int = 1600
+    image_quality: int = 80
+
+    warmup_enabled: bool = True
+    # Time given to background jobs to finish on shutdown before they are cancelled.
+    shutdown_drain_seconds: float = 30.0
+
+    admission_enabled: bool = True
+    # Shared limiter state for multi-worker setups; in-process when unset.
+    admission_redis_url: str | None = None
+    admission_retry_after_seconds: int = 5
+    admission_default_rate_per_minute: int = 300
+    admission_default_burst: int = 60
+    admission_contract_rate_per_minute: int = 10
+    admission_contract_concurrency: int = 4
+    admission_export_rate_per_minute: int = 2
+    admission_export_concurrency: int = 1
+    admission_search_rate_per_minute: int = 60
+    admission_search_concurrency: int = 8
+    # Bulk import / upsert endpoints.
+    admission_bulk_rate_per_minute: int = 6
+    admission_bulk_concurrency: int = 1
 
     model_config = SettingsConfigDict(env_file=".env")
 
+    @property
+    def upload_signing_secret(self) -> bytes:
+        return (self.upload_signing_key or self.access_secret_key).encode()
+
     @property
     def connection_string(self):
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
     
+    @property
+    def replica_connection_string(self) -> str | None:
+        if not self.db_replica_host:
+            return None
+        port = self.db_replica_port or self.db_port
+        return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_replica_host}:{port}/{self.db_name}"
+
+    @property
+    def db_engine_count(self) -> int:
+        """Pools per worker: the primary, plus the replica when one is configured."""
+        return 2 if self.replica_connection_string else 1
+
+    @property
+    def db_connections_per_engine(self) -> int:
+        per_worker = self.db_max_connections // max(self.web_concurrency, 1)
+        return max(per_worker // self.db_engine_count, 2)
+
+    @property
+    def db_connections_per_worker(self) -> int:
+        """Connections one worker may hold across the primary and replica pools."""
+        return self.db_connections_per_engine * self.db_engine_count
+
+    @property
+    def db_pool_size(self) -> int:
+        """pool_size of each engine; the budget is split evenly between them."""
+        budget = self.db_connections_per_engine
+        return max(budget - int(budget * self.db_pool_overflow_ratio), 1)
+
+    @property
+    def db_max_overflow(self) -> int:
+        return self.db_connections_per_engine - self.db_pool_size
+
+    @property
+    def db_connect_args(self) -> dict:
+        return {
+            "server_settings": {
+                "statement_timeout": str(self.db_statement_timeout_ms),
+                "application_name": "sharq_admin_backend",
+            },
+            "prepared_statement_cache_size": self.db_prepared_statement_cache_size,
+        }
+
     @property
     def amo_crm_config(self):
         return {
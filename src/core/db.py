@@ -2,21 +2,51 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import declarative_base
 from .config import settings
+from .instrumentation import instrument_engine
+from .metrics import instrument_pool
+
+POOL_SIZE = settings.db_pool_size
+MAX_OVERFLOW = settings.db_max_overflow
 
 engine = create_async_engine(
     settings.connection_string, 
     echo=False,
     pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    connect_args=settings.db_connect_args,
 )
+instrument_engine(engine.sync_engine)
+instrument_pool(engine.sync_engine, "primary")
 
 
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
 
+replica_engine = None
+ReplicaSessionLocal = None
+
+if settings.replica_connection_string:
+    replica_engine = create_async_engine(
+        settings.replica_connection_string,
+        echo=False,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        connect_args=settings.db_connect_args,
+    )
+    instrument_engine(replica_engine.sync_engine)
+    instrument_pool(replica_engine.sync_engine, "replica")
+
+    ReplicaSessionLocal = sessionmaker(
+        bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
 
 async def get_db():
     session = AsyncSessionLocal()
@@ -1,11 +1,67 @@
-from fastapi import Request, HTTPException, status
-from fastapi.responses import HTMLResponse
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+import base64
+import binascii
+import json
 import secrets
+
+from fastapi.security import HTTPBasicCredentials
+from starlette.types import ASGIApp, Receive, Scope, Send
+
 from .config import settings
-from starlette.middleware.base import BaseHTTPMiddleware
 
-security = HTTPBasic()
+DOCS_PATHS = frozenset({"/docs", "/redoc", "/openapi.json"})
+
+_LOGIN_PAGE = b"""<html>
+    <head>
+        <title>Authentication Required</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 40px; }
+            .container { max-width: 400px; margin: 0 auto; }
+            .form { background: #f5f5f5; padding: 20px; border-radius: 5px; }
+            input { width: 100%; padding: 8px; margin: 5px 0; border: 1px solid #ddd; border-radius: 3px; }
+            button { background: #007bff; color: white; padding: 10px 15px; border: none; border-radius: 3px; cursor: pointer; }
+            button:hover { background: #0056b3; }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h2>Authentication Required</h2>
+            <p>Please enter your credentials to access the documentation:</p>
+            <div class="form">
+                <form id="authForm">
+                    <label for="username">Username:</label><br>
+                    <input type="text" id="username" name="username" required><br>
+                    <label for="password">Password:</label><br>
+                    <input type="password" id="password" name="password" required><br><br>
+                    <button type="submit">Login</button>
+                </form>
+            </div>
+        </div>
+        <script>
+            document.getElementById('authForm').addEventListener('submit', function(e) {
+                e.preventDefault();
+                const username = document.getElementById('username').value;
+                const password = document.getElementById('password').value;
+                const credentials = btoa(username + ':' + password);
+
+                // Retry the request with credentials
+                fetch(window.location.href, {
+                    headers: {
+                        'Authorization': 'Basic ' + credentials
+                    }
+                }).then(response => {
+                    if (response.ok) {
+                        window.location.reload();
+                    } else {
+                        alert('Invalid credentials');
+                    }
+                });
+            });
+        </script>
+    </body>
+</html>
+"""
+_INVALID_CREDENTIALS = json.dumps({"detail": "Invalid credentials"}).encode()
+_CHALLENGE = (b"www-authenticate", b"Basic realm=Documentation")
 
 
 def verify_docs_credentials(credentials: HTTPBasicCredentials) -> bool:
@@ -19,89 +75,54 @@ def verify_docs_credentials(credentials: HTTPBasicCredentials) -> bool:
     return is_username_correct and is_password_correct
 
 
-class DocsAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to protect documentation endpoints"""
-    
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        if path in ["/docs", "/redoc", "/openapi.json"]:
-            auth_header = request.headers.get("authorization")
-            
-            if not auth_header or not auth_header.startswith("Basic "):
-                return HTMLResponse(
-                    content="""
-                    <html>
-                        <head>
-                            <title>Authentication Required</title>
-                            <style>
-                                body { font-family: Arial, sans-serif; margin: 40px; }
-                                .container { max-width: 400px; margin: 0 auto; }
-                                .form { background: #f5f5f5; padding: 20px; border-radius: 5px; }
-                                input { width: 100%; padding: 8px; margin: 5px 0; border: 1px solid #ddd; border-radius: 3px; }
-                                button { background: #007bff; color: white; padding: 10px 15px; border: none; border-radius: 3px; cursor: pointer; }
-                                button:hover { background: #0056b3; }
-                            </style>
-                        </head>
-                        <body>
-                            <div class="container">
-                                <h2>Authentication Required</h2>
-                                <p>Please enter your credentials to access the documentation:</p>
-                                <div class="form">
-                                    <form id="authForm">
-                                        <label for="username">Username:</label><br>
-                                        <input type="text" id="username" name="username" required><br>
-                                        <label for="password">Password:</label><br>
-                                        <input type="password" id="password" name="password" required><br><br>
-                                        <button type="submit">Login</button>
-                                    </form>
-                                </div>
-                            </div>
-                            <script>
-                                document.getElementById('authForm').addEventListener('submit', function(e) {
-                                    e.preventDefault();
-                                    const username = document.getElementById('username').value;
-                                    const password = document.getElementById('password').value;
-                                    const credentials = btoa(username + ':' + password);
-                                    
-                                    // Retry the request with credentials
-                                    fetch(window.location.href, {
-                                        headers: {
-                                            'Authorization': 'Basic ' + credentials
-                                        }
-                                    }).then(response => {
-                                        if (response.ok) {
-                                            window.location.reload();
-                                        } else {
-                                            alert('Invalid credentials');
-                                        }
-                                    });
-                                });
-                            </script>
-                        </body>
-                    </html>
-                    """,
-                    status_code=401,
-                    headers={"WWW-Authenticate": "Basic realm=Documentation"}
-                )
-            
-            try:
-                import base64
-                credentials_str = auth_header.split(" ")[1]
-                decoded_credentials = base64.b64decode(credentials_str).decode("utf-8")
-                username, password = decoded_credentials.split(":", 1)
-                
-                if not verify_docs_credentials(HTTPBasicCredentials(username=username, password=password)):
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid credentials",
-                        headers={"WWW-Authenticate": "Basic realm=Documentation"}
-                    )
-            except Exception:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid credentials",
-                    headers={"WWW-Authenticate": "Basic realm=Documentation"}
-                )
-        
-        response = await call_next(request)
-        return response 
\ No newline at end of file
+def _parse_basic(header: bytes) -> HTTPBasicCredentials | None:
+    try:
+        decoded = base64.b64decode(header[6:], validate=True).decode("utf-8")
+        username, password = decoded.split(":", 1)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return HTTPBasicCredentials(username=username, password=password)
+
+
+async def _send_401(send: Send, body: bytes, content_type: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+                _CHALLENGE,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class DocsAuthMiddleware:
+    """Basic-auth guard for the documentation endpoints.
+
+    Pure ASGI: any other path is handed straight to the app.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in DOCS_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        authorization = next(
+            (value for name, value in scope["headers"] if name == b"authorization"), None
+        )
+        if not authorization or not authorization.startswith(b"Basic "):
+            await _send_401(send, _LOGIN_PAGE, b"text/html; charset=utf-8")
+            return
+
+        credentials = _parse_basic(authorization)
+        if credentials is None or not verify_docs_credentials(credentials):
+            await _send_401(send, _INVALID_CREDENTIALS, b"application/json")
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,125 @@
+import asyncio
+import shutil
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+
+from .config import settings
+from .db import engine, POOL_SIZE, MAX_OVERFLOW
+from .storage import get_storage
+
+UPLOAD_DIR = settings.upload_dir
+
+_cached_report: dict | None = None
+_cached_at: float = 0.0
+_lock = asyncio.Lock()
+_weasyprint_ready = False
+_warmup_report: dict | None = None
+
+
+async def check_database() -> dict:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {"ok": True}
+
+
+async def check_pool() -> dict:
+    pool = engine.sync_engine.pool
+    checked_out = pool.checkedout()
+    saturation = checked_out / (POOL_SIZE + MAX_OVERFLOW)
+    return {
+        "ok": saturation < settings.health_max_pool_saturation,
+        "checked_out": checked_out,
+        "saturation": round(saturation, 2),
+    }
+
+
+def _check_uploads_sync() -> dict:
+    free_mb = shutil.disk_usage(UPLOAD_DIR).free // (1024 * 1024)
+    # A real write catches read-only mounts that os.access() reports as writable.
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR):
+        pass
+    return {"ok": free_mb >= settings.health_min_free_disk_mb, "free_mb": free_mb}
+
+
+async def check_uploads() -> dict:
+    if settings.storage_backend != "local":
+        # A HEAD on a missing key proves the store is reachable and the credentials work.
+        await get_storage().exists("health/probe")
+        return {"ok": True, "backend": settings.storage_backend}
+    return await asyncio.to_thread(_check_uploads_sync)
+
+
+def _render_weasyprint_sync() -> None:
+    from weasyprint import HTML
+
+    HTML(string="<p>warm-up</p>").write_pdf()
+
+
+async def check_weasyprint() -> dict:
+    global _weasyprint_ready
+    if not _weasyprint_ready:
+        await asyncio.to_thread(_render_weasyprint_sync)
+        _weasyprint_ready = True
+    return {"ok": True}
+
+
+def mark_warm(report: dict) -> None:
+    """Called by the lifespan warm-up; readiness fails until then."""
+    global _warmup_report
+    _warmup_report = report
+
+
+async def check_warmup() -> dict:
+    if _warmup_report is None:
+        return {"ok": False, "error": "warming up"}
+    return {"ok": True, "steps": _warmup_report}
+
+
+async def _run_check(check: Callable[[], Awaitable[dict]]) -> dict:
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            check(), timeout=settings.health_check_timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        result = {"ok": False, "error": "timeout"}
+    except Exception as e:
+        result = {"ok": False, "error": str(e) or e.__class__.__name__}
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+async def _build_report() -> dict:
+    checks = {
+        "warmup": check_warmup,
+        "database": check_database,
+        "pool": check_pool,
+        "uploads": check_uploads,
+    }
+    if settings.health_check_weasyprint:
+        checks["weasyprint"] = check_weasyprint
+
+    results = await asyncio.gather(*(_run_check(check) for check in checks.values()))
+    report = dict(zip(checks.keys(), results))
+    return {
+        "status": "ok" if all(r["ok"] for r in results) else "unavailable",
+        "checks": report,
+    }
+
+
+async def readiness_report() -> dict:
+    """Run the readiness checks, reusing the last result for a few seconds."""
+    global _cached_report, _cached_at
+
+    if _cached_report and time.monotonic() - _cached_at < settings.health_cache_seconds:
+        return _cached_report
+
+    async with _lock:
+        if _cached_report and time.monotonic() - _cached_at < settings.health_cache_seconds:
+            return _cached_report
+        _cached_report = await _build_report()
+        _cached_at = time.monotonic()
+        return _cached_report
@@ -0,0 +1,161 @@
+"""Thumbnails and previews for uploaded images.
+
+Variants are stored next to the original and are named after it, e.g.
+``uploads/<uuid>.jpg`` -> ``uploads/<uuid>.jpg.thumb.webp``, so their paths
+can be derived without touching storage or the database. Pillow is only
+imported inside the worker processes.
+"""
+import asyncio
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from . import background
+from .config import settings
+from .storage import get_storage, key_for
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"})
+
+# variant -> (file suffix, Pillow format)
+VARIANTS = {
+    "thumb": (".thumb.webp", "WEBP"),
+    "preview": (".preview.jpg", "JPEG"),
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+# Originals being processed, and ones that could not be decoded; neither is
+# scheduled again by schedule_variants.
+_scheduled: set[str] = set()
+_failed: set[str] = set()
+_MAX_FAILED = 10_000
+
+
+def is_image(path: Optional[str]) -> bool:
+    """True for stored uploads with an image extension (not remote URLs)."""
+    if not path or "://" in path:
+        return False
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+def variant_path(path: Optional[str], variant: str) -> Optional[str]:
+    """Path of ``variant`` for an uploaded image, or None for other files."""
+    if not is_image(path):
+        return None
+    return path + VARIANTS[variant][0]
+
+
+def original_path(path: str) -> Optional[str]:
+    """Inverse of :func:`variant_path`; None when ``path`` is not a variant."""
+    for suffix, _ in VARIANTS.values():
+        if path.endswith(suffix):
+            return path[: -len(suffix)]
+    return None
+
+
+def _variant_size(variant: str) -> int:
+    return settings.image_thumbnail_size if variant == "thumb" else settings.image_preview_size
+
+
+def render_variants(data: bytes, variants: tuple[str, ...]) -> dict[str, bytes]:
+    """Encoded ``variants`` of the image in ``data``.
+
+    Runs in a worker process. Orientation from EXIF is applied to the pixels
+    and the metadata itself (EXIF, GPS, ICC) is not copied into the variants.
+    """
+    from PIL import Image, ImageOps
+
+    rendered = {}
+    with Image.open(io.BytesIO(data)) as source:
+        largest = max(_variant_size(variant) for variant in variants)
+        # Let the JPEG decoder downscale while reading instead of decoding full size.
+        source.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        if image.mode in ("RGBA", "LA", "PA", "P") or "transparency" in image.info:
+            # JPEG and the thumbnails have no alpha: flatten onto white, not black.
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        elif image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        for variant in variants:
+            size = _variant_size(variant)
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(
+                buffer,
+                format=VARIANTS[variant][1],
+                quality=settings.image_quality,
+                optimize=True,
+            )
+            rendered[variant] = buffer.getvalue()
+    return rendered
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.image_workers)
+    return _pool
+
+
+async def process_image(path: str, force: bool = False) -> list[str]:
+    """Generate the missing variants of an uploaded image and store them.
+
+    Decoding and encoding run in the worker pool; returns the paths written.
+    """
+    if not is_image(path):
+        return []
+    storage = get_storage()
+    targets = {variant: variant_path(path, variant) for variant in VARIANTS}
+    if not force:
+        targets = {
+            variant: target
+            for variant, target in targets.items()
+            if not await storage.exists(key_for(target))
+        }
+    if not targets:
+        return []
+
+    data = await storage.read_bytes(key_for(path))
+    loop = asyncio.get_running_loop()
+    rendered = await loop.run_in_executor(_get_pool(), render_variants, data, tuple(targets))
+    for variant, body in rendered.items():
+        await storage.write(key_for(targets[variant]), body)
+    return list(targets.values())
+
+
+def schedule_variants(path: Optional[str]) -> None:
+    """Generate the variants of ``path`` in the background, once at a time.
+
+    Called for new uploads and when a variant is requested before it exists,
+    so images stored by other services get thumbnails on first view.
+    """
+    if not is_image(path) or path in _scheduled or path in _failed:
+        return
+    _scheduled.add(path)
+
+    async def run() -> None:
+        try:
+            await process_image(path)
+        except Exception as e:
+            if len(_failed) >= _MAX_FAILED:
+                _failed.clear()
+            _failed.add(path)
+            logger.warning(f"Could not generate variants of {path}: {e}")
+        finally:
+            _scheduled.discard(path)
+
+    background.spawn(run(), name=f"variants:{os.path.basename(path)}")
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,140 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .middleware import current_request_id
+
+logger = logging.getLogger("sharq.sql")
+
+
+@dataclass
+class QueryStats:
+    """Per-request SQL statistics collected from engine events."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    slowest_params: Any = None
+
+    def record(self, statement: str, parameters: Any, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+            self.slowest_params = parameters
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "sharq_query_stats", default=None
+)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound values with their type names so no personal data is logged."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [
+            redact_parameters(value)
+            if isinstance(value, (list, tuple, dict))
+            else type(value).__name__
+            for value in parameters
+        ]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._sharq_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - context._sharq_query_start) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, parameters, elapsed_ms)
+
+    if elapsed_ms >= settings.slow_query_threshold_ms:
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "slow_query",
+                    "duration_ms": round(elapsed_ms, 2),
+                    "statement": statement,
+                    "params": redact_parameters(parameters),
+                }
+            )
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach timing listeners to a (sync) engine; safe to call more than once."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Collect per-request SQL counts and expose them as Server-Timing and logs."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("server-timing", stats.server_timing())
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+
+        if stats.count:
+            logger.info(
+                json.dumps(
+                    {
+                        "event": "request_queries",
+                        "request_id": current_request_id(),
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        "query_count": stats.count,
+                        "db_ms": round(stats.total_ms, 2),
+                        "slowest_ms": round(stats.slowest_ms, 2),
+                        "slowest_statement": stats.slowest_statement,
+                        "slowest_params": redact_parameters(stats.slowest_params),
+                    }
+                )
+            )
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+from fastapi import FastAPI
+
+from . import background
+from .config import settings
+from .db import AsyncSessionLocal, POOL_SIZE, engine, replica_engine
+from .health import mark_warm
+from .images import shutdown_pool
+from .metrics import mark_worker_dead
+from .storage import close_storage
+from .openapi import openapi_document
+
+logger = logging.getLogger(__name__)
+
+
+async def _open_pool(target) -> None:
+    """Check out pool_size connections at once so they are all established."""
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(
+            *(stack.enter_async_context(target.connect()) for _ in range(POOL_SIZE))
+        )
+
+
+async def warm_pools() -> None:
+    await asyncio.gather(
+        *(_open_pool(target) for target in (engine, replica_engine) if target is not None)
+    )
+
+
+async def load_reference_caches() -> None:
+    from src.service.filters import REFERENCE_MODELS, load_reference
+
+    async with AsyncSessionLocal() as session:
+        for model in REFERENCE_MODELS:
+            await load_reference(session, model)
+
+
+def _render_contract_templates() -> None:
+    import jinja2
+    from weasyprint import HTML
+
+    from src.service.contract.base import ContractBase, templates
+
+    # Missing context renders as empty text instead of raising.
+    lenient = templates.env.overlay(undefined=jinja2.ChainableUndefined)
+    for config in ContractBase.CONTRACT_CONFIG.values():
+        templates.get_template(config["template"])
+        try:
+            html = lenient.get_template(config["template"]).render({"qr_code": ""})
+        except Exception as e:
+            logger.warning(f"Dummy render of {config['template']} failed: {e}")
+            html = "<p>warm-up</p>"
+        # First render loads fonts and parses CSS; later ones reuse that work.
+        HTML(string=html, base_url=".").write_pdf()
+
+
+async def render_contracts() -> None:
+    await asyncio.to_thread(_render_contract_templates)
+
+
+async def _step(name: str, coro) -> dict:
+    started = time.perf_counter()
+    try:
+        await coro
+        result = {"ok": True}
+    except Exception as e:
+        logger.error(f"Warm-up step {name} failed: {e}")
+        result = {"ok": False, "error": str(e) or e.__class__.__name__}
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+async def warm_up(app: FastAPI) -> dict:
+    """Pay first-request costs up front. Failed steps are reported, not fatal."""
+    steps = {
+        "pool": warm_pools(),
+        "reference_cache": load_reference_caches(),
+        "contract_render": render_contracts(),
+        "openapi": asyncio.to_thread(openapi_document, app),
+    }
+    results = await asyncio.gather(*(_step(name, coro) for name, coro in steps.items()))
+    report = dict(zip(steps.keys(), results))
+    mark_warm(report)
+    logger.info(f"Warm-up finished: {report}")
+    return report
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from src.service.stats import run_rollup_refresher
+
+    if settings.warmup_enabled:
+        # Serve liveness right away; readiness turns green when this finishes.
+        background.spawn(warm_up(app), name="warm-up")
+    else:
+        mark_warm({})
+    # Not a background.spawn job: it never finishes, so drain would always time out.
+    refresher = asyncio.create_task(run_rollup_refresher(), name="stats-rollup-refresh")
+    yield
+    refresher.cancel()
+    await asyncio.gather(refresher, return_exceptions=True)
+    await background.drain(settings.shutdown_drain_seconds)
+    await asyncio.to_thread(shutdown_pool)
+    await close_storage()
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    mark_worker_dead()
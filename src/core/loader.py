@@ -0,0 +1,114 @@
+"""Request-scoped batching of "row(s) by key" lookups.
+
+Loaders live in ``session.info`` of the request's ``AsyncSession`` (see
+``get_db``), so every service sharing that session shares the memo. Keys
+requested in the same event-loop tick, for example from ``asyncio.gather``,
+are coalesced into one ``WHERE <field> = ANY(:keys)`` query.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Any, Hashable, Sequence
+
+from sqlalchemy import any_, bindparam, event, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_LOADERS = "loaders"
+_LOCK = "loader_lock"
+
+_statements: dict[tuple, Any] = {}
+
+
+def _batch_statement(model, field: str):
+    key = (model, field)
+    if key not in _statements:
+        column = getattr(model, field)
+        # One array parameter keeps the SQL text stable for any batch size.
+        _statements[key] = select(model).where(
+            column == any_(bindparam("keys", type_=ARRAY(column.type)))
+        )
+    return _statements[key]
+
+
+class DataLoader:
+    def __init__(self, session: AsyncSession, model, field: str, many: bool):
+        self.session = session
+        self.model = model
+        self.field = field
+        self.many = many
+        self._memo: dict[Hashable, asyncio.Future] = {}
+        self._queue: list[Hashable] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable):
+        """Row with ``field == key`` (or list of rows when ``many``); None/[] if absent."""
+        future = self._memo.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._memo[key] = loop.create_future()
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                loop.call_soon(self._schedule_dispatch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[Hashable]) -> list:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value) -> None:
+        if key not in self._memo:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._memo[key] = future
+
+    def clear(self) -> None:
+        """Forget resolved keys; pending ones still complete."""
+        self._memo = {key: f for key, f in self._memo.items() if not f.done()}
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        futures = [self._memo[key] for key in keys]
+        try:
+            # An AsyncSession runs one statement at a time; loaders take turns.
+            async with self.session.info.setdefault(_LOCK, asyncio.Lock()):
+                result = await self.session.scalars(
+                    _batch_statement(self.model, self.field), {"keys": keys}
+                )
+                rows = result.all()
+        except Exception as e:
+            for key, future in zip(keys, futures):
+                self._memo.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        grouped = defaultdict(list)
+        for row in rows:
+            grouped[getattr(row, self.field)].append(row)
+        for key, future in zip(keys, futures):
+            if future.done():
+                continue
+            matches = grouped.get(key, [])
+            future.set_result(matches if self.many else (matches[0] if matches else None))
+
+
+def get_loader(session: AsyncSession, model, field: str = "id", many: bool = False) -> DataLoader:
+    loaders = session.info.setdefault(_LOADERS, {})
+    key = (model, field, many)
+    if key not in loaders:
+        loaders[key] = DataLoader(session, model, field, many)
+    return loaders[key]
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_loaders(session, *args) -> None:
+    # Writes in the same request must not be hidden by memoized reads.
+    for loader in session.info.get(_LOADERS, {}).values():
+        loader.clear()
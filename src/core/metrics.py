@@ -0,0 +1,157 @@
+import glob
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# With several uvicorn workers every process writes its samples to
+# PROMETHEUS_MULTIPROC_DIR and /metrics merges them on scrape.
+# The variable must be set before prometheus_client is imported (the Dockerfile
+# does this), and the directory cleared before the workers start.
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+MULTIPROCESS = bool(MULTIPROCESS_DIR)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the SQLAlchemy pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections opened above pool_size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_READ_ROUTING = Counter(
+    "db_read_routing_total",
+    "Replica-safe service calls by the engine that served them",
+    ["engine", "method"],
+)
+PDF_RENDER_DURATION = Histogram(
+    "contract_pdf_render_seconds",
+    "Time spent rendering a contract PDF",
+    ["template"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 16),
+)
+AMOCRM_REQUEST_DURATION = Histogram(
+    "amocrm_request_duration_seconds",
+    "AmoCRM API call latency",
+    ["method"],
+)
+AMOCRM_REQUEST_ERRORS = Counter(
+    "amocrm_request_errors_total",
+    "Failed AmoCRM API calls",
+    ["method"],
+)
+EXPORT_SIZE = Histogram(
+    "export_size_bytes",
+    "Size of generated export files",
+    ["kind"],
+    buckets=(1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7),
+)
+EXPORT_ROWS = Histogram(
+    "export_rows",
+    "Number of rows in generated export files",
+    ["kind"],
+    buckets=(10, 100, 500, 1000, 5000, 10000, 50000),
+)
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """Keep the pool gauges current from checkout/checkin events."""
+    pool = engine.pool
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    overflow = DB_POOL_OVERFLOW.labels(name)
+
+    def _update(*_):
+        checked_out.set(pool.checkedout())
+        overflow.set(max(pool.overflow(), 0))
+
+    event.listen(pool, "checkout", _update)
+    event.listen(pool, "checkin", _update)
+
+
+def reset_multiprocess_dir() -> None:
+    """Drop samples of a previous run; call in the parent before workers start."""
+    if not MULTIPROCESS:
+        return
+    os.makedirs(MULTIPROCESS_DIR, exist_ok=True)
+    for path in glob.glob(os.path.join(MULTIPROCESS_DIR, "*.db")):
+        os.remove(path)
+
+
+def mark_worker_dead() -> None:
+    """Stop counting this worker's live gauges once it exits."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def render_metrics() -> Response:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        payload = generate_latest(registry)
+    else:
+        payload = generate_latest()
+    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """Record latency per route template and the number of in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # The router stores the matched route on the shared scope.
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method,
+                route.path if route is not None else "unmatched",
+                str(status),
+            ).observe(time.perf_counter() - started)
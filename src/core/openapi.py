@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+
+_document: tuple[bytes, str] | None = None
+
+
+def openapi_document(app: FastAPI) -> tuple[bytes, str]:
+    """Serialized OpenAPI schema and its ETag, built once per process."""
+    global _document
+    if _document is None:
+        body = json.dumps(app.openapi(), ensure_ascii=False, separators=(",", ":")).encode()
+        _document = (body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+    return _document
+
+
+def install_cached_openapi(app: FastAPI) -> None:
+    """Serve ``app.openapi_url`` from prebuilt bytes instead of re-encoding the schema.
+
+    FastAPI caches the schema dict but still serializes it on every request;
+    here the JSON is encoded once and revalidated with ETag / If-None-Match.
+    """
+    url = app.openapi_url
+    app.router.routes = [
+        route for route in app.router.routes if getattr(route, "path", None) != url
+    ]
+
+    async def openapi(request: Request) -> Response:
+        body, etag = openapi_document(app)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    app.add_route(url, openapi, include_in_schema=False)
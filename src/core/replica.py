@@ -0,0 +1,120 @@
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+from .db import replica_engine, ReplicaSessionLocal
+from .metrics import DB_READ_ROUTING
+
+logger = logging.getLogger(__name__)
+
+_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+_on_replica: ContextVar[bool] = ContextVar("sharq_on_replica", default=False)
+# (primary session, replica session) of the replica_safe call in this context.
+_routed: ContextVar[Optional[tuple[AsyncSession, AsyncSession]]] = ContextVar(
+    "sharq_replica_session", default=None
+)
+_lag_checked_at: float = 0.0
+_replica_usable: bool = False
+
+
+def on_replica() -> bool:
+    """True inside a ``replica_safe`` call that was routed to the replica."""
+    return _on_replica.get()
+
+
+class RoutedSession:
+    """Descriptor for a service's session attribute.
+
+    Reads return the replica session while a ``replica_safe`` call that was
+    routed to the replica runs in the current context and the stored session
+    is the one it replaced; otherwise the stored session. The attribute itself
+    is never reassigned, so concurrent calls on a shared service do not see
+    each other's session.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        session = obj.__dict__[self.attr]
+        routed = _routed.get()
+        if routed is not None and routed[0] is session:
+            return routed[1]
+        return session
+
+    def __set__(self, obj, session: AsyncSession) -> None:
+        obj.__dict__[self.attr] = session
+
+
+async def replica_lag_seconds() -> float:
+    async with replica_engine.connect() as conn:
+        return float((await conn.execute(_LAG_QUERY)).scalar_one())
+
+
+async def replica_available() -> bool:
+    """True if a replica is configured and its lag is under the threshold.
+
+    The lag probe runs at most once per DB_REPLICA_LAG_CHECK_SECONDS per worker.
+    """
+    global _lag_checked_at, _replica_usable
+
+    if replica_engine is None:
+        return False
+
+    now = time.monotonic()
+    if now - _lag_checked_at < settings.db_replica_lag_check_seconds:
+        return _replica_usable
+
+    _lag_checked_at = now
+    try:
+        lag = await replica_lag_seconds()
+        _replica_usable = lag <= settings.db_replica_max_lag_seconds
+        if not _replica_usable:
+            logger.warning(f"Replica lag {lag:.1f}s exceeds threshold, reading from primary")
+    except Exception as e:
+        _replica_usable = False
+        logger.error(f"Replica lag check failed, reading from primary: {e}")
+    return _replica_usable
+
+
+def replica_safe(method):
+    """Run a read-only service method on the replica session when it is healthy.
+
+    For the duration of the call, in this context only, the service's
+    ``self.db`` (a :class:`RoutedSession`) resolves to a replica session;
+    nested replica-safe calls reuse it.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if _on_replica.get() or not await replica_available():
+            DB_READ_ROUTING.labels("primary", method.__qualname__).inc()
+            return await method(self, *args, **kwargs)
+
+        DB_READ_ROUTING.labels("replica", method.__qualname__).inc()
+        async with ReplicaSessionLocal() as session:
+            token = _on_replica.set(True)
+            routed = _routed.set((self.db, session))
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                _routed.reset(routed)
+                _on_replica.reset(token)
+
+    return wrapper
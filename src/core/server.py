@@ -0,0 +1,60 @@
+import importlib.util
+import logging
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_impl(requested: str, module: str) -> str:
+    """Fall back to uvicorn's pure-Python implementation if the extension is missing."""
+    if requested in ("auto", "asyncio", "h11"):
+        return requested
+    return requested if importlib.util.find_spec(module) else "auto"
+
+
+def server_options() -> dict:
+    return {
+        "host": settings.server_host,
+        "port": settings.server_port,
+        "workers": settings.web_concurrency,
+        "loop": _resolve_impl(settings.server_loop, "uvloop"),
+        "http": _resolve_impl(settings.server_http, "httptools"),
+        # Behind the proxy scope["client"] is the proxy itself; take the real
+        # client from X-Forwarded-For, but only when the proxy sent it.
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+        "reload": False,
+    }
+
+
+def concurrency_report() -> dict:
+    options = server_options()
+    workers = options["workers"]
+    per_worker = settings.db_connections_per_worker
+    return {
+        "workers": workers,
+        "loop": options["loop"],
+        "http": options["http"],
+        "db_engines": settings.db_engine_count,
+        "db_pool_size_per_engine": settings.db_pool_size,
+        "db_max_overflow_per_engine": settings.db_max_overflow,
+        "db_connections_per_worker": per_worker,
+        "db_connections_total": per_worker * workers,
+        "db_connection_budget": settings.db_max_connections,
+        "db_statement_timeout_ms": settings.db_statement_timeout_ms,
+        "db_prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+
+
+def log_concurrency_report() -> None:
+    report = concurrency_report()
+    logger.info(
+        "Concurrency budget: %(workers)s workers (%(loop)s/%(http)s), "
+        "%(db_engines)s DB pool(s) of %(db_pool_size_per_engine)s+%(db_max_overflow_per_engine)s, "
+        "%(db_connections_per_worker)s connections per worker, "
+        "%(db_connections_total)s of %(db_connection_budget)s total, "
+        "statement_timeout=%(db_statement_timeout_ms)sms, "
+        "prepared_statement_cache=%(db_prepared_statement_cache_size)s",
+        report,
+    )
@@ -0,0 +1,71 @@
+"""Pluggable storage for uploads and generated files.
+
+``LocalStorage`` keeps files under ``settings.upload_dir``. ``S3Storage``
+talks to any S3-compatible service (AWS, MinIO) through ``aiobotocore``;
+with it every app node sees the same files.
+"""
+from typing import Optional
+
+from ..config import settings
+from .base import (
+    CHUNK_SIZE,
+    PUBLIC_PREFIX,
+    InvalidKey,
+    ObjectInfo,
+    Storage,
+    check_key,
+    guess_content_type,
+    key_for,
+    new_upload_path,
+)
+from .local import LocalStorage
+
+__all__ = (
+    "CHUNK_SIZE",
+    "PUBLIC_PREFIX",
+    "InvalidKey",
+    "ObjectInfo",
+    "Storage",
+    "LocalStorage",
+    "check_key",
+    "guess_content_type",
+    "key_for",
+    "new_upload_path",
+    "create_storage",
+    "get_storage",
+    "close_storage",
+)
+
+_storage: Optional[Storage] = None
+
+
+def create_storage() -> Storage:
+    if settings.storage_backend == "s3":
+        from .s3 import S3Storage
+
+        if not settings.s3_bucket:
+            raise RuntimeError("S3_BUCKET is required when STORAGE_BACKEND=s3")
+        return S3Storage(
+            settings.s3_bucket,
+            endpoint_url=settings.s3_endpoint_url,
+            region=settings.s3_region,
+            access_key_id=settings.s3_access_key_id,
+            secret_access_key=settings.s3_secret_access_key,
+            key_prefix=settings.s3_key_prefix,
+            part_size=settings.s3_multipart_part_mb * 1024 * 1024,
+        )
+    return LocalStorage(settings.upload_dir)
+
+
+def get_storage() -> Storage:
+    global _storage
+    if _storage is None:
+        _storage = create_storage()
+    return _storage
+
+
+async def close_storage() -> None:
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
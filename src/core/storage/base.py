@@ -0,0 +1,97 @@
+import mimetypes
+import posixpath
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
+from uuid import uuid4
+
+# Paths stored in the database and used in URLs start with this segment;
+# storage keys are the rest of the path.
+PUBLIC_PREFIX = "uploads"
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class InvalidKey(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    key: str
+    size: int
+    modified: float
+    etag: str
+    content_type: str
+
+
+def check_key(key: str) -> str:
+    """Reject keys that could escape the storage root."""
+    if not key or "\x00" in key or "\\" in key or key.startswith("/"):
+        raise InvalidKey(key)
+    if any(part in ("", ".", "..") for part in key.split("/")):
+        raise InvalidKey(key)
+    return key
+
+
+def key_for(path: str) -> str:
+    """Storage key of a stored path like ``uploads/contracts/two_side/<uuid>.pdf``."""
+    return check_key(path.lstrip("/").removeprefix(f"{PUBLIC_PREFIX}/"))
+
+
+def new_upload_path(directory: str, extension: str) -> str:
+    """A fresh uuid-named path under ``directory``, in the form saved to the database."""
+    directory = f"{directory.strip('/')}/".removeprefix(f"{PUBLIC_PREFIX}/")
+    return posixpath.join(PUBLIC_PREFIX, directory, f"{uuid4().hex}{extension}")
+
+
+def guess_content_type(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+class Storage(ABC):
+    """Where uploads and generated files live.
+
+    Keys are ``/``-separated paths relative to the storage root. Writes accept
+    bytes or an async iterable of chunks, reads are streamed.
+    """
+
+    # True when clients can be redirected to the backend instead of proxied.
+    supports_redirects = False
+
+    @abstractmethod
+    async def write(
+        self, key: str, data: bytes | AsyncIterable[bytes], content_type: Optional[str] = None
+    ) -> None: ...
+
+    @abstractmethod
+    def read(self, key: str) -> AsyncIterator[bytes]: ...
+
+    @abstractmethod
+    async def stat(self, key: str) -> Optional[ObjectInfo]: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def iter_keys(self, prefix: str = "") -> AsyncIterator[str]: ...
+
+    async def read_bytes(self, key: str) -> bytes:
+        return b"".join([chunk async for chunk in self.read(key)])
+
+    async def exists(self, key: str) -> bool:
+        return await self.stat(key) is not None
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path of ``key`` when the backend is a local directory."""
+        return None
+
+    async def download_url(
+        self, key: str, ttl_seconds: int, filename: Optional[str] = None
+    ) -> Optional[str]:
+        """Time-limited URL served by the backend itself, if it has one."""
+        return None
+
+    async def close(self) -> None:
+        pass
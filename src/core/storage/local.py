@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import os
+import stat
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional
+from uuid import uuid4
+
+import anyio
+
+from .base import CHUNK_SIZE, InvalidKey, ObjectInfo, Storage, check_key, guess_content_type
+
+_PARTIAL_SUFFIX = ".part"
+
+
+class LocalStorage(Storage):
+    """Files in a directory on this host (or on a volume shared by all nodes)."""
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+
+    def local_path(self, key: str) -> Path:
+        path = (self.root / check_key(key)).resolve()
+        if not path.is_relative_to(self.root):
+            raise InvalidKey(key)
+        return path
+
+    async def write(
+        self, key: str, data: bytes | AsyncIterable[bytes], content_type: Optional[str] = None
+    ) -> None:
+        path = self.local_path(key)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        # Readers never see a half-written file: write aside, then rename.
+        partial = path.with_name(f"{path.name}.{uuid4().hex}{_PARTIAL_SUFFIX}")
+        try:
+            async with await anyio.open_file(partial, "wb") as f:
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    await f.write(data)
+                else:
+                    async for chunk in data:
+                        await f.write(chunk)
+            await asyncio.to_thread(os.replace, partial, path)
+        except BaseException:
+            await asyncio.to_thread(partial.unlink, missing_ok=True)
+            raise
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        async with await anyio.open_file(self.local_path(key), "rb") as f:
+            while chunk := await f.read(CHUNK_SIZE):
+                yield chunk
+
+    async def stat(self, key: str) -> Optional[ObjectInfo]:
+        path = self.local_path(key)
+        try:
+            result = await asyncio.to_thread(path.stat)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(result.st_mode):
+            return None
+        # Same validator as Starlette's FileResponse.
+        etag = hashlib.md5(f"{result.st_mtime}-{result.st_size}".encode(), usedforsecurity=False)
+        return ObjectInfo(
+            key=check_key(key),
+            size=result.st_size,
+            modified=result.st_mtime,
+            etag=f'"{etag.hexdigest()}"',
+            content_type=guess_content_type(path.name),
+        )
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.local_path(key).unlink, missing_ok=True)
+
+    def _walk(self, prefix: str) -> list[str]:
+        keys = []
+        for directory, _, files in os.walk(self.root / prefix):
+            for name in files:
+                if not name.endswith(_PARTIAL_SUFFIX):
+                    keys.append(Path(directory, name).relative_to(self.root).as_posix())
+        return keys
+
+    async def iter_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        for key in await asyncio.to_thread(self._walk, prefix):
+            yield key
@@ -0,0 +1,182 @@
+"""S3-compatible object storage (AWS S3, MinIO, ...).
+
+Needs the ``aiobotocore`` package.
+"""
+import asyncio
+from contextlib import AsyncExitStack
+from typing import AsyncIterable, AsyncIterator, Optional
+
+try:
+    from aiobotocore.session import get_session
+    from botocore.exceptions import ClientError
+except ImportError as e:
+    raise RuntimeError(
+        "STORAGE_BACKEND=s3 but the aiobotocore package is not installed"
+    ) from e
+
+from .base import CHUNK_SIZE, ObjectInfo, Storage, check_key, guess_content_type
+
+_MISSING = {"404", "NoSuchKey", "NotFound"}
+
+# S3 rejects parts smaller than this, except for the last one.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+async def _chunks(data: bytes | AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        yield bytes(data)
+    else:
+        async for chunk in data:
+            yield chunk
+
+
+class S3Storage(Storage):
+    supports_redirects = True
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        key_prefix: str = "",
+        part_size: int = 8 * 1024 * 1024,
+    ):
+        self.bucket = bucket
+        self.key_prefix = key_prefix.strip("/") + "/" if key_prefix.strip("/") else ""
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self._client_options = {
+            "endpoint_url": endpoint_url,
+            "region_name": region,
+            "aws_access_key_id": access_key_id,
+            "aws_secret_access_key": secret_access_key,
+        }
+        self._client = None
+        self._exit_stack = AsyncExitStack()
+        self._lock = asyncio.Lock()
+
+    async def _get_client(self):
+        # One client (and connection pool) per process, created on first use.
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    self._client = await self._exit_stack.enter_async_context(
+                        get_session().create_client("s3", **self._client_options)
+                    )
+        return self._client
+
+    def _object_key(self, key: str) -> str:
+        return self.key_prefix + check_key(key)
+
+    async def write(
+        self, key: str, data: bytes | AsyncIterable[bytes], content_type: Optional[str] = None
+    ) -> None:
+        client = await self._get_client()
+        object_key = self._object_key(key)
+        content_type = content_type or guess_content_type(object_key)
+
+        buffer = bytearray()
+        upload_id = None
+        parts = []
+        try:
+            async for chunk in _chunks(data):
+                buffer += chunk
+                while len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        created = await client.create_multipart_upload(
+                            Bucket=self.bucket, Key=object_key, ContentType=content_type
+                        )
+                        upload_id = created["UploadId"]
+                    part, buffer = bytes(buffer[: self.part_size]), buffer[self.part_size :]
+                    number = len(parts) + 1
+                    uploaded = await client.upload_part(
+                        Bucket=self.bucket,
+                        Key=object_key,
+                        UploadId=upload_id,
+                        PartNumber=number,
+                        Body=part,
+                    )
+                    parts.append({"PartNumber": number, "ETag": uploaded["ETag"]})
+
+            if upload_id is None:
+                # Small enough for a single request.
+                await client.put_object(
+                    Bucket=self.bucket, Key=object_key, Body=bytes(buffer), ContentType=content_type
+                )
+                return
+            if buffer:
+                number = len(parts) + 1
+                uploaded = await client.upload_part(
+                    Bucket=self.bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=bytes(buffer),
+                )
+                parts.append({"PartNumber": number, "ETag": uploaded["ETag"]})
+            await client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            if upload_id is not None:
+                await client.abort_multipart_upload(
+                    Bucket=self.bucket, Key=object_key, UploadId=upload_id
+                )
+            raise
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        client = await self._get_client()
+        response = await client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+        body = response["Body"]
+        try:
+            while chunk := await body.read(CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+
+    async def stat(self, key: str) -> Optional[ObjectInfo]:
+        client = await self._get_client()
+        try:
+            head = await client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _MISSING:
+                return None
+            raise
+        return ObjectInfo(
+            key=check_key(key),
+            size=head["ContentLength"],
+            modified=head["LastModified"].timestamp(),
+            etag=head["ETag"],
+            content_type=head.get("ContentType") or guess_content_type(key),
+        )
+
+    async def delete(self, key: str) -> None:
+        client = await self._get_client()
+        await client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+    async def iter_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self.bucket, Prefix=self.key_prefix + prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"][len(self.key_prefix) :]
+
+    async def download_url(
+        self, key: str, ttl_seconds: int, filename: Optional[str] = None
+    ) -> Optional[str]:
+        client = await self._get_client()
+        params = {"Bucket": self.bucket, "Key": self._object_key(key)}
+        if filename:
+            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+        return await client.generate_presigned_url(
+            "get_object", Params=params, ExpiresIn=ttl_seconds
+        )
+
+    async def close(self) -> None:
+        await self._exit_stack.aclose()
+        self._client = None
@@ -0,0 +1,166 @@
+"""Serving files from storage.
+
+Upload and contract names are uuid4 hex, so a given URL never changes
+content and can be cached for a long time. Everything is ``private``
+because the files hold passport data.
+"""
+import hashlib
+import hmac
+import re
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+from urllib.parse import quote, urlencode, urlparse
+
+from fastapi import HTTPException, status
+from starlette.requests import Request
+from starlette.responses import FileResponse, RedirectResponse, Response, StreamingResponse
+
+from .config import settings
+from .images import original_path, schedule_variants, variant_path
+from .storage import PUBLIC_PREFIX, InvalidKey, ObjectInfo, get_storage, key_for
+
+URL_PREFIX = f"/{PUBLIC_PREFIX}/"
+
+_IMMUTABLE_NAME = re.compile(r"^[0-9a-f]{32}(\.[A-Za-z0-9]+)*$")
+
+
+def upload_key(relative_path: str) -> str:
+    """Storage key for a URL or stored path; 404 for anything outside the root."""
+    try:
+        return key_for(relative_path)
+    except InvalidKey:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fayl topilmadi")
+
+
+async def find_upload(relative_path: str) -> ObjectInfo:
+    info = await get_storage().stat(upload_key(relative_path))
+    if info is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fayl topilmadi")
+    return info
+
+
+def _signature(key: str, expires: int) -> str:
+    message = f"{key}:{expires}".encode()
+    return hmac.new(settings.upload_signing_secret, message, hashlib.sha256).hexdigest()
+
+
+def signed_upload_url(relative_path: str, ttl_seconds: int | None = None) -> str:
+    """URL a browser can fetch without a bearer token (e.g. from an <img> tag)."""
+    key = upload_key(relative_path)
+    expires = int(time.time()) + (ttl_seconds or settings.upload_url_ttl_seconds)
+    query = urlencode({"expires": expires, "signature": _signature(key, expires)})
+    return f"{URL_PREFIX}{quote(key)}?{query}"
+
+
+def signed_file_url(path: Optional[str]) -> Optional[str]:
+    """Signed URL of a stored path or absolute file URL; None when there is none."""
+    if not path:
+        return None
+    try:
+        return signed_upload_url(urlparse(path).path)
+    except HTTPException:
+        return None
+
+
+def signed_variant_url(path: Optional[str], variant: str) -> Optional[str]:
+    """Signed URL of an image's thumbnail or preview; None when it has none."""
+    return signed_file_url(variant_path(path, variant))
+
+
+def verify_upload_signature(relative_path: str, expires: str, signature: str) -> bool:
+    try:
+        expires_at = int(expires)
+        key = key_for(relative_path)
+    except (ValueError, InvalidKey):
+        return False
+    if expires_at < time.time():
+        return False
+    return hmac.compare_digest(_signature(key, expires_at), signature)
+
+
+def cache_control(key: str) -> str:
+    if _IMMUTABLE_NAME.match(key.rsplit("/", 1)[-1]):
+        return f"private, max-age={settings.upload_cache_max_age_seconds}, immutable"
+    return "private, no-cache"
+
+
+def _not_modified(request: Request, info: ObjectInfo) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return info.etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(info.modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def upload_response(
+    request: Request,
+    relative_path: str,
+    filename: Optional[str] = None,
+    media_type: Optional[str] = None,
+    cache: Optional[str] = None,
+) -> Response:
+    """Response for a stored file.
+
+    Redirects to a presigned URL when the backend can serve the file itself.
+    Otherwise answers conditional requests, hands local files to nginx via
+    X-Accel-Redirect when configured, and falls back to a Range-capable
+    FileResponse or a streamed body.
+
+    ``cache`` overrides the Cache-Control derived from the file name; URLs
+    that are not content-addressed (e.g. per-user downloads) must pass
+    ``"private, no-cache"``.
+    """
+    storage = get_storage()
+    key = upload_key(relative_path)
+    override = cache
+    cache = override or cache_control(key)
+    info = await storage.stat(key)
+    if info is None:
+        # A thumbnail that is not generated yet: serve the original, but do not
+        # let it be cached under the variant's immutable URL, and make the
+        # variants for the next request.
+        original = original_path(key)
+        info = await storage.stat(original) if original else None
+        if info is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fayl topilmadi")
+        key, cache = original, "private, no-cache"
+        schedule_variants(original)
+
+    if storage.supports_redirects and settings.storage_redirect_downloads:
+        ttl = settings.upload_url_ttl_seconds
+        url = await storage.download_url(key, ttl, filename)
+        # The presigned URL stays valid for ttl; let the browser reuse it for part
+        # of that, unless the caller's URL must always be revalidated.
+        redirect_cache = override or f"private, max-age={ttl // 2}"
+        return RedirectResponse(url, headers={"Cache-Control": redirect_cache})
+
+    headers = {
+        "Cache-Control": cache,
+        "ETag": info.etag,
+        "Last-Modified": formatdate(info.modified, usegmt=True),
+    }
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if _not_modified(request, info):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type = media_type or info.content_type
+    path = storage.local_path(key)
+    if path is None:
+        headers["Content-Length"] = str(info.size)
+        return StreamingResponse(storage.read(key), media_type=media_type, headers=headers)
+
+    if settings.uploads_accel_redirect_prefix:
+        # The proxy streams the file and answers Range requests itself.
+        internal = settings.uploads_accel_redirect_prefix.rstrip("/") + "/"
+        headers["X-Accel-Redirect"] = internal + quote(key)
+        headers["Content-Type"] = media_type
+        return Response(headers=headers)
+
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -0,0 +1,4 @@
+__all__ = ("IntakeHourly",)
+
+
+from .stats import IntakeHourly
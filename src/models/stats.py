@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, Integer
+
+from src.core.db import Base
+
+
+class IntakeHourly(Base):
+    """Applications per hour, direction and form, maintained by this service."""
+
+    __tablename__ = "stats_intake_hourly"
+
+    bucket = Column(DateTime, primary_key=True)
+    study_direction_id = Column(Integer, primary_key=True, default=0)
+    study_form_id = Column(Integer, primary_key=True, default=0)
+    applications = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: list[int] = Field(min_length=1)
+
+
+class BulkDeleteResponse(BaseModel):
+    deleted: int
+    ids: list[int]
@@ -18,3 +18,7 @@ class EducationTypeFilter(BaseModel):
 
 class EducationTypeUpdate(BaseModel):
     name: Optional[str] = None
+
+
+class EducationTypeBulkUpdate(EducationTypeUpdate):
+    id: int
@@ -1,5 +1,7 @@
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from datetime import date
+from typing import Literal
+from src.core.uploads import signed_file_url, signed_variant_url
 
 
 
@@ -76,3 +78,36 @@ class PassportDataResponse(BaseModel):
     image_path: str
 
     model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def image_url(self) -> str | None:
+        return signed_file_url(self.image_path)
+
+    @computed_field
+    @property
+    def image_thumbnail_url(self) -> str | None:
+        return signed_variant_url(self.image_path, "thumb")
+
+    @computed_field
+    @property
+    def image_preview_url(self) -> str | None:
+        return signed_variant_url(self.image_path, "preview")
+
+
+class PassportUpsertOutcome(BaseModel):
+    index: int
+    jshshir: str | None = None
+    status: Literal["inserted", "updated", "duplicate", "invalid"]
+    id: int | None = None
+    errors: list[str] = []
+
+
+class PassportBulkUpsertReport(BaseModel):
+    total: int
+    inserted: int
+    updated: int
+    failed: int
+    elapsed_ms: float
+    records_per_second: float
+    results: list[PassportUpsertOutcome]
@@ -23,3 +23,7 @@ class RoleResponse(RoleBase):
 
 class UserRoleUpdate(BaseModel):
     role_id: int
+
+
+class RoleBulkUpdate(RoleUpdate):
+    id: int
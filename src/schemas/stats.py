@@ -0,0 +1,57 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from enum import Enum
+
+
+class IntakeGranularity(str, Enum):
+    hour = "hour"
+    day = "day"
+
+
+class IntakeGroupBy(str, Enum):
+    direction = "direction"
+    form = "form"
+
+
+class StatsDimension(str, Enum):
+    direction = "direction"
+    form = "form"
+    language = "language"
+    region = "region"
+    day = "day"
+
+
+class StatsSummaryResponse(BaseModel):
+    users_with_passport_data: int
+    users_with_study_info: int
+    users_with_contract: int
+
+
+class StatsBreakdownItem(BaseModel):
+    key: str | int | date | None
+    name: str | None = None
+    applications: int
+    approved: int
+
+
+class StatsBreakdownResponse(BaseModel):
+    dimension: StatsDimension
+    refreshed_at: datetime | None = None
+    items: list[StatsBreakdownItem]
+
+
+class IntakePoint(BaseModel):
+    bucket: datetime
+    study_direction_id: int | None = None
+    study_form_id: int | None = None
+    applications: int
+
+
+class IntakeSeriesResponse(BaseModel):
+    granularity: IntakeGranularity
+    group_by: list[IntakeGroupBy]
+    total: int
+    series: list[IntakePoint]
+    previous_total: int | None = None
+    # Previous campaign, with buckets shifted forward so both curves align.
+    previous_series: list[IntakePoint] | None = None
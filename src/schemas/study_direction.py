@@ -29,11 +29,7 @@ class StudyDirectionUpdate(BaseModel):
     education_years: int | None = None
     contract_sum: float  | None = None
     study_code: str  | None = None
-    
-
-
-
-
-
 
 
+class StudyDirectionBulkUpdate(StudyDirectionUpdate):
+    id: int
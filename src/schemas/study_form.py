@@ -18,3 +18,7 @@ class StudyFormFilter(BaseModel):
 
 class StudyFormUpdate(BaseModel):
     name: Optional[str] = None
+
+
+class StudyFormBulkUpdate(StudyFormUpdate):
+    id: int
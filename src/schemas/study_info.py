@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, computed_field
 from datetime import  datetime
 from .study_language import StudyLanguageResponse
 from .study_form import StudyFormResponse
@@ -6,6 +6,7 @@ from .study_direction import StudyDirectionResponse
 from .education_type import EducationTypeResponse
 from .study_type import StudyTypeResponse
 from .passport_data import PassportDataResponse
+from src.core.uploads import signed_file_url, signed_variant_url
 
 class StudyInfoBase(BaseModel):
     study_language_id: int
@@ -47,8 +48,70 @@ class StudyInfoResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+    @computed_field
+    @property
+    def certificate_url(self) -> str | None:
+        return signed_file_url(self.certificate_path)
+
+    @computed_field
+    @property
+    def dtm_sheet_url(self) -> str | None:
+        return signed_file_url(self.dtm_sheet)
+
+    @computed_field
+    @property
+    def contract_urls(self) -> list[str]:
+        return [url for url in map(signed_file_url, self.contract_paths) if url]
+
+    @computed_field
+    @property
+    def certificate_thumbnail_url(self) -> str | None:
+        return signed_variant_url(self.certificate_path, "thumb")
+
+    @computed_field
+    @property
+    def dtm_sheet_thumbnail_url(self) -> str | None:
+        return signed_variant_url(self.dtm_sheet, "thumb")
+
+    @computed_field
+    @property
+    def certificate_preview_url(self) -> str | None:
+        return signed_variant_url(self.certificate_path, "preview")
+
+    @computed_field
+    @property
+    def dtm_sheet_preview_url(self) -> str | None:
+        return signed_variant_url(self.dtm_sheet, "preview")
+
 
 class StudyInfoListResponse(BaseModel):
     data: list[StudyInfoResponse]
     total: int
 
+
+
+class StudyInfoImportRow(BaseModel):
+    """One row of a bulk import file; dictionaries are referenced by name."""
+
+    user_id: int
+    study_language: str
+    study_form: str
+    study_direction: str
+    study_type: str
+    education_type: str
+    graduate_year: str
+    certificate_path: str | None = None
+    dtm_sheet: str | None = None
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class StudyInfoImportReport(BaseModel):
+    total: int
+    inserted: int
+    updated: int
+    failed: int
+    errors: list[ImportRowError]
@@ -18,3 +18,7 @@ class StudyLanguageFilter(BaseModel):
 
 class StudyLanguageUpdate(BaseModel):
     name: Optional[str] = None
+
+
+class StudyLanguageBulkUpdate(StudyLanguageUpdate):
+    id: int
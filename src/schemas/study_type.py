@@ -18,3 +18,7 @@ class StudyTypeFilter(BaseModel):
 
 class StudyTypeUpdate(BaseModel):
     name: Optional[str] = None
+
+
+class StudyTypeBulkUpdate(StudyTypeUpdate):
+    id: int
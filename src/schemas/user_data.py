@@ -1,11 +1,13 @@
-from pydantic import BaseModel , ConfigDict
+from pydantic import BaseModel , ConfigDict, Field
+from datetime import datetime
 from src.schemas.passport_data import PassportDataResponse
 from src.schemas.study_info import StudyInfoResponse
 
 
 class UserDataResponse(BaseModel):
     passport_data: PassportDataResponse
-    study_info_data: StudyInfoResponse
+    study_info_data: StudyInfoResponse | None = None
+    lead_id: int | None = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -27,3 +29,9 @@ class UserDataFilterByStudyInfo(BaseModel):
     study_direction_name: str | None = None 
     education_type: str | None = None
     study_type: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+class UserProfilesRequest(BaseModel):
+    user_ids: list[int] = Field(min_length=1, max_length=200)
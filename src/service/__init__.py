@@ -1,24 +1,69 @@
+from collections import Counter
 from typing import Generic, TypeVar, Type, Any
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert, update, delete, bindparam, tuple_
 from src.core.db import Base
+from src.core.replica import RoutedSession
+from src.service.filters import REFERENCE_MODELS, invalidate_reference
 from sqlalchemy.exc import SQLAlchemyError
 from typing import Optional, Sequence
 
 ModelType = TypeVar("ModelType", bound=Base)  # type: ignore
 SchemaType = TypeVar("SchemaType", bound=BaseModel)
 
+BULK_CHUNK_SIZE = 500
+
+# Per-model getter statements, built once and reused with bound parameters so
+# SQLAlchemy's compiled cache and asyncpg's prepared statement cache both hit.
+_statements: dict[tuple, Any] = {}
+
+
+def _cached_statement(key: tuple, build):
+    stmt = _statements.get(key)
+    if stmt is None:
+        stmt = _statements[key] = build()
+    return stmt
+
+
+def _chunks(items: Sequence, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _update_values(obj_items: BaseModel) -> dict:
+    # Same placeholder rules as BasicCrud.update: Swagger's "string"/0 defaults are ignored.
+    return {
+        key: value
+        for key, value in obj_items.model_dump(exclude_unset=True).items()
+        if not (value is None or value == "" or value == "string" or value == 0)
+    }
+
+
+def _written(model) -> None:
+    # Dictionary names are cached for list filters; every write path ends here.
+    if model in REFERENCE_MODELS:
+        invalidate_reference(model)
+
 
 class BasicCrud(Generic[ModelType, SchemaType]):
+    # Resolves to the replica session inside a replica_safe call.
+    db = RoutedSession()
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create(self, model: Type[ModelType], obj_items: SchemaType):
+    async def create(self, model: Type[ModelType], obj_items: SchemaType, commit: bool = True):
+        """Insert one row. With ``commit=False`` it is only flushed, so the
+        caller can add more writes to the same transaction and commit once."""
         try:
             db_obj = model(**obj_items.model_dump())
             self.db.add(db_obj)
-            await self.db.commit()
+            if commit:
+                await self.db.commit()
+                _written(model)
+            else:
+                await self.db.flush()
             await self.db.refresh(db_obj)
             return db_obj
         except SQLAlchemyError as e:
@@ -27,8 +72,11 @@ class BasicCrud(Generic[ModelType, SchemaType]):
 
     async def get_by_id(self, model: Type[ModelType], item_id: int):
         try:
-            stmt = select(model).where(model.id == item_id)
-            result = await self.db.execute(stmt)
+            stmt = _cached_statement(
+                (model, "id"),
+                lambda: select(model).where(model.id == bindparam("item_id")),
+            )
+            result = await self.db.execute(stmt, {"item_id": item_id})
             return result.scalars().first()
         except SQLAlchemyError as e:
             await self.db.rollback()
@@ -62,13 +110,34 @@ class BasicCrud(Generic[ModelType, SchemaType]):
                 raise AttributeError(
                     f"Field '{field_name}' does not exist on {model.__name__}"
                 )
-            stmt = select(model).where(getattr(model, field_name) == field_value)
-            result = await self.db.execute(stmt)
+            stmt = _cached_statement(
+                (model, "field", field_name),
+                lambda: select(model).where(getattr(model, field_name) == bindparam("value")),
+            )
+            result = await self.db.execute(stmt, {"value": field_value})
             return result.scalars().first()
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise e
 
+    async def get_existing_values(
+        self, model: Type[ModelType], field_name: str, values: Sequence[Any]
+    ) -> set:
+        """Return which of ``values`` already exist in ``field_name``."""
+        try:
+            column = getattr(model, field_name)
+            stmt = _cached_statement(
+                (model, "existing", field_name),
+                lambda: select(column).where(
+                    column.in_(bindparam("values", expanding=True))
+                ),
+            )
+            result = await self.db.scalars(stmt, {"values": list(values)})
+            return set(result.all())
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+
     async def update(self, model: Type[ModelType], item_id: int, obj_items: SchemaType):
         try:
             db_obj = await self.get_by_id(model, item_id)
@@ -79,6 +148,7 @@ class BasicCrud(Generic[ModelType, SchemaType]):
                     continue
                 setattr(db_obj, key, value)
             await self.db.commit()
+            _written(model)
             return db_obj
         except SQLAlchemyError as e:
             await self.db.rollback()
@@ -91,7 +161,221 @@ class BasicCrud(Generic[ModelType, SchemaType]):
                 return None
             await self.db.delete(db_obj)
             await self.db.commit()
+            _written(model)
             return db_obj
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise e
+
+    async def update_returning(
+        self,
+        model: Type[ModelType],
+        item_id: int,
+        obj_items: SchemaType,
+        filters: Optional[Sequence] = None,
+    ):
+        """Single ``UPDATE ... RETURNING`` round-trip; None if no row matched.
+
+        Use instead of ``update`` when no relationship cascade needs the ORM.
+        """
+        values = _update_values(obj_items)
+        conditions = [model.id == item_id, *(filters or [])]
+        try:
+            if not values:
+                stmt = select(model).where(*conditions)
+            else:
+                stmt = (
+                    update(model)
+                    .where(*conditions)
+                    .values(**values)
+                    .returning(model)
+                    .execution_options(synchronize_session=False, populate_existing=True)
+                )
+            db_obj = (await self.db.scalars(stmt)).first()
+            await self.db.commit()
+            _written(model)
+            return db_obj
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+
+    async def delete_returning(
+        self,
+        model: Type[ModelType],
+        item_id: int,
+        filters: Optional[Sequence] = None,
+    ):
+        """Single ``DELETE ... RETURNING`` round-trip; None if no row matched."""
+        stmt = (
+            delete(model)
+            .where(model.id == item_id, *(filters or []))
+            .returning(model)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            db_obj = (await self.db.scalars(stmt)).first()
+            await self.db.commit()
+            _written(model)
+            return db_obj
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+
+    async def bulk_create(
+        self,
+        model: Type[ModelType],
+        items: Sequence[SchemaType],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """INSERT ... RETURNING in chunks, one transaction per chunk."""
+        created = []
+        try:
+            for chunk in _chunks(items, chunk_size):
+                result = await self.db.scalars(
+                    insert(model).returning(model),
+                    [item.model_dump() for item in chunk],
+                )
+                created.extend(result.all())
+                await self.db.commit()
+            return created
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+        finally:
+            _written(model)
+
+    async def bulk_update(
+        self,
+        model: Type[ModelType],
+        items: Sequence[SchemaType],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """Update rows by primary key; every item must carry an ``id``.
+
+        Each chunk is one SELECT plus the UPDATEs the flush batches with
+        executemany. Ids that do not exist are skipped.
+        """
+        updated = []
+        try:
+            for chunk in _chunks(items, chunk_size):
+                result = await self.db.scalars(
+                    select(model).where(model.id.in_([item.id for item in chunk]))
+                )
+                rows = {db_obj.id: db_obj for db_obj in result.all()}
+                for item in chunk:
+                    db_obj = rows.get(item.id)
+                    if db_obj is None:
+                        continue
+                    for key, value in _update_values(item).items():
+                        if key != "id":
+                            setattr(db_obj, key, value)
+                await self.db.commit()
+                updated.extend(rows.values())
+            return updated
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+        finally:
+            _written(model)
+
+    async def bulk_delete(
+        self,
+        model: Type[ModelType],
+        ids: Optional[Sequence[int]] = None,
+        filters: Optional[Sequence] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """DELETE ... RETURNING by ids (chunked) or by filters (one statement).
+
+        Relationship cascades do not run; use ``bulk_delete_cascading`` for
+        models that rely on them.
+        """
+        if ids is None and not filters:
+            raise ValueError("Either ids or filters must be provided")
+
+        if ids is not None:
+            statements = [
+                delete(model).where(model.id.in_(chunk)) for chunk in _chunks(list(ids), chunk_size)
+            ]
+        else:
+            statements = [delete(model).where(and_(*filters))]
+
+        deleted = []
+        try:
+            for stmt in statements:
+                result = await self.db.scalars(
+                    stmt.returning(model).execution_options(synchronize_session=False)
+                )
+                deleted.extend(result.all())
+                await self.db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+        finally:
+            _written(model)
+
+    async def bulk_delete_cascading(
+        self,
+        model: Type[ModelType],
+        ids: Sequence[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """Delete rows by id through ``session.delete`` so relationship cascades run.
+
+        Rows are loaded in chunks and everything commits in one transaction,
+        like the single-item ``delete``. Ids that do not exist are skipped.
+        """
+        deleted = []
+        try:
+            for chunk in _chunks(list(ids), chunk_size):
+                rows = (await self.db.scalars(select(model).where(model.id.in_(chunk)))).all()
+                for db_obj in rows:
+                    await self.db.delete(db_obj)
+                deleted.extend(rows)
+            await self.db.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+        finally:
+            _written(model)
+
+    async def get_update_conflicts(
+        self,
+        model: Type[ModelType],
+        items: Sequence[SchemaType],
+        field_names: Sequence[str] = ("name",),
+    ) -> set[tuple]:
+        """Unique keys that applying ``items`` with ``bulk_update`` would duplicate.
+
+        The key of a row is its ``field_names`` values after the update. A key
+        conflicts when two items end up with it or a row that keeps it is not
+        one of the items being changed. Ids that do not exist are skipped.
+        """
+        columns = [getattr(model, name) for name in field_names]
+        try:
+            result = await self.db.execute(
+                select(model.id, *columns).where(model.id.in_([item.id for item in items]))
+            )
+            current = {row[0]: tuple(row[1:]) for row in result.all()}
+
+            wanted = {}
+            for item in items:
+                values = _update_values(item)
+                if item.id in current and any(name in values for name in field_names):
+                    wanted[item.id] = tuple(
+                        values.get(name, old) for name, old in zip(field_names, current[item.id])
+                    )
+
+            keys = Counter(wanted.values())
+            conflicts = {key for key, count in keys.items() if count > 1}
+            if keys:
+                result = await self.db.execute(
+                    select(model.id, *columns).where(tuple_(*columns).in_(list(keys)))
+                )
+                conflicts.update(tuple(row[1:]) for row in result.all() if row[0] not in wanted)
+            return conflicts
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
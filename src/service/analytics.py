@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sharq_models.models import StudyInfo  # type: ignore
+from src.core.config import settings
+from src.models import IntakeHourly
+from src.schemas.stats import (
+    IntakeGranularity,
+    IntakeGroupBy,
+    IntakePoint,
+    IntakeSeriesResponse,
+)
+from src.service import BasicCrud
+
+_GROUP_COLUMNS = {
+    IntakeGroupBy.direction: IntakeHourly.study_direction_id,
+    IntakeGroupBy.form: IntakeHourly.study_form_id,
+}
+
+
+IntakeKey = tuple[datetime, int, int]
+
+
+def intake_key(study_info: StudyInfo) -> IntakeKey:
+    return (
+        study_info.create_at.replace(minute=0, second=0, microsecond=0),
+        study_info.study_direction_id or 0,
+        study_info.study_form_id or 0,
+    )
+
+
+async def record_intake(db: AsyncSession, study_info: StudyInfo, delta: int) -> None:
+    """Add ``delta`` to the hourly bucket of ``study_info``; the caller commits."""
+    await record_intake_counts(db, {intake_key(study_info): delta})
+
+
+async def move_intake(db: AsyncSession, before: IntakeKey, study_info: StudyInfo) -> None:
+    """Move one application from ``before`` to the current bucket of ``study_info``.
+
+    Call in the same transaction as any change of direction, form or
+    create_at; the caller commits.
+    """
+    after = intake_key(study_info)
+    if after != before:
+        await record_intake_counts(db, {before: -1, after: 1})
+
+
+async def record_intake_counts(db: AsyncSession, counts: dict[IntakeKey, int]) -> None:
+    """Upsert ``{(hour, direction_id, form_id): delta}`` in one statement."""
+    if not counts:
+        return
+    stmt = pg_insert(IntakeHourly).values(
+        [
+            {
+                "bucket": bucket,
+                "study_direction_id": direction_id,
+                "study_form_id": form_id,
+                "applications": delta,
+            }
+            for (bucket, direction_id, form_id), delta in counts.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            IntakeHourly.bucket,
+            IntakeHourly.study_direction_id,
+            IntakeHourly.study_form_id,
+        ],
+        set_={"applications": IntakeHourly.applications + stmt.excluded.applications},
+    )
+    await db.execute(stmt)
+
+
+class IntakeAnalyticsService(BasicCrud):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def rebuild(self) -> int:
+        """Recompute the rollup from StudyInfo; meant for a periodic job."""
+        # Block incremental upserts until the rebuilt rows are committed.
+        await self.db.execute(
+            text(f"LOCK TABLE {IntakeHourly.__tablename__} IN EXCLUSIVE MODE")
+        )
+        await self.db.execute(delete(IntakeHourly))
+
+        bucket = func.date_trunc("hour", StudyInfo.create_at)
+        direction = func.coalesce(StudyInfo.study_direction_id, 0)
+        form = func.coalesce(StudyInfo.study_form_id, 0)
+        source = select(bucket, direction, form, func.count()).group_by(
+            bucket, direction, form
+        )
+        result = await self.db.execute(
+            insert(IntakeHourly).from_select(
+                ["bucket", "study_direction_id", "study_form_id", "applications"],
+                source,
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def _series(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        granularity: IntakeGranularity,
+        group_by: list[IntakeGroupBy],
+        study_direction_id: int | None,
+        study_form_id: int | None,
+        shift: timedelta = timedelta(0),
+    ) -> list[IntakePoint]:
+        if granularity == IntakeGranularity.hour:
+            bucket = IntakeHourly.bucket
+        else:
+            bucket = func.date_trunc("day", IntakeHourly.bucket)
+
+        group_columns = [_GROUP_COLUMNS[group] for group in group_by]
+        stmt = (
+            select(
+                bucket.label("bucket"),
+                *group_columns,
+                func.sum(IntakeHourly.applications).label("applications"),
+            )
+            .where(
+                IntakeHourly.bucket >= date_from - shift,
+                IntakeHourly.bucket < date_to - shift,
+            )
+            .group_by(bucket, *group_columns)
+            .order_by(bucket)
+        )
+        if study_direction_id is not None:
+            stmt = stmt.where(IntakeHourly.study_direction_id == study_direction_id)
+        if study_form_id is not None:
+            stmt = stmt.where(IntakeHourly.study_form_id == study_form_id)
+
+        rows = (await self.db.execute(stmt)).mappings().all()
+        return [
+            IntakePoint(**{**row, "bucket": row["bucket"] + shift})
+            for row in rows
+        ]
+
+    async def get_intake(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        granularity: IntakeGranularity = IntakeGranularity.day,
+        group_by: list[IntakeGroupBy] | None = None,
+        study_direction_id: int | None = None,
+        study_form_id: int | None = None,
+        compare_previous: bool = False,
+    ) -> IntakeSeriesResponse:
+        group_by = list(dict.fromkeys(group_by or []))
+        args = (date_from, date_to, granularity, group_by, study_direction_id, study_form_id)
+
+        series = await self._series(*args)
+        response = IntakeSeriesResponse(
+            granularity=granularity,
+            group_by=group_by,
+            total=sum(point.applications for point in series),
+            series=series,
+        )
+        if compare_previous:
+            shift = timedelta(days=settings.stats_campaign_offset_days)
+            previous = await self._series(*args, shift=shift)
+            response.previous_series = previous
+            response.previous_total = sum(point.applications for point in previous)
+        return response
@@ -1,4 +1,5 @@
 import http
+import time
 import requests
 import logging
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -6,9 +7,9 @@ from dataclasses import dataclass
 from enum import Enum
 
 from sharq_models import PassportData #type: ignore
+from src.core.metrics import AMOCRM_REQUEST_DURATION, AMOCRM_REQUEST_ERRORS
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +62,7 @@ class AmoCRMService:
         json_data: Optional[Union[Dict, List]] = None,
     ) -> Dict[str, Any]:
         url = f"{self.config.base_api}/{endpoint}"
+        started = time.perf_counter()
 
         try:
             response = requests.request(
@@ -78,7 +80,10 @@ class AmoCRMService:
             return response.json()
 
         except requests.exceptions.RequestException as e:
+            AMOCRM_REQUEST_ERRORS.labels(method).inc()
             self._handle_request_error(e, method, endpoint)
+        finally:
+            AMOCRM_REQUEST_DURATION.labels(method).observe(time.perf_counter() - started)
 
     def _handle_request_error(
         self, error: Exception, method: str, endpoint: str
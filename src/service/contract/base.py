@@ -1,20 +1,27 @@
+import asyncio
 import io
 import base64
-import os
 import random
-from uuid import uuid4
-import qrcode
+import time
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from weasyprint import HTML
 from src.service import BasicCrud
 from sharq_models.models import Contract , StudyInfo #type:ignore
 from src.core.config import settings
+from src.core.metrics import PDF_RENDER_DURATION
+from src.core.storage import get_storage, key_for, new_upload_path
 from fastapi.templating import Jinja2Templates
 import jinja2
 
 templates = Jinja2Templates(directory="src/templates")
 
+
+def _render_pdf(html_content: str) -> bytes:
+    from weasyprint import HTML  # slow to import; loaded on first render
+
+    return HTML(string=html_content, base_url=".").write_pdf()
+
+
 class ContractBase(BasicCrud):
     BASE_UPLOAD_DIR = "uploads/contracts"
     CONTRACT_CONFIG = {
@@ -34,8 +41,7 @@ class ContractBase(BasicCrud):
         self.qr_code_dir_path = self.path_builder("qr_codes", ".png")
     
     def path_builder(self, base_dir: str, extension: str) -> str:
-        filename = f"{uuid4().hex}{extension}"
-        return f"{self.BASE_UPLOAD_DIR}/{base_dir}/{filename}"
+        return new_upload_path(f"{self.BASE_UPLOAD_DIR}/{base_dir}", extension)
     
     def url_builder(self, path: str) -> str:
         return f"{settings.base_url}/{path}"
@@ -56,6 +62,8 @@ class ContractBase(BasicCrud):
         return str(random.randint(0, 999999)).zfill(6)
     
     def _generate_qr_code(self, contract_file_path: str) -> str:
+        import qrcode  # pulls in PIL; only needed when a contract is rendered
+
         qr = qrcode.QRCode(
             version=1,
             error_correction=qrcode.constants.ERROR_CORRECT_L,
@@ -74,10 +82,11 @@ class ContractBase(BasicCrud):
         context["qr_code"] = self._generate_qr_code(context["contract_file_path"])
         return templates.get_template(template_name).render(context)
 
-    def _save_contract_pdf(self, html_content: str, file_path: str) -> None:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as f:
-            HTML(string=html_content, base_url=".").write_pdf(f)    
+    async def _save_contract_pdf(self, html_content: str, file_path: str, template_name: str = "") -> None:
+        started = time.perf_counter()
+        pdf = await asyncio.to_thread(_render_pdf, html_content)
+        PDF_RENDER_DURATION.labels(template_name).observe(time.perf_counter() - started)
+        await get_storage().write(key_for(file_path), pdf, content_type="application/pdf")
             
     async def _update_in_study_info(self, user_id: int):
         # is_approved is a computed field based on contract existence
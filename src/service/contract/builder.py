@@ -1,10 +1,11 @@
+import asyncio
 from datetime import datetime
 import logging
 from urllib.parse import urlparse
 from typing import Optional
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,23 @@ from src.service.contract.base import ContractBase
 from src.utils.utils import number_to_uzbek
 from src.service.contract.amo import move_lead_to_get_contract_pipeline
 from src.core.config import settings
+from src.core.replica import replica_safe
+from src.core.loader import get_loader
+from src.core.concurrency import gather_reads
+
+CONTRACT_BY_USER_AND_TYPE = (
+    select(Contract)
+    .options(
+        joinedload(Contract.user).joinedload(User.passport_data),
+        joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_form),
+        joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_type),
+        joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_direction),
+    )
+    .where(
+        Contract.user_id == bindparam("user_id"),
+        Contract.contract_type == bindparam("contract_type"),
+    )
+)
 
 class ContractService(ContractBase):
     def __init__(self, db: AsyncSession):
@@ -21,18 +39,42 @@ class ContractService(ContractBase):
         self.logger = logging.getLogger(__name__)
         
     async def generate_contracts(self, user_id: int, edu_course_level: int):
-        urls = []
-        lead = await self._get_lead(user_id)
-        if lead:
-            move_lead_to_get_contract_pipeline(lead.lead_id, settings.amo_crm_config)
-        else:
+        async def load_lead(session):
+            return await get_loader(session, AMOCrmLead, "user_id").load(user_id)
+
+        async def load_contracts(session):
+            return await get_loader(session, Contract, "user_id", many=True).load(user_id)
+
+        # Independent lookups: the lead on the request session, contracts beside it.
+        lead, contracts = await gather_reads(load_lead, load_contracts, session=self.db)
+        existing = {contract.contract_type: contract for contract in contracts}
+
+        async def build_contracts() -> list[str]:
+            urls = []
+            for contract_type in self.CONTRACT_CONFIG:
+                contract = existing.get(contract_type)
+                if contract is None:
+                    # Known to be missing; skip get_or_create_contract's lookup.
+                    url = await self._create_contract(user_id, contract_type, edu_course_level)
+                elif contract.file_url:
+                    url = urlparse(contract.file_url).path.lstrip("/")
+                else:
+                    raise HTTPException(status_code=404, detail="File not found")
+                urls.append(url)
+            return urls
+
+        if not lead:
             self.logger.error(f"Lead not found for user {user_id}")
-        
-        for contract_type in self.CONTRACT_CONFIG:
-            url = await self.get_or_create_contract(user_id=user_id, edu_course_level=edu_course_level, contract_type=contract_type)
-            urls.append(url)
+            return await build_contracts()
+
+        # The AmoCRM client is blocking; run it off the event loop alongside the PDFs.
+        _, urls = await asyncio.gather(
+            asyncio.to_thread(move_lead_to_get_contract_pipeline, lead.lead_id, settings.amo_crm_config),
+            build_contracts(),
+        )
         return urls
     
+    @replica_safe
     async def get_contracts(
         self, 
         # limit: int = 10, 
@@ -56,70 +98,48 @@ class ContractService(ContractBase):
         return contracts
     
     async def _get_lead(self, user_id: int) -> AMOCrmLead:
-        stmt = (
-            select(AMOCrmLead)
-            .where(AMOCrmLead.user_id == user_id)
-        )
-        result = await self.db.execute(stmt)
-        lead = result.scalars().first()
-        return lead
+        return await get_loader(self.db, AMOCrmLead, "user_id").load(user_id)
 
     async def get_or_create_contract(self, user_id: int, contract_type: str = "two_side", edu_course_level: Optional[int] = None) -> str:
-        contract, is_created = await self._create_contract_or_get_existing(user_id, contract_type)
-        
-        if contract and contract.contract_type == contract_type and not is_created:
-            if not contract.file_url:
-                raise HTTPException(status_code=404, detail="File not found")
-            
-            return urlparse(contract.file_url).path.lstrip("/")
-        
+        contract = await self._get_contract(user_id, contract_type)
+        if contract is None:
+            return await self._create_contract(user_id, contract_type, edu_course_level)
+        if not contract.file_url:
+            raise HTTPException(status_code=404, detail="File not found")
+        return urlparse(contract.file_url).path.lstrip("/")
+
+    async def _create_contract(self, user_id: int, contract_type: str, edu_course_level: Optional[int]) -> str:
+        file_path = self.path_builder(contract_type, ".pdf")
+        created = await super().create(
+            model=Contract,
+            obj_items=ContractCreate(
+                user_id=user_id,
+                file_path=file_path,
+                file_url=self.url_builder(file_path),
+                status=True,
+                contract_id=self._generate_contract_id(),
+                contract_type=contract_type
+            )
+        )
+        if not created:
+            raise HTTPException(status_code=404, detail="Contract not found for this user")
+
+        await self._update_in_study_info(user_id=user_id)
+
+        # Reload with the relations the template context needs.
+        contract = await self._get_contract(user_id, contract_type)
         context = await self._prepare_contract_context(contract, edu_course_level)
-        html_content = self._render_contract_html(self.CONTRACT_CONFIG[contract_type]["template"], context)
+        template_name = self.CONTRACT_CONFIG[contract_type]["template"]
+        html_content = self._render_contract_html(template_name, context)
         file_url = urlparse(contract.file_url).path.lstrip("/")
 
-        self._save_contract_pdf(html_content, file_url)
+        await self._save_contract_pdf(html_content, file_url, template_name)
         return file_url
-
-    async def _create_contract_or_get_existing(self, user_id: int, contract_type: str) -> Contract:
-        existing_contract = await self._get_contract(user_id, contract_type)
-        
-        if not existing_contract:
-            file_path = self.path_builder(contract_type, ".pdf")
-            contract =  await super().create(
-                model=Contract, 
-                obj_items=ContractCreate(
-                    user_id=user_id, 
-                    file_path=file_path, 
-                    file_url=self.url_builder(file_path),
-                    status=True,
-                    contract_id=self._generate_contract_id(),
-                    contract_type=contract_type
-                )
-            )    
-
-            if not contract:
-                raise HTTPException(status_code=404, detail="Contract not found for this user")
-            
-            await self._update_in_study_info(user_id=user_id)
-            
-            full_contract = await self._get_contract(user_id, contract_type)            
-            return full_contract, True
-        else:
-            return existing_contract, False
         
     async def _get_contract(self, user_id: int, contract_type: str) -> Contract:
-        stmt = (
-            select(Contract)
-            .options(
-                joinedload(Contract.user),
-                joinedload(Contract.user).joinedload(User.passport_data),
-                joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_form),
-                joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_type),
-                joinedload(Contract.user).joinedload(User.study_info).joinedload(StudyInfo.study_direction),
-            )
-            .where(Contract.user_id == user_id, Contract.contract_type == contract_type)
+        result = await self.db.execute(
+            CONTRACT_BY_USER_AND_TYPE, {"user_id": user_id, "contract_type": contract_type}
         )
-        result = await self.db.execute(stmt)
         contract = result.scalars().first()
         return contract
     
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from fastapi import HTTPException, status
 from src.service import BasicCrud
 from sharq_models.models import EducationType #type: ignore 
@@ -6,6 +8,7 @@ from src.schemas.education_type import (
     EducationTypeUpdate,
     EducationTypeFilter,
     EducationTypeResponse,
+    EducationTypeBulkUpdate,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
@@ -58,11 +61,52 @@ class EducationTypeCrud(BasicCrud[EducationType, EducationTypeBase]):
     async def update_education_type(
         self, education_id: int, obj: EducationTypeUpdate
     ) -> EducationTypeResponse:
-        await self.get_by_education_type_id(education_id)
-        return await super().update(
+        education_type = await super().update_returning(
             model=EducationType, item_id=education_id, obj_items=obj
         )
+        if not education_type:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'qish turi topilmadi"
+            )
+        return education_type
 
     async def delete_education_type(self, education_id: int) -> dict:
-        await self.get_by_education_type_id(education_id)
-        return await super().delete(model=EducationType, item_id=education_id)
+        # ORM delete on purpose: relationship cascades defined in sharq_models must run.
+        education_type = await super().delete(model=EducationType, item_id=education_id)
+        if not education_type:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'qish turi topilmadi"
+            )
+        return education_type
+
+    async def bulk_create_education_types(
+        self, items: List[EducationTypeBase]
+    ) -> List[EducationTypeResponse]:
+        names = Counter(item.name for item in items)
+        conflicts = await super().get_existing_values(
+            model=EducationType, field_name="name", values=list(names)
+        )
+        conflicts.update(name for name, count in names.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'qish turi allaqachon mavjud: {', '.join(sorted(conflicts))}",
+            )
+
+        return await super().bulk_create(model=EducationType, items=items)
+
+    async def bulk_update_education_types(
+        self, items: List[EducationTypeBulkUpdate]
+    ) -> List[EducationTypeResponse]:
+        conflicts = await super().get_update_conflicts(model=EducationType, items=items)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'qish turi allaqachon mavjud: {', '.join(sorted(name for name, in conflicts))}",
+            )
+
+        return await super().bulk_update(model=EducationType, items=items)
+
+    async def bulk_delete_education_types(self, ids: List[int]) -> dict:
+        deleted = await super().bulk_delete_cascading(model=EducationType, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
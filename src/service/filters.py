@@ -0,0 +1,201 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sharq_models.models import (  # type: ignore
+    EducationType,
+    PassportData,
+    StudyDirection,
+    StudyForm,
+    StudyInfo,
+    StudyLanguage,
+    StudyType,
+)
+from src.core.config import settings
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Declarative filter: ``<column> <op> <value of attribute `field`>``.
+
+    ``op`` is one of eq, prefix, in, gte, lte. All of them compile to
+    predicates a btree index can serve (prefix uses ``lower(col) LIKE 'x%'``).
+    With ``lookup`` set the value is a dictionary *name*: it is resolved to ids
+    in memory first and ``column`` (the foreign key) is matched with ``IN``, so
+    the dictionary table never has to be joined. ``lookup_op`` is eq, prefix
+    or contains and is applied to the cached names, not in SQL.
+    """
+
+    field: str
+    column: Any
+    op: str = "eq"
+    lookup: Any = None
+    lookup_op: str = "eq"
+
+
+@dataclass
+class CompiledFilter:
+    clauses: list = field(default_factory=list)
+    # Mapped classes whose columns the clauses reference; callers join only these.
+    entities: set = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.clauses)
+
+
+_reference_cache: dict[Any, tuple[float, list[tuple[int, str]]]] = {}
+
+
+async def load_reference(db: AsyncSession, model) -> list[tuple[int, str]]:
+    """``(id, name)`` pairs of a dictionary table, cached for REFERENCE_CACHE_SECONDS."""
+    cached = _reference_cache.get(model)
+    if cached and time.monotonic() - cached[0] < settings.reference_cache_seconds:
+        return cached[1]
+    rows = (await db.execute(select(model.id, model.name))).tuples().all()
+    _reference_cache[model] = (time.monotonic(), rows)
+    return rows
+
+
+def invalidate_reference(model=None) -> None:
+    if model is None:
+        _reference_cache.clear()
+    else:
+        _reference_cache.pop(model, None)
+
+
+async def resolve_names(db: AsyncSession, model, value: str, op: str = "eq") -> list[int]:
+    needle = value.strip().lower()
+    if op == "eq":
+        match = lambda name: name.strip().lower() == needle
+    elif op == "prefix":
+        match = lambda name: name.lower().startswith(needle)
+    else:
+        match = lambda name: needle in name.lower()
+    return [id_ for id_, name in await load_reference(db, model) if name and match(name)]
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def predicate(column, op: str, value):
+    """The SQL clause a non-lookup FilterSpec with ``op`` compiles to."""
+    if op == "eq":
+        return column == value
+    if op == "prefix":
+        return func.lower(column).like(f"{_escape_like(value.lower())}%", escape="\\")
+    if op == "in":
+        values = value.split(",") if isinstance(value, str) else list(value)
+        return column.in_(values)
+    if op == "gte":
+        return column >= value
+    if op == "lte":
+        return column <= value
+    raise ValueError(f"Unsupported filter operator: {op}")
+
+
+def _entity(column):
+    return column.class_
+
+
+async def _compile_one(db: AsyncSession, spec: FilterSpec, value):
+    if spec.lookup is not None:
+        ids = await resolve_names(db, spec.lookup, value, spec.lookup_op)
+        return spec.column.in_(ids)
+    return predicate(spec.column, spec.op, value)
+
+
+async def compile_filters(
+    db: AsyncSession, specs: Sequence[FilterSpec], values: Optional[Any]
+) -> CompiledFilter:
+    """AND together every spec whose attribute on ``values`` is set."""
+    compiled = CompiledFilter()
+    if values is None:
+        return compiled
+    for spec in specs:
+        value = getattr(values, spec.field, None)
+        if value is None or value == "":
+            continue
+        compiled.clauses.append(await _compile_one(db, spec, value))
+        compiled.entities.add(_entity(spec.column))
+    return compiled
+
+
+async def compile_search(
+    db: AsyncSession, specs: Sequence[FilterSpec], term: Optional[str]
+) -> CompiledFilter:
+    """OR one free-text ``term`` across ``specs`` (``field`` is ignored)."""
+    compiled = CompiledFilter()
+    if not term:
+        return compiled
+    compiled.clauses.append(
+        or_(*[await _compile_one(db, spec, term) for spec in specs])
+    )
+    compiled.entities.update(_entity(spec.column) for spec in specs)
+    return compiled
+
+
+def merge(*filters: CompiledFilter) -> CompiledFilter:
+    merged = CompiledFilter()
+    for compiled in filters:
+        merged.clauses.extend(compiled.clauses)
+        merged.entities.update(compiled.entities)
+    return merged
+
+
+def apply_filters(
+    stmt: Select, compiled: CompiledFilter, joins: dict[Any, Callable[[Select], Select]]
+) -> Select:
+    """Add the clauses and only the joins ``compiled`` needs.
+
+    ``joins`` maps an entity to a function that joins it onto ``stmt``; the
+    statement's root entity is simply absent from the map.
+    """
+    for entity, join in joins.items():
+        if entity in compiled.entities:
+            stmt = join(stmt)
+    if compiled.clauses:
+        stmt = stmt.where(*compiled.clauses)
+    return stmt
+
+
+# Dictionaries whose names list filters resolve through load_reference().
+REFERENCE_MODELS = (StudyLanguage, StudyForm, StudyDirection, StudyType, EducationType)
+
+PASSPORT_FILTERS = (
+    FilterSpec("passport_series_number", PassportData.passport_series_number),
+    FilterSpec("jshshir", PassportData.jshshir),
+    FilterSpec("first_name", PassportData.first_name, op="prefix"),
+    FilterSpec("last_name", PassportData.last_name, op="prefix"),
+    FilterSpec("third_name", PassportData.third_name, op="prefix"),
+    FilterSpec("region", PassportData.region, op="prefix"),
+    FilterSpec("gender", PassportData.gender),
+)
+
+STUDY_INFO_FILTERS = (
+    FilterSpec("study_language", StudyInfo.study_language_id, lookup=StudyLanguage),
+    FilterSpec("study_form", StudyInfo.study_form_id, lookup=StudyForm),
+    FilterSpec(
+        "study_direction_name",
+        StudyInfo.study_direction_id,
+        lookup=StudyDirection,
+        lookup_op="contains",
+    ),
+    FilterSpec("study_type", StudyInfo.study_type_id, lookup=StudyType),
+    FilterSpec("education_type", StudyInfo.education_type_id, lookup=EducationType),
+    FilterSpec("created_from", StudyInfo.create_at, op="gte"),
+    FilterSpec("created_to", StudyInfo.create_at, op="lte"),
+)
+
+APPLICATION_SEARCH = (
+    FilterSpec("search", PassportData.first_name, op="prefix"),
+    FilterSpec("search", PassportData.last_name, op="prefix"),
+    FilterSpec("search", PassportData.third_name, op="prefix"),
+    FilterSpec("search", PassportData.passport_series_number, op="prefix"),
+    FilterSpec("search", PassportData.jshshir, op="prefix"),
+    FilterSpec("search", StudyInfo.study_direction_id, lookup=StudyDirection, lookup_op="contains"),
+    FilterSpec("search", StudyInfo.study_language_id, lookup=StudyLanguage, lookup_op="contains"),
+)
@@ -1,13 +1,25 @@
+import time
+from collections import defaultdict
+from typing import Any
+
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import literal_column
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.service import BasicCrud
 from sharq_models.models import PassportData, User #type: ignore
 from src.schemas.passport_data import (
     PassportDataBase,
     PassportDataUpdate,
     PassportDataCreate,
+    PassportUpsertOutcome,
+    PassportBulkUpsertReport,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+_passport_batch_adapter = TypeAdapter(list[PassportDataCreate])
+
 
 class PassportDataCrud(BasicCrud[PassportData, PassportDataBase]):
     def __init__(self, db: AsyncSession):
@@ -71,15 +83,164 @@ class PassportDataCrud(BasicCrud[PassportData, PassportDataBase]):
         update_items: PassportDataUpdate,
         user_id: int,
     ):
-        await self.get_passport_data_by_id(
-            passport_data_id=passport_data_id, user_id=user_id
-        )
-        return await super().update(
-            model=PassportData, item_id=passport_data_id, obj_items=update_items
+        passport_data = await super().update_returning(
+            model=PassportData,
+            item_id=passport_data_id,
+            obj_items=update_items,
+            filters=[PassportData.user_id == user_id],
         )
+        if not passport_data:
+            # Slow path only on failure: tells 404 and 401 apart.
+            await self.get_passport_data_by_id(
+                passport_data_id=passport_data_id, user_id=user_id
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Passport data not found"
+            )
+        return passport_data
 
     async def delete_passport_data(self, passport_data_id: int, user_id: int):
         await self.get_passport_data_by_id(
             passport_data_id=passport_data_id, user_id=user_id
         )
         return await super().delete(model=PassportData, item_id=passport_data_id)
+
+    def _validate_batch(self, payload: list[dict[str, Any]]):
+        """Validate the whole payload in one pass; failing items are reported, not raised."""
+        try:
+            return list(enumerate(_passport_batch_adapter.validate_python(payload))), {}
+        except ValidationError as e:
+            errors = defaultdict(list)
+            for item in e.errors():
+                index, *field = item["loc"]
+                errors[index].append(f"{'.'.join(map(str, field))}: {item['msg']}")
+
+        valid_indexes = [i for i in range(len(payload)) if i not in errors]
+        parsed = _passport_batch_adapter.validate_python([payload[i] for i in valid_indexes])
+        return list(zip(valid_indexes, parsed)), errors
+
+    def _upsert_statement(self, chunk: list[tuple[int, PassportDataCreate]]):
+        update_columns = [
+            name for name in PassportDataCreate.model_fields if name != "user_id"
+        ]
+        stmt = pg_insert(PassportData).values([item.model_dump() for _, item in chunk])
+        return stmt.on_conflict_do_update(
+            index_elements=[PassportData.jshshir],
+            set_={name: stmt.excluded[name] for name in update_columns},
+        ).returning(
+            PassportData.id,
+            PassportData.jshshir,
+            literal_column("xmax = 0").label("inserted"),
+        )
+
+    async def _upsert_chunk(
+        self, chunk: list[tuple[int, PassportDataCreate]]
+    ) -> tuple[list, dict[int, str]]:
+        """Upsert ``chunk`` inside a savepoint.
+
+        If the database rejects it (unique ``user_id``, bad value, ...), the
+        items are retried one savepoint each so only the offending records
+        fail; the error is returned per item instead of raised.
+        """
+        try:
+            async with self.db.begin_nested():
+                return (await self.db.execute(self._upsert_statement(chunk))).all(), {}
+        except (IntegrityError, DataError) as e:
+            if len(chunk) == 1:
+                return [], {chunk[0][0]: str(e.orig).strip().splitlines()[0]}
+
+        rows, failures = [], {}
+        for entry in chunk:
+            entry_rows, entry_failures = await self._upsert_chunk([entry])
+            rows.extend(entry_rows)
+            failures.update(entry_failures)
+        return rows, failures
+
+    async def bulk_upsert_passport_data(
+        self, payload: list[dict[str, Any]], chunk_size: int = 1000
+    ) -> PassportBulkUpsertReport:
+        """Insert or update passport records keyed on ``jshshir``.
+
+        Each chunk is a single ``INSERT ... ON CONFLICT (jshshir) DO UPDATE``
+        in a savepoint, committed on its own; ``user_id`` of an existing record
+        is never changed. Unknown users and records the database rejects are
+        reported as ``invalid`` per item, never as a failed request.
+        """
+        started = time.perf_counter()
+        valid, errors = self._validate_batch(payload)
+
+        results: dict[int, PassportUpsertOutcome] = {
+            index: PassportUpsertOutcome(
+                index=index,
+                jshshir=payload[index].get("pinfl"),
+                status="invalid",
+                errors=messages,
+            )
+            for index, messages in errors.items()
+        }
+
+        # Postgres rejects a statement that touches the same row twice, so the
+        # last occurrence of a jshshir in the payload wins.
+        latest: dict[str, tuple[int, PassportDataCreate]] = {}
+        for index, item in valid:
+            if item.jshshir in latest:
+                earlier = latest[item.jshshir][0]
+                results[earlier] = PassportUpsertOutcome(
+                    index=earlier, jshshir=item.jshshir, status="duplicate",
+                    errors=[f"superseded by item {index}"],
+                )
+            latest[item.jshshir] = (index, item)
+
+        # One query for every referenced user instead of failing on the FK.
+        known_users = await self.get_existing_values(
+            User, "id", list({item.user_id for _, item in latest.values()})
+        )
+        items = []
+        for index, item in latest.values():
+            if item.user_id in known_users:
+                items.append((index, item))
+            else:
+                results[index] = PassportUpsertOutcome(
+                    index=index, jshshir=item.jshshir, status="invalid",
+                    errors=["user_id: user not found"],
+                )
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            by_index = dict(chunk)
+            index_by_jshshir = {item.jshshir: index for index, item in chunk}
+
+            try:
+                rows, failures = await self._upsert_chunk(chunk)
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+
+            for index, message in failures.items():
+                results[index] = PassportUpsertOutcome(
+                    index=index, jshshir=by_index[index].jshshir, status="invalid",
+                    errors=[message],
+                )
+            for row in rows:
+                index = index_by_jshshir[row.jshshir]
+                results[index] = PassportUpsertOutcome(
+                    index=index,
+                    jshshir=row.jshshir,
+                    status="inserted" if row.inserted else "updated",
+                    id=row.id,
+                )
+
+        elapsed = time.perf_counter() - started
+        ordered = [results[index] for index in sorted(results)]
+        inserted = sum(1 for r in ordered if r.status == "inserted")
+        updated = sum(1 for r in ordered if r.status == "updated")
+        return PassportBulkUpsertReport(
+            total=len(payload),
+            inserted=inserted,
+            updated=updated,
+            failed=len(ordered) - inserted - updated,
+            elapsed_ms=round(elapsed * 1000, 1),
+            records_per_second=round(len(payload) / elapsed, 1) if elapsed else 0.0,
+            results=ordered,
+        )
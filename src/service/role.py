@@ -2,10 +2,12 @@ from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
+from collections import Counter
 
-from sharq_models.models.user import Role #type: ignore
-from src.schemas.role import RoleBase, RoleCreate, RoleUpdate, RoleResponse
+from sharq_models.models.user import Role, User #type: ignore
+from src.schemas.role import RoleBase, RoleCreate, RoleUpdate, RoleResponse, RoleBulkUpdate
 from src.service import BasicCrud
+from src.core.loader import get_loader
 
 
 class RoleService(BasicCrud[Role, RoleBase]):
@@ -25,7 +27,7 @@ class RoleService(BasicCrud[Role, RoleBase]):
         return await super().create(model=Role, obj_items=role_data)
 
     async def get_role_by_id(self, role_id: int) -> RoleResponse:
-        role = await super().get_by_id(model=Role, item_id=role_id)
+        role = await get_loader(self.db, Role).load(role_id)
         if not role:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
@@ -38,8 +40,12 @@ class RoleService(BasicCrud[Role, RoleBase]):
         return await super().get_all(model=Role, limit=limit, offset=offset)
 
     async def update_role(self, role_id: int, role_data: RoleUpdate) -> RoleResponse:
-        await self.get_role_by_id(role_id)
-        return await super().update(model=Role, item_id=role_id, obj_items=role_data)
+        role = await super().update_returning(model=Role, item_id=role_id, obj_items=role_data)
+        if not role:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Role not found"
+            )
+        return role
 
     async def delete_role(self, role_id: int):
         role = await self.get_role_by_id(role_id)
@@ -62,3 +68,37 @@ class RoleService(BasicCrud[Role, RoleBase]):
             role = await self.create_role(default_role_data)
 
         return role
+
+    async def bulk_create_roles(self, items: List[RoleCreate]) -> List[RoleResponse]:
+        names = Counter(item.name for item in items)
+        conflicts = await super().get_existing_values(
+            model=Role, field_name="name", values=list(names)
+        )
+        conflicts.update(name for name, count in names.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Role with this name already exists: {', '.join(sorted(conflicts))}",
+            )
+        return await super().bulk_create(model=Role, items=items)
+
+    async def bulk_update_roles(self, items: List[RoleBulkUpdate]) -> List[RoleResponse]:
+        conflicts = await super().get_update_conflicts(model=Role, items=items)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Role with this name already exists: {', '.join(sorted(name for name, in conflicts))}",
+            )
+        return await super().bulk_update(model=Role, items=items)
+
+    async def bulk_delete_roles(self, ids: List[int]) -> dict:
+        assigned = await super().get_existing_values(
+            model=User, field_name="role_id", values=ids
+        )
+        if assigned:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot delete roles that are assigned to users: {sorted(assigned)}",
+            )
+        deleted = await super().bulk_delete(model=Role, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timezone
+
+from sqlalchemy import Date, DateTime, column, func, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sharq_models.models import Contract, PassportData, StudyInfo  # type: ignore
+from src.core.config import settings
+from src.core.db import AsyncSessionLocal
+from src.schemas.stats import (
+    StatsBreakdownItem,
+    StatsBreakdownResponse,
+    StatsDimension,
+    StatsSummaryResponse,
+)
+from src.service import BasicCrud
+
+logger = logging.getLogger(__name__)
+
+# Created by migration 0002, which owns the view's SQL.
+ROLLUP_VIEW = "stats_application_rollup"
+# Arbitrary constant used with pg_try_advisory_xact_lock so only one worker
+# refreshes the rollup at a time.
+ROLLUP_LOCK_KEY = 726_031
+
+rollup = table(
+    ROLLUP_VIEW,
+    column("day", Date),
+    column("study_direction_id"),
+    column("study_direction"),
+    column("study_form_id"),
+    column("study_form"),
+    column("study_language_id"),
+    column("study_language"),
+    column("region"),
+    column("applications"),
+    column("approved"),
+)
+
+_DIMENSIONS = {
+    StatsDimension.direction: (rollup.c.study_direction_id, rollup.c.study_direction),
+    StatsDimension.form: (rollup.c.study_form_id, rollup.c.study_form),
+    StatsDimension.language: (rollup.c.study_language_id, rollup.c.study_language),
+    StatsDimension.region: (rollup.c.region, None),
+    StatsDimension.day: (rollup.c.day, None),
+}
+
+# Last successful refresh, shared by all workers.
+rollup_refresh = table(
+    "stats_rollup_refresh",
+    column("view_name"),
+    column("refreshed_at", DateTime(timezone=True)),
+)
+
+_REFRESHED_AT = (
+    select(rollup_refresh.c.refreshed_at)
+    .where(rollup_refresh.c.view_name == ROLLUP_VIEW)
+    .scalar_subquery()
+)
+
+
+class StatsService(BasicCrud):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def get_summary(self) -> StatsSummaryResponse:
+        """Headline dashboard counts in a single round-trip."""
+        stmt = select(
+            select(func.count()).select_from(PassportData).scalar_subquery().label("users_with_passport_data"),
+            select(func.count()).select_from(StudyInfo).scalar_subquery().label("users_with_study_info"),
+            select(func.count()).select_from(Contract).scalar_subquery().label("users_with_contract"),
+        )
+        row = (await self.db.execute(stmt)).one()
+        return StatsSummaryResponse(**row._mapping)
+
+    async def refresh_rollup(self) -> datetime | None:
+        """Refresh the rollup view; None if another worker is refreshing it."""
+        locked = (
+            await self.db.execute(
+                select(func.pg_try_advisory_xact_lock(ROLLUP_LOCK_KEY))
+            )
+        ).scalar_one()
+        if not locked:
+            # That worker's refresh will land shortly; readers keep the current snapshot.
+            await self.db.rollback()
+            return None
+
+        started = time.perf_counter()
+        # A full refresh can outlast the pool's statement_timeout; lift it for
+        # this transaction only.
+        await self.db.execute(text("SET LOCAL statement_timeout = 0"))
+        await self.db.execute(
+            text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {ROLLUP_VIEW}")
+        )
+        refreshed_at = datetime.now(timezone.utc)
+        await self.db.execute(
+            rollup_refresh.update()
+            .where(rollup_refresh.c.view_name == ROLLUP_VIEW)
+            .values(refreshed_at=refreshed_at)
+        )
+        # Committing also releases the advisory lock.
+        await self.db.commit()
+        logger.info(
+            f"Refreshed {ROLLUP_VIEW} in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return refreshed_at
+
+    async def get_breakdown(
+        self,
+        dimension: StatsDimension,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> StatsBreakdownResponse:
+        key_col, name_col = _DIMENSIONS[dimension]
+        columns = [key_col.label("key")]
+        if name_col is not None:
+            columns.append(func.max(name_col).label("name"))
+
+        stmt = (
+            select(
+                *columns,
+                func.sum(rollup.c.applications).label("applications"),
+                func.sum(rollup.c.approved).label("approved"),
+                _REFRESHED_AT.label("refreshed_at"),
+            )
+            .group_by(key_col)
+            .order_by(key_col)
+        )
+        if date_from:
+            stmt = stmt.where(rollup.c.day >= date_from)
+        if date_to:
+            stmt = stmt.where(rollup.c.day <= date_to)
+
+        rows = (await self.db.execute(stmt)).mappings().all()
+        if rows:
+            refreshed_at = rows[0]["refreshed_at"]
+        else:
+            refreshed_at = (await self.db.execute(select(_REFRESHED_AT))).scalar_one_or_none()
+        return StatsBreakdownResponse(
+            dimension=dimension,
+            refreshed_at=refreshed_at,
+            items=[
+                StatsBreakdownItem(**{k: v for k, v in row.items() if k != "refreshed_at"})
+                for row in rows
+            ],
+        )
+
+
+async def run_rollup_refresher() -> None:
+    """Refresh the rollup every STATS_REFRESH_SECONDS; started by the lifespan.
+
+    Requests only ever read the view, so a slow refresh never delays them.
+    """
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                await StatsService(session).refresh_rollup()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Refreshing {ROLLUP_VIEW} failed: {e}")
+        await asyncio.sleep(settings.stats_refresh_seconds)
@@ -1,14 +1,18 @@
+from collections import Counter
+
 from fastapi import HTTPException, status
 from src.service import BasicCrud
+from src.core.loader import get_loader
 from sharq_models.models import StudyDirection  #type: ignore
 from src.schemas.study_direction import (
     StudyDirectionBase,
     StudyDirectionUpdate,
     StudyDirectionResponse,
+    StudyDirectionBulkUpdate,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 
 
 class StudyDirectionCrud(BasicCrud[StudyDirection, StudyDirectionBase]):
@@ -37,7 +41,7 @@ class StudyDirectionCrud(BasicCrud[StudyDirection, StudyDirectionBase]):
         self,
         direction_id: int,
     ) -> StudyDirectionResponse:
-        return await super().get_by_id(model=StudyDirection, item_id=direction_id)
+        return await get_loader(self.db, StudyDirection).load(direction_id)
 
     async def get_study_direction_all(
         self, limit: int = 100, offset: int = 0
@@ -48,10 +52,58 @@ class StudyDirectionCrud(BasicCrud[StudyDirection, StudyDirectionBase]):
     async def update_study_direction(
         self, direction_id: int, obj: StudyDirectionUpdate
     ) -> StudyDirectionResponse:
-        await self.get_by_study_direction_id(direction_id)  
-        return await super().update(model=StudyDirection, item_id=direction_id, obj_items=obj)
+        study_direction = await super().update_returning(
+            model=StudyDirection, item_id=direction_id, obj_items=obj
+        )
+        if not study_direction:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Yo'nalish topilmadi"
+            )
+        return study_direction
         
 
     async def delete_study_direction(self, direction_id: int) -> dict:
-        await self.get_by_study_direction_id(direction_id)
-        return await super().delete(model=StudyDirection, item_id=direction_id)
+        # ORM delete on purpose: relationship cascades defined in sharq_models must run.
+        study_direction = await super().delete(
+            model=StudyDirection, item_id=direction_id
+        )
+        if not study_direction:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Yo'nalish topilmadi"
+            )
+        return study_direction
+
+    async def bulk_create_study_directions(
+        self, items: List[StudyDirectionBase]
+    ) -> List[StudyDirectionResponse]:
+        keys = Counter((item.name, item.study_form_id) for item in items)
+        stmt = select(StudyDirection.name, StudyDirection.study_form_id).where(
+            tuple_(StudyDirection.name, StudyDirection.study_form_id).in_(list(keys))
+        )
+        conflicts = set((await self.db.execute(stmt)).tuples().all())
+        conflicts.update(key for key, count in keys.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday fan mavjud: {', '.join(sorted(name for name, _ in conflicts))}",
+            )
+
+        return await super().bulk_create(model=StudyDirection, items=items)
+
+    async def bulk_update_study_directions(
+        self, items: List[StudyDirectionBulkUpdate]
+    ) -> List[StudyDirectionResponse]:
+        conflicts = await super().get_update_conflicts(
+            model=StudyDirection, items=items, field_names=("name", "study_form_id")
+        )
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday fan mavjud: {', '.join(sorted(name for name, _ in conflicts))}",
+            )
+
+        return await super().bulk_update(model=StudyDirection, items=items)
+
+    async def bulk_delete_study_directions(self, ids: List[int]) -> dict:
+        deleted = await super().bulk_delete_cascading(model=StudyDirection, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
@@ -1,13 +1,18 @@
+from collections import Counter
+
 from fastapi import HTTPException, status
 from src.service import BasicCrud
-from sharq_models.models import StudyForm #type: ignore
+from sharq_models.models import StudyForm, StudyDirection #type: ignore
 from src.schemas.study_form import (
     StudyFormBase,
     StudyFormUpdate,
     StudyFormFilter,
     StudyFormResponse,
+    StudyFormBulkUpdate,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
+from typing import List
 
 
 
@@ -55,9 +60,58 @@ class StudyFormCrud(BasicCrud[StudyForm, StudyFormBase]):
     async def update_study_form(
         self, form_id: int, obj: StudyFormUpdate
     ) -> StudyFormResponse:
-        await self.get_by_study_form_id(form_id)
-        return await super().update(model=StudyForm, item_id=form_id, obj_items=obj)
+        study_form = await super().update_returning(
+            model=StudyForm, item_id=form_id, obj_items=obj
+        )
+        if not study_form:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'quv shakli topilmadi"
+            )
+        return study_form
 
     async def delete_study_form(self, form_id: int) -> dict:
-        await self.get_by_study_form_id(form_id)
-        return await super().delete(model=StudyForm, item_id=form_id)
+        # ORM delete on purpose: the study_directions relationship detaches children.
+        study_form = await super().delete(model=StudyForm, item_id=form_id)
+        if not study_form:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'quv shakli topilmadi"
+            )
+        return study_form
+
+    async def bulk_create_study_forms(
+        self, items: List[StudyFormBase]
+    ) -> List[StudyFormResponse]:
+        names = Counter(item.name for item in items)
+        conflicts = await super().get_existing_values(
+            model=StudyForm, field_name="name", values=list(names)
+        )
+        conflicts.update(name for name, count in names.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'quv shakli allaqachon mavjud: {', '.join(sorted(conflicts))}",
+            )
+
+        return await super().bulk_create(model=StudyForm, items=items)
+
+    async def bulk_update_study_forms(
+        self, items: List[StudyFormBulkUpdate]
+    ) -> List[StudyFormResponse]:
+        conflicts = await super().get_update_conflicts(model=StudyForm, items=items)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'quv shakli allaqachon mavjud: {', '.join(sorted(name for name, in conflicts))}",
+            )
+
+        return await super().bulk_update(model=StudyForm, items=items)
+
+    async def bulk_delete_study_forms(self, ids: List[int]) -> dict:
+        # The ORM delete path detaches directions from the form; keep that behaviour.
+        await self.db.execute(
+            update(StudyDirection)
+            .where(StudyDirection.study_form_id.in_(ids))
+            .values(study_form_id=None)
+        )
+        deleted = await super().bulk_delete(model=StudyForm, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
@@ -1,10 +1,10 @@
 import asyncio
 from fastapi import HTTPException
-from sharq_models.models import User , PassportData , StudyLanguage , StudyForm , StudyDirection , StudyType , EducationType # type: ignore
+from sharq_models.models import User , PassportData # type: ignore
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func , and_ , or_ , delete
-from sqlalchemy.orm import joinedload  , selectinload
-import openpyxl
+from sqlalchemy import Select, select, func , delete, bindparam
+from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy.exc import SQLAlchemyError
 import io
 
 
@@ -17,7 +17,82 @@ from src.schemas.study_form import StudyFormResponse
 from src.schemas.study_direction import StudyDirectionResponse
 from src.schemas.passport_data import PassportDataResponse
 from src.service import BasicCrud
+from src.core.metrics import EXPORT_ROWS, EXPORT_SIZE
+from src.core.replica import replica_safe
+from src.service.analytics import record_intake
+from src.core.loader import get_loader
+from src.core.concurrency import gather_reads
 from src.schemas.user_data import UserDataFilterByPassportData , UserDataFilterByStudyInfo
+from src.service.filters import (
+    APPLICATION_SEARCH,
+    PASSPORT_FILTERS,
+    CompiledFilter,
+    STUDY_INFO_FILTERS,
+    apply_filters,
+    compile_filters,
+    compile_search,
+    merge,
+)
+
+
+# Joins a StudyInfo query needs for filters on other tables; dictionary names
+# are resolved to ids up front so their tables are never joined.
+_STUDY_INFO_JOINS = {
+    PassportData: lambda stmt: stmt.join(StudyInfo.user).join(User.passport_data),
+}
+
+
+STUDY_INFO_BY_ID = (
+    select(StudyInfo)
+    .options(
+        joinedload(StudyInfo.study_language),
+        joinedload(StudyInfo.study_form),
+        joinedload(StudyInfo.study_direction),
+        joinedload(StudyInfo.education_type),
+        joinedload(StudyInfo.study_type),
+        joinedload(StudyInfo.user).joinedload(User.passport_data)
+    )
+    .where(StudyInfo.id == bindparam("study_info_id"))
+)
+
+
+def _list_load_options(passport_joined: bool) -> list:
+    """Eager loads for a page of StudyInfo rows.
+
+    Many-to-one relations ride along in the page query: through the filter
+    join when it is already there, otherwise as LEFT OUTER JOINs. Contracts
+    are a collection, so they come in one extra IN query instead of
+    multiplying rows under LIMIT.
+    """
+    if passport_joined:
+        user = contains_eager(StudyInfo.user)
+        passport = user.contains_eager(User.passport_data)
+    else:
+        user = joinedload(StudyInfo.user)
+        passport = user.joinedload(User.passport_data)
+    return [
+        passport,
+        user.selectinload(User.contracts),
+        joinedload(StudyInfo.study_language),
+        joinedload(StudyInfo.study_form),
+        joinedload(StudyInfo.study_direction),
+        joinedload(StudyInfo.education_type),
+        joinedload(StudyInfo.study_type),
+    ]
+
+
+def list_statements(compiled: CompiledFilter, limit: int, offset: int) -> tuple[Select, Select]:
+    """Page and count statements of the application list for ``compiled``.
+
+    Both join exactly the tables the active filters reference.
+    """
+    stmt = apply_filters(
+        select(StudyInfo).order_by(StudyInfo.id.desc()), compiled, _STUDY_INFO_JOINS
+    )
+    stmt = stmt.options(*_list_load_options(PassportData in compiled.entities))
+    stmt = stmt.limit(limit).offset(offset)
+    count_stmt = apply_filters(select(func.count(StudyInfo.id)), compiled, _STUDY_INFO_JOINS)
+    return stmt, count_stmt
 
 
 class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
@@ -26,19 +101,7 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
 
     async def _get_with_join(self, study_info_id: int) -> StudyInfoResponse:
         try:
-            stmt = (
-                select(StudyInfo)
-                .options(
-                    joinedload(StudyInfo.study_language),
-                    joinedload(StudyInfo.study_form),
-                    joinedload(StudyInfo.study_direction),
-                    joinedload(StudyInfo.education_type),
-                    joinedload(StudyInfo.study_type),
-                    joinedload(StudyInfo.user).joinedload(User.passport_data)
-                )
-                .where(StudyInfo.id == study_info_id)
-            )
-            result = await self.db.execute(stmt)
+            result = await self.db.execute(STUDY_INFO_BY_ID, {"study_info_id": study_info_id})
             study_info = result.scalar_one_or_none()
 
             if not study_info:
@@ -49,8 +112,11 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
             await self.db.rollback()
             raise e
 
-    async def _to_response_with_names(self, study_info: StudyInfo) -> StudyInfoResponse:
-        contract_paths = await self._get_contract_paths(study_info.user_id)
+    async def _to_response_with_names(
+        self, study_info: StudyInfo, contract_paths: list[str] | None = None
+    ) -> StudyInfoResponse:
+        if contract_paths is None:
+            contract_paths = await self._get_contract_paths(study_info.user_id)
         return StudyInfoResponse(
             id=study_info.id,
             user_id=study_info.user_id,
@@ -120,6 +186,7 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
         """
         return await self._get_with_join(study_info_id=study_info_id)
 
+    @replica_safe
     async def get_all_study_info(
     self,
     passport_filter: UserDataFilterByPassportData = None,
@@ -129,89 +196,27 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
     offset: int = 0
         ) -> StudyInfoListResponse:
 
-        stmt = (
-            select(StudyInfo)
-            .options(
-                selectinload(StudyInfo.user).selectinload(User.contracts),
-                selectinload(StudyInfo.user).selectinload(User.passport_data),
-                selectinload(StudyInfo.study_language),
-                selectinload(StudyInfo.study_form),
-                selectinload(StudyInfo.study_direction),
-                selectinload(StudyInfo.education_type),
-                selectinload(StudyInfo.study_type),
-            )
-            .order_by(StudyInfo.id.desc())
+        compiled = merge(
+            await compile_filters(self.db, PASSPORT_FILTERS, passport_filter),
+            await compile_filters(self.db, STUDY_INFO_FILTERS, study_info_filter),
+            await compile_search(self.db, APPLICATION_SEARCH, search),
         )
+        stmt, count_stmt = list_statements(compiled, limit, offset)
 
-        filters = []
-
-        # Passport filters
-        if passport_filter:
-            if passport_filter.passport_series_number:
-                filters.append(PassportData.passport_series_number == passport_filter.passport_series_number)
-            if passport_filter.jshshir:
-                filters.append(PassportData.jshshir == passport_filter.jshshir)
-            if passport_filter.first_name:
-                filters.append(PassportData.first_name.ilike(f"%{passport_filter.first_name}%"))
-            if passport_filter.last_name:
-                filters.append(PassportData.last_name.ilike(f"%{passport_filter.last_name}%"))
-            if passport_filter.third_name:
-                filters.append(PassportData.third_name.ilike(f"%{passport_filter.third_name}%"))
-            if passport_filter.region:
-                filters.append(PassportData.region.ilike(f"%{passport_filter.region}%"))
-            if passport_filter.gender:
-                filters.append(PassportData.gender == passport_filter.gender)
-
-        # StudyInfo filters
-        if study_info_filter:
-            if study_info_filter.study_language:
-                filters.append(StudyLanguage.name == study_info_filter.study_language)
-            if study_info_filter.study_form:
-                filters.append(StudyForm.name == study_info_filter.study_form)
-            if study_info_filter.study_direction_name:
-                filters.append(StudyDirection.name.ilike(f"%{study_info_filter.study_direction_name}%"))
-            if study_info_filter.study_type:
-                filters.append(StudyType.name == study_info_filter.study_type)
-            if study_info_filter.education_type:
-                filters.append(EducationType.name == study_info_filter.education_type)
-
-        # Search filter
-        if search:
-            search_term = f"%{search}%"
-            filters.append(
-                or_(
-                    PassportData.first_name.ilike(search_term),
-                    PassportData.last_name.ilike(search_term),
-                    PassportData.third_name.ilike(search_term),
-                    PassportData.passport_series_number.ilike(search_term),
-                    PassportData.jshshir.ilike(search_term),
-                    StudyDirection.name.ilike(search_term),
-                    StudyLanguage.name.ilike(search_term),
-                )
-            )
-
-        # Apply joins only if there are filters
-        if filters:
-            stmt = stmt.join(StudyInfo.user).join(User.passport_data)
-            stmt = stmt.join(StudyInfo.study_language).join(StudyInfo.study_form)
-            stmt = stmt.join(StudyInfo.study_direction).join(StudyInfo.study_type).join(StudyInfo.education_type)
-            stmt = stmt.where(and_(*filters))
-
-        stmt = stmt.limit(limit).offset(offset)
+        async def page(session):
+            return (await session.execute(stmt)).scalars().unique().all()
 
-        result = await self.db.execute(stmt)
-        study_infos = result.scalars().all()
+        async def count(session):
+            return (await session.execute(count_stmt)).scalar_one()
 
-        responses = [await self._to_response_with_names(info) for info in study_infos]
+        study_infos, total = await gather_reads(page, count, session=self.db)
 
-        # Count
-        count_stmt = select(func.count(StudyInfo.id))
-        if filters:
-            count_stmt = count_stmt.join(StudyInfo.user).join(User.passport_data)
-            count_stmt = count_stmt.join(StudyInfo.study_language).join(StudyInfo.study_form)
-            count_stmt = count_stmt.join(StudyInfo.study_direction).join(StudyInfo.study_type).join(StudyInfo.education_type)
-            count_stmt = count_stmt.where(and_(*filters))
-        total = (await self.db.execute(count_stmt)).scalar_one()
+        responses = [
+            await self._to_response_with_names(
+                info, contract_paths=[contract.file_path for contract in info.user.contracts]
+            )
+            for info in study_infos
+        ]
 
         return {"data": responses, "total": total}
             
@@ -219,21 +224,25 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
         existing_study_info = await self.get_by_field(model=StudyInfo, field_name="user_id", field_value=study_info_data.user_id)
         if existing_study_info:
             raise HTTPException(status_code=400, detail="Study info already exists")
-        return await super().create(model=StudyInfo, obj_items=study_info_data)
+        # The row and its intake count land in one transaction, or neither does.
+        study_info = await super().create(model=StudyInfo, obj_items=study_info_data, commit=False)
+        try:
+            await record_intake(self.db, study_info, delta=1)
+            await self.db.commit()
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
+        return study_info
         
     
     async def _get_contract_paths(self, user_id: int) -> list[str]:
-        stmt = (
-            select(Contract)
-            .where(Contract.user_id == user_id)
-        )
-        result = await self.db.execute(stmt)
-        contracts = result.scalars().all()
+        contracts = await get_loader(self.db, Contract, "user_id", many=True).load(user_id)
         return [contract.file_path for contract in contracts]
 
 
 
 
+    @replica_safe
     async def export_to_excel(
             self,
             passport_filter: UserDataFilterByPassportData = None,
@@ -245,6 +254,8 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
             """
             Export StudyInfo data with relations to an Excel file.
             """
+            import openpyxl
+
             result = await self.get_all_study_info(
                 passport_filter=passport_filter,
                 study_info_filter=study_info_filter,
@@ -306,6 +317,8 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
 
             stream = io.BytesIO()
             wb.save(stream)
+            EXPORT_ROWS.labels("study_info_excel").observe(len(study_infos))
+            EXPORT_SIZE.labels("study_info_excel").observe(stream.tell())
             stream.seek(0)
             return stream
 
@@ -336,6 +349,7 @@ class StudyInfoCrud(BasicCrud[StudyInfo, StudyInfoBase]):
                     "message": "StudyInfo not found"
                 }
 
+            await record_intake(self.db, study_info, delta=-1)
             await self.db.delete(study_info)
             await self.db.commit()
             return {
@@ -0,0 +1,281 @@
+import asyncio
+import csv
+import io
+import os
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import ParseError
+from zipfile import BadZipFile
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sharq_models.models import (  # type: ignore
+    EducationType,
+    StudyDirection,
+    StudyForm,
+    StudyInfo,
+    StudyLanguage,
+    StudyType,
+    User,
+)
+from src.schemas.study_info import (
+    ImportRowError,
+    StudyInfoImportReport,
+    StudyInfoImportRow,
+)
+from src.service import BasicCrud
+from src.service.analytics import IntakeKey, record_intake_counts
+
+STAGING_TABLE = "study_info_import_staging"
+STAGING_COLUMNS = (
+    "user_id",
+    "study_language_id",
+    "study_form_id",
+    "study_direction_id",
+    "study_type_id",
+    "education_type_id",
+    "graduate_year",
+    "certificate_path",
+    "dtm_sheet",
+)
+_STAGING_DDL = f"""
+    CREATE TEMP TABLE {STAGING_TABLE} (
+        user_id integer NOT NULL,
+        study_language_id integer NOT NULL,
+        study_form_id integer NOT NULL,
+        study_direction_id integer NOT NULL,
+        study_type_id integer NOT NULL,
+        education_type_id integer NOT NULL,
+        graduate_year text NOT NULL,
+        certificate_path text,
+        dtm_sheet text
+    ) ON COMMIT DROP
+"""
+staging = table(STAGING_TABLE, *(column(name) for name in STAGING_COLUMNS))
+
+_row_adapter = TypeAdapter(list[StudyInfoImportRow])
+
+
+def _normalize(key, value):
+    key = str(key).strip().lower() if key is not None else ""
+    if value is None:
+        return key, None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return key, value or None
+
+
+def read_rows(stream: BinaryIO, filename: str) -> Iterator[tuple[int, dict]]:
+    """Yield ``(row_number, row)`` from a CSV or XLSX file without loading it whole."""
+    extension = os.path.splitext(filename or "")[1].lower()
+
+    if extension == ".csv":
+        reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+        for row in reader:
+            yield reader.line_num, dict(_normalize(k, v) for k, v in row.items())
+    elif extension == ".xlsx":
+        import openpyxl
+        from openpyxl.utils.exceptions import InvalidFileException
+
+        try:
+            workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                header = next(rows, ())
+                for number, values in enumerate(rows, start=2):
+                    if all(value is None for value in values):
+                        continue
+                    yield number, dict(_normalize(k, v) for k, v in zip(header, values))
+            finally:
+                workbook.close()
+        except (BadZipFile, InvalidFileException, ParseError, KeyError) as e:
+            # A corrupt or mislabelled workbook is a bad upload, not a server error.
+            raise ValueError(f"Could not read the .xlsx file: {e}") from e
+    else:
+        raise ValueError("Only .csv and .xlsx files are supported")
+
+
+def _intake_key(created, direction_id, form_id) -> IntakeKey:
+    return (created.replace(minute=0, second=0, microsecond=0), direction_id or 0, form_id or 0)
+
+
+def _format_errors(error: ValidationError) -> dict[int, list[str]]:
+    by_index = defaultdict(list)
+    for item in error.errors():
+        index, *field = item["loc"]
+        by_index[index].append(f"{'.'.join(map(str, field))}: {item['msg']}")
+    return by_index
+
+
+class StudyInfoImporter(BasicCrud):
+    BATCH_SIZE = 2000
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def _load_dictionaries(self) -> dict:
+        async def names(model):
+            rows = await self.db.execute(select(model.name, model.id))
+            return {name.strip().lower(): id_ for name, id_ in rows}
+
+        directions = await self.db.execute(
+            select(StudyDirection.name, StudyDirection.study_form_id, StudyDirection.id)
+        )
+        return {
+            "study_language": await names(StudyLanguage),
+            "study_form": await names(StudyForm),
+            "study_type": await names(StudyType),
+            "education_type": await names(EducationType),
+            "study_direction": {
+                (name.strip().lower(), form_id): id_ for name, form_id, id_ in directions
+            },
+        }
+
+    def _validate(self, batch: list[tuple[int, dict]]):
+        """Validate a batch in one adapter pass; returns (valid rows, errors by index)."""
+        try:
+            return list(zip(batch, _row_adapter.validate_python([r for _, r in batch]))), {}
+        except ValidationError as e:
+            errors = _format_errors(e)
+        valid = [item for index, item in enumerate(batch) if index not in errors]
+        parsed = _row_adapter.validate_python([r for _, r in valid])
+        return list(zip(valid, parsed)), {batch[i][0]: msgs for i, msgs in errors.items()}
+
+    def _resolve(self, row: StudyInfoImportRow, dictionaries: dict) -> tuple[tuple, list[str]]:
+        errors = []
+        ids = {}
+        for field in ("study_language", "study_form", "study_type", "education_type"):
+            ids[field] = dictionaries[field].get(getattr(row, field).lower())
+            if ids[field] is None:
+                errors.append(f"{field}: unknown value '{getattr(row, field)}'")
+
+        direction_key = (row.study_direction.lower(), ids["study_form"])
+        direction_id = dictionaries["study_direction"].get(direction_key)
+        if direction_id is None:
+            errors.append(f"study_direction: unknown value '{row.study_direction}' for this study_form")
+
+        record = (
+            row.user_id,
+            ids["study_language"],
+            ids["study_form"],
+            direction_id,
+            ids["study_type"],
+            ids["education_type"],
+            row.graduate_year,
+            row.certificate_path,
+            row.dtm_sheet,
+        )
+        return record, errors
+
+    async def _known_users(self, user_ids: list[int]) -> set[int]:
+        known = await self.db.execute(select(User.id).where(User.id.in_(user_ids)))
+        return set(known.scalars())
+
+    async def _lock_existing(self) -> dict[int, IntakeKey]:
+        """Intake buckets of the staged users that already applied, locked until commit."""
+        stmt = (
+            select(
+                StudyInfo.user_id,
+                StudyInfo.create_at,
+                StudyInfo.study_direction_id,
+                StudyInfo.study_form_id,
+            )
+            .where(StudyInfo.user_id.in_(select(staging.c.user_id)))
+            .with_for_update()
+        )
+        return {
+            user_id: _intake_key(created, direction_id, form_id)
+            for user_id, created, direction_id, form_id in await self.db.execute(stmt)
+        }
+
+    def _upsert_statement(self):
+        stmt = pg_insert(StudyInfo).from_select(
+            [*STAGING_COLUMNS, "create_at"], select(*staging.c, func.now())
+        )
+        # create_at is the application date and stays as it was.
+        return stmt.on_conflict_do_update(
+            index_elements=[StudyInfo.user_id],
+            set_={name: stmt.excluded[name] for name in STAGING_COLUMNS if name != "user_id"},
+        ).returning(
+            StudyInfo.user_id,
+            StudyInfo.create_at,
+            StudyInfo.study_direction_id,
+            StudyInfo.study_form_id,
+            literal_column("xmax = 0").label("inserted"),
+        )
+
+    async def import_file(self, stream: BinaryIO, filename: str) -> StudyInfoImportReport:
+        """Insert new applications and update existing ones (keyed on user_id).
+
+        Rows are validated and resolved in batches, copied into a temporary
+        staging table, and applied with one ``INSERT ... ON CONFLICT (user_id)
+        DO UPDATE``. Raises ValueError for files that cannot be read.
+        """
+        dictionaries = await self._load_dictionaries()
+
+        await self.db.execute(text(_STAGING_DDL))
+        conn = await self.db.connection()
+        driver = (await conn.get_raw_connection()).driver_connection
+
+        rows = read_rows(stream, filename)
+        errors: dict[int, list[str]] = {}
+        row_by_user: dict[int, int] = {}
+        total = 0
+
+        try:
+            while batch := await asyncio.to_thread(lambda: list(islice(rows, self.BATCH_SIZE))):
+                total += len(batch)
+                valid, batch_errors = self._validate(batch)
+                errors.update(batch_errors)
+
+                known = await self._known_users([row.user_id for _, row in valid])
+                records = []
+                for (number, _), row in valid:
+                    record, row_errors = self._resolve(row, dictionaries)
+                    if row.user_id not in known:
+                        row_errors.append("user_id: user not found")
+                    elif row.user_id in row_by_user:
+                        row_errors.append(f"user_id: duplicate of row {row_by_user[row.user_id]}")
+                    if row_errors:
+                        errors[number] = row_errors
+                        continue
+                    row_by_user[row.user_id] = number
+                    records.append(record)
+
+                if records:
+                    await driver.copy_records_to_table(
+                        STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+                    )
+
+            before = await self._lock_existing()
+            upserted = (await self.db.execute(self._upsert_statement())).all()
+
+            # Keep the hourly intake rollup in step: new rows count once, updated
+            # rows move between buckets when their direction or form changed.
+            intake = Counter()
+            for user_id, created, direction_id, form_id, inserted in upserted:
+                after = _intake_key(created, direction_id, form_id)
+                if inserted:
+                    intake[after] += 1
+                elif user_id in before and before[user_id] != after:
+                    intake[before[user_id]] -= 1
+                    intake[after] += 1
+            await record_intake_counts(self.db, {key: delta for key, delta in intake.items() if delta})
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        inserted = sum(1 for *_, was_inserted in upserted if was_inserted)
+        return StudyInfoImportReport(
+            total=total,
+            inserted=inserted,
+            updated=len(upserted) - inserted,
+            failed=len(errors),
+            errors=[ImportRowError(row=n, errors=e) for n, e in sorted(errors.items())],
+        )
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from fastapi import HTTPException, status
 from src.service import BasicCrud
 from sharq_models.models import StudyLanguage #type: ignore 
@@ -6,6 +8,7 @@ from src.schemas.study_language import (
     StudyLanguageUpdate,
     StudyLanguageFilter,
     StudyLanguageResponse,
+    StudyLanguageBulkUpdate,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
@@ -58,11 +61,52 @@ class StudyLanguageCrud(BasicCrud[StudyLanguage, StudyLanguageBase]):
     async def update_study_language(
         self, language_id: int, obj: StudyLanguageUpdate
     ) -> StudyLanguageResponse:
-        await self.get_by_study_language_id(language_id)
-        return await super().update(
+        study_language = await super().update_returning(
             model=StudyLanguage, item_id=language_id, obj_items=obj
         )
+        if not study_language:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Til topilmadi"
+            )
+        return study_language
 
     async def delete_study_language(self, language_id: int) -> dict:
-        await self.get_by_study_language_id(language_id)
-        return await super().delete(model=StudyLanguage, item_id=language_id)
+        # ORM delete on purpose: relationship cascades defined in sharq_models must run.
+        study_language = await super().delete(model=StudyLanguage, item_id=language_id)
+        if not study_language:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Til topilmadi"
+            )
+        return study_language
+
+    async def bulk_create_study_languages(
+        self, items: List[StudyLanguageBase]
+    ) -> List[StudyLanguageResponse]:
+        names = Counter(item.name for item in items)
+        conflicts = await super().get_existing_values(
+            model=StudyLanguage, field_name="name", values=list(names)
+        )
+        conflicts.update(name for name, count in names.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday til allaqachon mavjud: {', '.join(sorted(conflicts))}",
+            )
+
+        return await super().bulk_create(model=StudyLanguage, items=items)
+
+    async def bulk_update_study_languages(
+        self, items: List[StudyLanguageBulkUpdate]
+    ) -> List[StudyLanguageResponse]:
+        conflicts = await super().get_update_conflicts(model=StudyLanguage, items=items)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday til allaqachon mavjud: {', '.join(sorted(name for name, in conflicts))}",
+            )
+
+        return await super().bulk_update(model=StudyLanguage, items=items)
+
+    async def bulk_delete_study_languages(self, ids: List[int]) -> dict:
+        deleted = await super().bulk_delete_cascading(model=StudyLanguage, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from fastapi import HTTPException, status
 from src.service import BasicCrud
 from sharq_models.models import StudyType #type: ignore 
@@ -6,6 +8,7 @@ from src.schemas.study_type import (
     StudyTypeUpdate,
     StudyTypeFilter,
     StudyTypeResponse,
+    StudyTypeBulkUpdate,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
@@ -58,11 +61,52 @@ class StudyTypeCrud(BasicCrud[StudyType, StudyTypeBase]):
     async def update_study_type(
         self, study_id: int, obj: StudyTypeUpdate
     ) -> StudyTypeResponse:
-        await self.get_by_study_type_id(study_id)
-        return await super().update(
+        study_type = await super().update_returning(
             model=StudyType, item_id=study_id, obj_items=obj
         )
+        if not study_type:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'qish turi topilmadi"
+            )
+        return study_type
 
     async def delete_study_type(self, study_id: int) -> dict:
-        await self.get_by_study_type_id(study_id)
-        return await super().delete(model=StudyType, item_id=study_id)
+        # ORM delete on purpose: relationship cascades defined in sharq_models must run.
+        study_type = await super().delete(model=StudyType, item_id=study_id)
+        if not study_type:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="O'qish turi topilmadi"
+            )
+        return study_type
+
+    async def bulk_create_study_types(
+        self, items: List[StudyTypeBase]
+    ) -> List[StudyTypeResponse]:
+        names = Counter(item.name for item in items)
+        conflicts = await super().get_existing_values(
+            model=StudyType, field_name="name", values=list(names)
+        )
+        conflicts.update(name for name, count in names.items() if count > 1)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'qish turi allaqachon mavjud: {', '.join(sorted(conflicts))}",
+            )
+
+        return await super().bulk_create(model=StudyType, items=items)
+
+    async def bulk_update_study_types(
+        self, items: List[StudyTypeBulkUpdate]
+    ) -> List[StudyTypeResponse]:
+        conflicts = await super().get_update_conflicts(model=StudyType, items=items)
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Bunday o'qish turi allaqachon mavjud: {', '.join(sorted(name for name, in conflicts))}",
+            )
+
+        return await super().bulk_update(model=StudyType, items=items)
+
+    async def bulk_delete_study_types(self, ids: List[int]) -> dict:
+        deleted = await super().bulk_delete_cascading(model=StudyType, ids=ids)
+        return {"deleted": len(deleted), "ids": [item.id for item in deleted]}
@@ -3,14 +3,10 @@ from sharq_models.models import (  # type: ignore
     User,
     StudyInfo,
     PassportData,
-    StudyLanguage,
-    StudyForm,
-    StudyDirection,
-    StudyType,
-    EducationType,
-    Contract,
+    AMOCrmLead,
 )
 from src.service.study_info import StudyInfoCrud
+from src.service.stats import StatsService
 from src.schemas.passport_data import PassportDataResponse
 # from src.schemas.study_info import StudyInfoResponse
 from src.schemas.user_data import (
@@ -19,9 +15,40 @@ from src.schemas.user_data import (
     UserDataFilterByStudyInfo,
 )
 from src.service import BasicCrud
+from src.service.filters import (
+    PASSPORT_FILTERS,
+    STUDY_INFO_FILTERS,
+    apply_filters,
+    compile_filters,
+)
+from src.core.replica import replica_safe
 from fastapi import HTTPException
-from sqlalchemy import select, and_ , func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, exists, bindparam
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+_lead_id = (
+    select(AMOCrmLead.lead_id)
+    .where(AMOCrmLead.user_id == User.id)
+    .limit(1)
+    .correlate(User)
+    .scalar_subquery()
+)
+
+PROFILES_BY_USER_IDS = (
+    select(User, _lead_id.label("lead_id"))
+    .options(
+        joinedload(User.passport_data),
+        joinedload(User.study_info).joinedload(StudyInfo.study_language),
+        joinedload(User.study_info).joinedload(StudyInfo.study_form),
+        joinedload(User.study_info).joinedload(StudyInfo.study_direction),
+        joinedload(User.study_info).joinedload(StudyInfo.study_type),
+        joinedload(User.study_info).joinedload(StudyInfo.education_type),
+        selectinload(User.contracts),
+    )
+    .where(User.id.in_(bindparam("user_ids", expanding=True)))
+)
 
 
 class UserData(BasicCrud):
@@ -30,41 +57,53 @@ class UserData(BasicCrud):
         self.db = db
         self.study_info_service = StudyInfoCrud(db)
 
-    async def get_user_data_by_id(self, user_id: int):
-        stmt = select(User).where(User.id == user_id).options(
-            joinedload(User.passport_data)
-        )
-        result = await self.db.execute(stmt)
-        user = result.scalar_one_or_none()
+    async def _load_profiles(self, user_ids: list[int]) -> dict[int, UserDataResponse]:
+        """User, passport, study info with dictionaries, contracts and lead in two queries.
+
+        Users without passport data have no profile and are left out.
+        """
+        result = await self.db.execute(PROFILES_BY_USER_IDS, {"user_ids": user_ids})
+        profiles = {}
+        for user, lead_id in result.unique().all():
+            if not user.passport_data:
+                continue
+            study_info = user.study_info
+            study_info_response = None
+            if study_info:
+                # The owner is already loaded; avoid a lazy load of the back reference.
+                set_committed_value(study_info, "user", user)
+                study_info_response = await self.study_info_service._to_response_with_names(
+                    study_info,
+                    contract_paths=[contract.file_path for contract in user.contracts],
+                )
+            profiles[user.id] = UserDataResponse(
+                passport_data=PassportDataResponse.model_validate(user.passport_data),
+                study_info_data=study_info_response,
+                lead_id=lead_id,
+            )
+        return profiles
 
-        if not user:
+    async def get_user_data_by_id(self, user_id: int) -> UserDataResponse:
+        profile = (await self._load_profiles([user_id])).get(user_id)
+        if not profile:
             raise HTTPException(status_code=404, detail="Foydalanuvchi topilmadi")
+        return profile
 
-        study_info_stmt = select(StudyInfo).where(StudyInfo.user_id == user_id)
-        study_info_result = await self.db.execute(study_info_stmt)
-        study_info = study_info_result.scalar_one_or_none()
-
-        study_info_response = (
-            await self.study_info_service.get_study_info_by_id(study_info.id)
-            if study_info else None
-        )
-
-        # Ensure passport_data is loaded before validation
-        passport_data = user.passport_data
-        passport_data_response = PassportDataResponse.model_validate(passport_data)
-
-        return UserDataResponse(
-            passport_data=passport_data_response,
-            study_info_data=study_info_response
-        )
+    @replica_safe
+    async def get_user_profiles(self, user_ids: list[int]) -> list[UserDataResponse]:
+        """Profiles for many users, in the order requested; unknown ids are skipped."""
+        user_ids = list(dict.fromkeys(user_ids))
+        profiles = await self._load_profiles(user_ids)
+        return [profiles[user_id] for user_id in user_ids if user_id in profiles]
 
+    @replica_safe
     async def get_all_user_data_by_passport_data(
         self,
         filter_filed: UserDataFilterByPassportData,
         limit: int = 10,
         offset: int = 0
     ) -> list[PassportData]:
-        stmt = select(PassportData).join(PassportData.user).options(
+        stmt = select(PassportData).options(
             joinedload(PassportData.user)
             .joinedload(User.study_info)
             .joinedload(StudyInfo.study_language),
@@ -82,28 +121,15 @@ class UserData(BasicCrud):
             .joinedload(StudyInfo.education_type)
         )
 
-        filters = [User.study_info != None]  
-
-        if filter_filed.passport_series_number:
-            filters.append(PassportData.passport_series_number == filter_filed.passport_series_number)
-        if filter_filed.jshshir:
-            filters.append(PassportData.jshshir == filter_filed.jshshir)
-        if filter_filed.first_name:
-            filters.append(PassportData.first_name.ilike(f"%{filter_filed.first_name}%"))
-        if filter_filed.last_name:
-            filters.append(PassportData.last_name.ilike(f"%{filter_filed.last_name}%"))
-        if filter_filed.third_name:
-            filters.append(PassportData.third_name.ilike(f"%{filter_filed.third_name}%"))
-        if filter_filed.region:
-            filters.append(PassportData.region.ilike(f"%{filter_filed.region}%"))
-        if filter_filed.gender:
-            filters.append(PassportData.gender == filter_filed.gender)
-
-        stmt = stmt.where(and_(*filters)).limit(limit).offset(offset)
+        compiled = await compile_filters(self.db, PASSPORT_FILTERS, filter_filed)
+        stmt = stmt.where(
+            exists().where(StudyInfo.user_id == PassportData.user_id), *compiled.clauses
+        ).limit(limit).offset(offset)
 
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    @replica_safe
     async def get_all_user_data_by_study_info(
         self,
         filter_field: UserDataFilterByStudyInfo,
@@ -112,56 +138,25 @@ class UserData(BasicCrud):
     ) -> list[User]:
         stmt = (
             select(User)
-            .join(User.study_info)  
-            .join(StudyInfo.study_language)
-            .join(StudyInfo.study_form)
-            .join(StudyInfo.study_direction)
-            .join(StudyInfo.study_type)
-            .join(StudyInfo.education_type)
+            .join(User.study_info)
             .options(
                 joinedload(User.passport_data),
-                joinedload(User.study_info).joinedload(StudyInfo.study_language),
-                joinedload(User.study_info).joinedload(StudyInfo.study_form),
-                joinedload(User.study_info).joinedload(StudyInfo.study_direction),
-                joinedload(User.study_info).joinedload(StudyInfo.study_type),
-                joinedload(User.study_info).joinedload(StudyInfo.education_type)
+                contains_eager(User.study_info).joinedload(StudyInfo.study_language),
+                contains_eager(User.study_info).joinedload(StudyInfo.study_form),
+                contains_eager(User.study_info).joinedload(StudyInfo.study_direction),
+                contains_eager(User.study_info).joinedload(StudyInfo.study_type),
+                contains_eager(User.study_info).joinedload(StudyInfo.education_type)
             )
         )
 
-        filters = []
-
-        if filter_field.study_language:
-            filters.append(StudyLanguage.name == filter_field.study_language)
-        if filter_field.study_form:
-            filters.append(StudyForm.name == filter_field.study_form)
-        if filter_field.study_direction_name:
-            filters.append(StudyDirection.name.ilike(f"%{filter_field.study_direction_name}%"))
-        if filter_field.study_type:
-            filters.append(StudyType.name == filter_field.study_type)
-        if filter_field.education_type:
-            filters.append(EducationType.name == filter_field.education_type)
-
-        stmt = stmt.where(and_(*filters)).limit(limit).offset(offset)
+        compiled = await compile_filters(self.db, STUDY_INFO_FILTERS, filter_field)
+        stmt = apply_filters(stmt, compiled, {}).limit(limit).offset(offset)
 
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
 
+    @replica_safe
     async def count_all_users_with_related_data(self) -> dict:
-        stmt_study_info = select(func.count()).select_from(StudyInfo)
-        result_study_info = await self.db.execute(stmt_study_info)
-        users_with_study_info = result_study_info.scalar_one()
-
-        stmt_passport = select(func.count()).select_from(PassportData)
-        result_passport = await self.db.execute(stmt_passport)
-        users_with_passport_data = result_passport.scalar_one()
-
-        stmt_contract = select(func.count()).select_from(Contract)
-        result_contract = await self.db.execute(stmt_contract)
-        users_with_contract = result_contract.scalar_one()
-
-        return {
-            "users_with_passport_data": users_with_passport_data,
-            "users_with_study_info": users_with_study_info,
-            "users_with_contract": users_with_contract
-        }
+        summary = await StatsService(self.db).get_summary()
+        return summary.model_dump()
@@ -8,7 +8,7 @@ from fastapi.security import (
     OAuth2PasswordBearer,
 )
 from sqlalchemy.orm import joinedload
-from sqlalchemy import select 
+from sqlalchemy import select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.context import CryptContext
 from pydantic import ValidationError
@@ -20,6 +20,13 @@ from src.core.db import get_db
 from sharq_models.models import User
 
 
+# Runs on every authenticated request; built once so only the bound value changes.
+USER_BY_PHONE = (
+    select(User)
+    .options(joinedload(User.role))
+    .where(User.phone_number == bindparam("username"))
+)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -45,11 +52,7 @@ async def authenticate_user(db: AsyncSession, username: str, password: str):
 
 
 async def get_user(db: AsyncSession, username: str):
-    stmt = select(User).options(
-        joinedload(User.role)
-    ).where(User.phone_number == username)
-    
-    result = await db.execute(stmt)
+    result = await db.execute(USER_BY_PHONE, {"username": username})
     return result.scalars().first()
 
 
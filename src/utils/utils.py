@@ -1,16 +1,16 @@
 import os
-from uuid import uuid4
-import qrcode
 import random
 
+from src.core.storage import new_upload_path
+
 def generate_file_path(base_dir: str, extension: str) -> str:
-        filename = f"{uuid4().hex}{extension}"
-        full_path = os.path.join(base_dir, filename)
-        os.makedirs(base_dir, exist_ok=True)
-        return full_path
+        # Storage creates parent "directories" on write; nothing to prepare here.
+        return new_upload_path(base_dir, extension)
 
 
 def generate_qr_code(data: str, save_path: str) -> None:
+    import qrcode
+
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
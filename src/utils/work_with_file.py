@@ -1,22 +1,31 @@
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
+import posixpath
 from fastapi import UploadFile, HTTPException, status
 from uuid import uuid4
 from src.service import ModelType
+from src.core.images import schedule_variants
+from src.core.storage import CHUNK_SIZE, get_storage, key_for
 from typing import Type
 
 
 
+async def _read_chunks(file: UploadFile):
+    while chunk := await file.read(CHUNK_SIZE):
+        yield chunk
+
+
 async def save_uploaded_file(file: UploadFile, upload_dir: str | None = "uploads"):
-    os.makedirs(upload_dir, exist_ok=True)
     file_ext = os.path.splitext(file.filename)[1]
     unique_filename = f"{uuid4().hex}{file_ext}"
-    file_path = os.path.join(upload_dir, unique_filename)
+    file_path = posixpath.join(upload_dir, unique_filename)
+
+    await get_storage().write(key_for(file_path), _read_chunks(file), content_type=file.content_type)
 
-    with open(file_path, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
+    # Thumbnails are made off the request path; until they exist the uploads
+    # router falls back to the original.
+    schedule_variants(file_path)
 
     return file_path
 
@@ -0,0 +1,25 @@
+"""Settings for the test run.
+
+``src.core.config`` builds ``Settings()`` and ``src.core.db`` the engines at
+import time, so the required values must be in the environment before any
+``src`` module is imported. Creating an engine does not connect; tests that
+need a real database or object store say so and skip otherwise.
+"""
+import os
+import tempfile
+
+_TEST_ENV = {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_USER": "postgres",
+    "DB_PASSWORD": "postgres",
+    "DB_NAME": "sharq_test",
+    "ACCESS_SECRET_KEY": "test-secret",
+    "AMO_CRM_TOKEN": "test-token",
+    "BASE_URL": "http://testserver",
+    "UPLOAD_DIR": tempfile.mkdtemp(prefix="sharq-uploads-"),
+    "WARMUP_ENABLED": "false",
+}
+
+for name, value in _TEST_ENV.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,34 @@
+"""Rate-limit buckets behind the reverse proxy."""
+import asyncio
+
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from src.core.admission import client_key
+from src.core.server import server_options
+
+
+def _client_host(peer: str, forwarded_for: str | None) -> str:
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["host"] = scope["client"][0]
+
+    options = server_options()
+    assert options["proxy_headers"] is True
+    middleware = ProxyHeadersMiddleware(app, trusted_hosts=options["forwarded_allow_ips"])
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    scope = {"type": "http", "client": (peer, 50000), "headers": headers, "scheme": "http"}
+    asyncio.run(middleware(scope, None, None))
+    return seen["host"]
+
+
+def test_clients_behind_the_proxy_get_their_own_buckets():
+    first = client_key(None, _client_host("127.0.0.1", "203.0.113.7"))
+    second = client_key(None, _client_host("127.0.0.1", "198.51.100.20"))
+
+    assert first == "ip:203.0.113.7"
+    assert second == "ip:198.51.100.20"
+
+
+def test_forwarded_for_from_an_untrusted_peer_is_ignored():
+    assert client_key(None, _client_host("192.0.2.50", "203.0.113.7")) == "ip:192.0.2.50"
@@ -0,0 +1,136 @@
+"""Plan shape of the application list: which tables each filter joins.
+
+Statements are compiled for PostgreSQL, not executed. Dictionary names are
+resolved from a recording session, so no database is needed.
+"""
+import asyncio
+import re
+
+import pytest
+
+pytest.importorskip("sharq_models")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from sharq_models.models import (  # type: ignore  # noqa: E402
+    EducationType,
+    PassportData,
+    StudyDirection,
+    StudyForm,
+    StudyLanguage,
+    StudyType,
+    User,
+)
+from src.schemas.user_data import (  # noqa: E402
+    UserDataFilterByPassportData,
+    UserDataFilterByStudyInfo,
+)
+from src.service.filters import (  # noqa: E402
+    APPLICATION_SEARCH,
+    PASSPORT_FILTERS,
+    STUDY_INFO_FILTERS,
+    compile_filters,
+    compile_search,
+    invalidate_reference,
+    merge,
+)
+from src.service.study_info import list_statements  # noqa: E402
+
+DICTIONARY_TABLES = [
+    model.__tablename__
+    for model in (StudyLanguage, StudyForm, StudyDirection, StudyType, EducationType)
+]
+
+
+class _Rows:
+    def tuples(self):
+        return self
+
+    def all(self):
+        return [(1, "Kunduzgi"), (2, "Sirtqi")]
+
+
+class ReferenceSession:
+    async def execute(self, stmt, params=None):
+        return _Rows()
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _statements(passport=None, study_info=None, search=None):
+    invalidate_reference()
+    db = ReferenceSession()
+
+    async def build():
+        return merge(
+            await compile_filters(db, PASSPORT_FILTERS, passport),
+            await compile_filters(db, STUDY_INFO_FILTERS, study_info),
+            await compile_search(db, APPLICATION_SEARCH, search),
+        )
+
+    page, count = list_statements(asyncio.run(build()), limit=100, offset=0)
+    return _sql(page), _sql(count)
+
+
+def _inner_joins(sql: str) -> set[str]:
+    return set(re.findall(r"(?<!LEFT OUTER )JOIN (\w+)", sql))
+
+
+def _where(sql: str) -> str:
+    return sql.partition(" WHERE ")[2].partition(" ORDER BY ")[0]
+
+
+CASES = {
+    "no filter": {},
+    "passport only": {"passport": UserDataFilterByPassportData(gender="erkak")},
+    "dictionary only": {"study_info": UserDataFilterByStudyInfo(study_form="Kunduzgi")},
+    "search": {"search": "Aliyev"},
+}
+
+# Tables joined for filtering, per case; eager loads are LEFT OUTER JOINs.
+EXPECTED_JOINS = {
+    "no filter": set(),
+    "passport only": {User.__tablename__, PassportData.__tablename__},
+    "dictionary only": set(),
+    "search": {User.__tablename__, PassportData.__tablename__},
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_only_referenced_tables_are_joined(case):
+    page, count = _statements(**CASES[case])
+
+    assert _inner_joins(count) == EXPECTED_JOINS[case]
+    assert _inner_joins(page) == EXPECTED_JOINS[case]
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_dictionary_tables_are_never_joined_for_filtering(case):
+    page, count = _statements(**CASES[case])
+
+    for table in DICTIONARY_TABLES:
+        assert table not in count
+        assert table not in _inner_joins(page)
+        assert table not in _where(page)
+
+
+def test_dictionary_filter_is_an_in_list_on_the_foreign_key():
+    _, count = _statements(**CASES["dictionary only"])
+
+    assert "study_form_id IN" in _where(count)
+
+
+@pytest.mark.parametrize("case", ["passport only", "search"])
+def test_passport_is_loaded_through_the_filter_join(case):
+    page, _ = _statements(**CASES[case])
+
+    # contains_eager: no second, outer join to the same table.
+    assert f"LEFT OUTER JOIN {PassportData.__tablename__}" not in page
+
+
+def test_passport_is_outer_joined_without_passport_filters():
+    page, _ = _statements()
+
+    assert f"LEFT OUTER JOIN {PassportData.__tablename__}" in page
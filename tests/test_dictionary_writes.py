@@ -0,0 +1,135 @@
+"""Round-trips of the single-item update and delete endpoints.
+
+A recording session stands in for AsyncSession, so no database is needed.
+Updates must be one ``UPDATE ... RETURNING``; deletes of models with
+sharq_models relationship cascades must go through ``session.delete()``,
+whose DELETE is flushed by the commit.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+pytest.importorskip("sharq_models")
+
+from src.schemas.education_type import EducationTypeUpdate  # noqa: E402
+from src.schemas.passport_data import PassportDataUpdate  # noqa: E402
+from src.schemas.role import RoleUpdate  # noqa: E402
+from src.schemas.study_direction import StudyDirectionUpdate  # noqa: E402
+from src.schemas.study_form import StudyFormUpdate  # noqa: E402
+from src.schemas.study_language import StudyLanguageUpdate  # noqa: E402
+from src.schemas.study_type import StudyTypeUpdate  # noqa: E402
+from src.service.education_type import EducationTypeCrud  # noqa: E402
+from src.service.passport_data import PassportDataCrud  # noqa: E402
+from src.service.role import RoleService  # noqa: E402
+from src.service.study_direction import StudyDirectionCrud  # noqa: E402
+from src.service.study_form import StudyFormCrud  # noqa: E402
+from src.service.study_lenguage import StudyLanguageCrud  # noqa: E402
+from src.service.study_type import StudyTypeCrud  # noqa: E402
+
+
+class _Result:
+    def __init__(self, row):
+        self.row = row
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.row
+
+    def all(self):
+        return [self.row] if self.row is not None else []
+
+
+class RecordingSession:
+    def __init__(self, row):
+        self.row = row
+        self.info = {}
+        self.statements = []
+        self.deleted = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return _Result(self.row)
+
+    async def scalars(self, stmt, params=None):
+        self.statements.append(stmt)
+        return _Result(self.row)
+
+    async def delete(self, obj):
+        self.deleted.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _row():
+    return SimpleNamespace(id=1, user_id=7, name="Kunduzgi", users=[])
+
+
+UPDATES = [
+    (StudyDirectionCrud, "update_study_direction", StudyDirectionUpdate(name="Kunduzgi")),
+    (StudyTypeCrud, "update_study_type", StudyTypeUpdate(name="Kunduzgi")),
+    (StudyLanguageCrud, "update_study_language", StudyLanguageUpdate(name="Kunduzgi")),
+    (EducationTypeCrud, "update_education_type", EducationTypeUpdate(name="Kunduzgi")),
+    (StudyFormCrud, "update_study_form", StudyFormUpdate(name="Kunduzgi")),
+    (RoleService, "update_role", RoleUpdate(name="Kunduzgi")),
+]
+
+# endpoint -> statements before the commit (the ORM DELETE is flushed by it)
+DELETES = [
+    (StudyDirectionCrud, "delete_study_direction", 1),
+    (StudyTypeCrud, "delete_study_type", 1),
+    (StudyLanguageCrud, "delete_study_language", 1),
+    (EducationTypeCrud, "delete_education_type", 1),
+    (StudyFormCrud, "delete_study_form", 1),
+    # The assigned-users check loads the role first.
+    (RoleService, "delete_role", 2),
+]
+
+
+@pytest.mark.parametrize("service, method, payload", UPDATES)
+def test_update_is_one_round_trip(service, method, payload):
+    session = RecordingSession(_row())
+    row = asyncio.run(getattr(service(session), method)(1, payload))
+
+    assert row is session.row
+    assert len(session.statements) == 1
+    assert session.commits == 1
+
+
+def test_passport_update_is_one_round_trip():
+    session = RecordingSession(_row())
+    row = asyncio.run(
+        PassportDataCrud(session).update_passport_data(1, PassportDataUpdate(region="Toshkent"), user_id=7)
+    )
+
+    assert row is session.row
+    assert len(session.statements) == 1
+
+
+@pytest.mark.parametrize("service, method, payload", UPDATES)
+def test_update_of_missing_row_is_404(service, method, payload):
+    session = RecordingSession(None)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(getattr(service(session), method)(1, payload))
+
+    assert error.value.status_code == 404
+    assert len(session.statements) == 1
+
+
+@pytest.mark.parametrize("service, method, statements", DELETES)
+def test_delete_goes_through_the_orm(service, method, statements):
+    session = RecordingSession(_row())
+    row = asyncio.run(getattr(service(session), method)(1))
+
+    assert row is session.row
+    assert session.deleted == [session.row]
+    assert len(session.statements) == statements
+    assert session.commits == 1
@@ -0,0 +1,182 @@
+"""Compiled list filters: prefix semantics and the dictionary name cache.
+
+Clauses are compiled for PostgreSQL, not executed; dictionary reads and
+writes go to a stand-in session.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("sharq_models")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from sharq_models.models import PassportData, StudyForm, StudyInfo  # type: ignore  # noqa: E402
+from src.schemas.study_form import StudyFormBase, StudyFormUpdate  # noqa: E402
+from src.schemas.user_data import (  # noqa: E402
+    UserDataFilterByPassportData,
+    UserDataFilterByStudyInfo,
+)
+from src.service import BasicCrud  # noqa: E402
+from src.service.filters import (  # noqa: E402
+    PASSPORT_FILTERS,
+    STUDY_INFO_FILTERS,
+    compile_filters,
+    invalidate_reference,
+    load_reference,
+    predicate,
+)
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+
+class DictionarySession:
+    """Serves (id, name) reads from ``names`` and counts them."""
+
+    def __init__(self, names):
+        self.names = names
+        self.info = {}
+        self.reads = 0
+
+    async def execute(self, stmt, params=None):
+        self.reads += 1
+        return _Rows(list(enumerate(self.names, start=1)))
+
+    async def scalars(self, stmt, params=None):
+        return _Rows([])
+
+    def add(self, obj):
+        pass
+
+    async def flush(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    invalidate_reference()
+    yield
+    invalidate_reference()
+
+
+# --- prefix semantics -------------------------------------------------------
+
+
+def _like(clause) -> tuple[str, list]:
+    """SQL with placeholders and the bound values, as sent to the driver."""
+    compiled = clause.compile(dialect=postgresql.dialect())
+    return str(compiled), list(compiled.params.values())
+
+
+def test_prefix_is_a_lowercased_left_anchored_like():
+    sql, params = _like(predicate(PassportData.first_name, "prefix", "Ali"))
+
+    assert sql.startswith("lower(passport_data.first_name) LIKE ")
+    assert "ESCAPE" in sql
+    assert "ILIKE" not in sql
+    assert params == ["ali%"]
+
+
+def test_prefix_escapes_like_wildcards():
+    _, params = _like(predicate(PassportData.last_name, "prefix", "50%_a\\"))
+
+    assert params == ["50\\%\\_a\\\\%"]
+
+
+def test_prefix_filters_compile_to_the_indexed_expression():
+    compiled = asyncio.run(
+        compile_filters(
+            DictionarySession([]),
+            PASSPORT_FILTERS,
+            UserDataFilterByPassportData(first_name="Ali", region="Tosh"),
+        )
+    )
+    clauses = [_like(clause) for clause in compiled.clauses]
+
+    # The expression of the lower(col) text_pattern_ops indexes in migration 0001.
+    assert [sql.partition(" LIKE ")[0] for sql, _ in clauses] == [
+        "lower(passport_data.first_name)",
+        "lower(passport_data.region)",
+    ]
+    assert [params for _, params in clauses] == [["ali%"], ["tosh%"]]
+
+
+def test_equality_filters_are_not_prefix_matches():
+    sql = _sql(predicate(PassportData.jshshir, "eq", "123"))
+
+    assert sql == "passport_data.jshshir = '123'"
+
+
+def test_dictionary_names_become_an_in_list():
+    db = DictionarySession(["Kunduzgi", "Sirtqi", "Kechki"])
+    compiled = asyncio.run(
+        compile_filters(db, STUDY_INFO_FILTERS, UserDataFilterByStudyInfo(study_form=" kunduzgi "))
+    )
+
+    assert [_sql(clause) for clause in compiled.clauses] == ["study_info.study_form_id IN (1)"]
+    assert compiled.entities == {StudyInfo}
+
+
+# --- reference cache --------------------------------------------------------
+
+
+def _reads_after(write) -> int:
+    db = DictionarySession(["Kunduzgi"])
+
+    async def run():
+        await load_reference(db, StudyForm)
+        await load_reference(db, StudyForm)
+        assert db.reads == 1
+        await write(BasicCrud(db))
+        await load_reference(db, StudyForm)
+
+    asyncio.run(run())
+    return db.reads
+
+
+WRITES = {
+    "create": lambda crud: crud.create(StudyForm, StudyFormBase(name="Sirtqi")),
+    "update_returning": lambda crud: crud.update_returning(StudyForm, 1, StudyFormUpdate(name="Sirtqi")),
+    "delete_returning": lambda crud: crud.delete_returning(StudyForm, 1),
+    "bulk_create": lambda crud: crud.bulk_create(StudyForm, [StudyFormBase(name="Sirtqi")]),
+    "bulk_delete": lambda crud: crud.bulk_delete(StudyForm, ids=[1]),
+}
+
+
+@pytest.mark.parametrize("write", WRITES)
+def test_writes_invalidate_the_dictionary_cache(write):
+    assert _reads_after(WRITES[write]) == 2
+
+
+def test_writes_to_other_models_keep_the_cache():
+    assert _reads_after(lambda crud: crud.delete_returning(PassportData, 1)) == 1
@@ -0,0 +1,76 @@
+"""Image variants: flattening transparency and scheduling generation."""
+import asyncio
+import io
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from src.core import images  # noqa: E402
+from src.core.storage import LocalStorage  # noqa: E402
+
+
+def _png(mode: str) -> bytes:
+    """64x64 image: left half opaque, right half fully transparent."""
+    if mode == "P":
+        image = Image.new("P", (64, 64), 0)
+        image.putpalette([0, 0, 0, 255, 0, 0])
+        image.paste(1, (0, 0, 32, 64))
+        options = {"transparency": 0}
+    else:
+        image = Image.new(mode, (64, 64))
+        image.paste((255, 0, 0, 255) if mode == "RGBA" else (0, 255), (0, 0, 32, 64))
+        options = {}
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", **options)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "LA", "P"])
+@pytest.mark.parametrize("variant", list(images.VARIANTS))
+def test_transparent_pixels_become_white(mode, variant):
+    body = images.render_variants(_png(mode), (variant,))[variant]
+
+    with Image.open(io.BytesIO(body)) as rendered:
+        pixel = rendered.convert("RGB").getpixel((rendered.width - 1, 0))
+    assert min(pixel) > 240
+
+
+def test_variants_are_scheduled_once_for_a_missing_thumbnail(tmp_path, monkeypatch):
+    storage = LocalStorage(str(tmp_path))
+    monkeypatch.setattr(images, "get_storage", lambda: storage)
+    monkeypatch.setattr(images, "_get_pool", lambda: None)  # run_in_executor(None): threads
+
+    async def run():
+        await storage.write("images/a.png", _png("RGBA"))
+        images.schedule_variants("uploads/images/a.png")
+        images.schedule_variants("uploads/images/a.png")
+        assert images._scheduled == {"uploads/images/a.png"}
+        while images._scheduled:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert sorted(p.name for p in (tmp_path / "images").iterdir()) == [
+        "a.png",
+        "a.png.preview.jpg",
+        "a.png.thumb.webp",
+    ]
+
+
+def test_undecodable_originals_are_not_retried(tmp_path, monkeypatch):
+    storage = LocalStorage(str(tmp_path))
+    monkeypatch.setattr(images, "get_storage", lambda: storage)
+    monkeypatch.setattr(images, "_get_pool", lambda: None)
+    monkeypatch.setattr(images, "_failed", set())
+
+    async def run():
+        await storage.write("images/b.jpg", b"not an image")
+        images.schedule_variants("uploads/images/b.jpg")
+        while images._scheduled:
+            await asyncio.sleep(0.01)
+        images.schedule_variants("uploads/images/b.jpg")
+        assert not images._scheduled
+
+    asyncio.run(run())
+    assert images._failed == {"uploads/images/b.jpg"}
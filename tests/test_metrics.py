@@ -0,0 +1,49 @@
+"""Multiprocess metrics: samples are merged across workers and cleaned up.
+
+PROMETHEUS_MULTIPROC_DIR is read when prometheus_client is imported, so each
+check runs in a fresh interpreter.
+"""
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, multiproc_dir) -> str:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def test_live_gauges_of_a_dead_worker_are_dropped(tmp_path):
+    output = _run(
+        """
+        from src.core.metrics import HTTP_REQUESTS_IN_PROGRESS, mark_worker_dead, render_metrics
+
+        HTTP_REQUESTS_IN_PROGRESS.labels("GET").inc()
+        print(b'http_requests_in_progress{method="GET"} 1.0' in render_metrics().body)
+        mark_worker_dead()
+        print(b'http_requests_in_progress{method="GET"}' in render_metrics().body)
+        """,
+        tmp_path,
+    )
+
+    assert output.split() == ["True", "False"]
+
+
+def test_reset_clears_samples_of_a_previous_run(tmp_path):
+    (tmp_path / "counter_123.db").write_bytes(b"stale")
+    (tmp_path / "keep.txt").write_text("not a sample")
+
+    _run("from src.core.metrics import reset_multiprocess_dir; reset_multiprocess_dir()", tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["keep.txt"]
@@ -0,0 +1,39 @@
+"""Connection budget and startup logging."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.core.config import Settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("replica_host, engines", [(None, 1), ("replica.internal", 2)])
+def test_all_pools_fit_the_connection_budget(replica_host, engines):
+    settings = Settings(db_max_connections=120, web_concurrency=4, db_replica_host=replica_host)
+
+    assert settings.db_engine_count == engines
+    per_engine = settings.db_pool_size + settings.db_max_overflow
+    assert settings.db_connections_per_worker == per_engine * engines
+    assert settings.db_connections_per_worker * settings.web_concurrency <= 120
+
+
+def test_concurrency_report_is_logged_at_startup():
+    # A fresh interpreter: main.py must configure logging itself.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import main; from src.core.server import log_concurrency_report; log_concurrency_report()",
+        ],
+        cwd=ROOT,
+        env={**os.environ, "LOG_LEVEL": "INFO"},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0 and "sharq_models" in result.stderr:
+        pytest.skip("main imports sharq_models")
+
+    assert "Concurrency budget" in result.stderr
@@ -0,0 +1,198 @@
+"""Round-trips through the storage backends.
+
+The S3 tests run against the MinIO stand-in from docker-compose
+(``docker compose --profile storage up -d minio minio-init``) or any other
+S3-compatible endpoint given by S3_TEST_ENDPOINT_URL, and skip when it is
+not reachable.
+"""
+import asyncio
+import os
+import socket
+import uuid
+from urllib.parse import urlparse
+
+import pytest
+
+from src.core.storage import InvalidKey, LocalStorage
+
+S3_ENDPOINT = os.environ.get("S3_TEST_ENDPOINT_URL", "http://localhost:9000")
+S3_BUCKET = os.environ.get("S3_TEST_BUCKET", "sharq-uploads")
+S3_ACCESS_KEY = os.environ.get("S3_TEST_ACCESS_KEY_ID", "minioadmin")
+S3_SECRET_KEY = os.environ.get("S3_TEST_SECRET_ACCESS_KEY", "minioadmin")
+
+MIB = 1024 * 1024
+
+
+async def _stream(data: bytes, chunk_size: int = MIB):
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+async def _round_trip(storage, key: str, data) -> None:
+    expected = data if isinstance(data, bytes) else b"".join([c async for c in data])
+    source = data if isinstance(data, bytes) else _stream(expected)
+
+    await storage.write(key, source)
+
+    assert await storage.read_bytes(key) == expected
+    info = await storage.stat(key)
+    assert info.size == len(expected)
+    assert info.key == key
+    assert info.etag
+    assert key in [k async for k in storage.iter_keys(key.rsplit("/", 1)[0])]
+
+    await storage.delete(key)
+    assert await storage.stat(key) is None
+    assert not await storage.exists(key)
+
+
+# --- LocalStorage -----------------------------------------------------------
+
+
+def test_local_round_trip(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    asyncio.run(_round_trip(storage, "contracts/two_side/a.pdf", b"%PDF-1.7 contract"))
+
+
+def test_local_streamed_write(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    asyncio.run(_round_trip(storage, "images/b.jpg", _stream(os.urandom(3 * MIB + 17))))
+
+
+def test_local_write_is_atomic(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+
+    async def failing():
+        yield b"partial"
+        raise OSError("client went away")
+
+    async def run():
+        with pytest.raises(OSError):
+            await storage.write("a/c.bin", failing())
+        assert await storage.stat("a/c.bin") is None
+        assert [k async for k in storage.iter_keys()] == []
+
+    asyncio.run(run())
+    assert list(tmp_path.joinpath("a").iterdir()) == []
+
+
+def test_local_missing_and_directories_are_not_found(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    tmp_path.joinpath("dir").mkdir()
+
+    assert asyncio.run(storage.stat("missing.txt")) is None
+    assert asyncio.run(storage.stat("dir")) is None
+    assert asyncio.run(storage.stat("missing/child.txt")) is None
+
+
+@pytest.mark.parametrize(
+    "key",
+    ["../outside.txt", "a/../../outside.txt", "/etc/passwd", "a//b", "a/./b", "a\\b", "", "a\x00b"],
+)
+def test_local_rejects_keys_outside_the_root(tmp_path, key):
+    storage = LocalStorage(str(tmp_path / "root"))
+
+    with pytest.raises(InvalidKey):
+        asyncio.run(storage.write(key, b"x"))
+    with pytest.raises(InvalidKey):
+        asyncio.run(storage.stat(key))
+    assert not (tmp_path / "outside.txt").exists()
+
+
+def test_local_rejects_symlinks_out_of_the_root(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    (root / "link").symlink_to(tmp_path)
+    storage = LocalStorage(str(root))
+
+    with pytest.raises(InvalidKey):
+        asyncio.run(storage.stat("link/secret.txt"))
+
+
+# --- S3Storage against the stand-in -----------------------------------------
+
+
+def _s3_storage(part_size: int = 5 * MIB):
+    pytest.importorskip("aiobotocore")
+    from src.core.storage.s3 import S3Storage
+
+    return S3Storage(
+        S3_BUCKET,
+        endpoint_url=S3_ENDPOINT,
+        region="us-east-1",
+        access_key_id=S3_ACCESS_KEY,
+        secret_access_key=S3_SECRET_KEY,
+        key_prefix=f"tests/{uuid.uuid4().hex}",
+        part_size=part_size,
+    )
+
+
+def _run_s3(test):
+    """Run ``test(storage)`` in one event loop; skip if the endpoint is down."""
+    endpoint = urlparse(S3_ENDPOINT)
+    try:
+        socket.create_connection((endpoint.hostname, endpoint.port or 80), timeout=1).close()
+    except OSError:
+        pytest.skip(f"S3 stand-in not reachable at {S3_ENDPOINT}")
+
+    async def run():
+        storage = _s3_storage()
+        try:
+            try:
+                client = await storage._get_client()
+                await client.head_bucket(Bucket=S3_BUCKET)
+            except Exception as e:
+                pytest.skip(f"S3 stand-in not reachable at {S3_ENDPOINT}: {e}")
+            await test(storage)
+        finally:
+            await storage.close()
+
+    asyncio.run(run())
+
+
+def test_s3_single_request_round_trip():
+    _run_s3(lambda storage: _round_trip(storage, "contracts/two_side/a.pdf", b"%PDF-1.7"))
+
+
+def test_s3_multipart_round_trip():
+    # 5 MiB parts: two full parts and a short last one.
+    data = os.urandom(11 * MIB + 123)
+    _run_s3(lambda storage: _round_trip(storage, "images/big.bin", _stream(data)))
+
+
+def test_s3_failed_multipart_upload_is_aborted():
+    async def failing():
+        yield os.urandom(6 * MIB)
+        raise OSError("client went away")
+
+    async def test(storage):
+        with pytest.raises(OSError):
+            await storage.write("images/broken.bin", failing())
+        assert await storage.stat("images/broken.bin") is None
+        client = await storage._get_client()
+        pending = await client.list_multipart_uploads(
+            Bucket=S3_BUCKET, Prefix=storage.key_prefix
+        )
+        assert pending.get("Uploads", []) == []
+
+    _run_s3(test)
+
+
+def test_s3_presigned_download_url():
+    async def test(storage):
+        await storage.write("a/c.txt", b"hello")
+        url = await storage.download_url("a/c.txt", 60, filename="c.txt")
+        assert url.startswith(S3_ENDPOINT)
+        assert "Signature" in url or "X-Amz-Signature" in url
+        await storage.delete("a/c.txt")
+
+    _run_s3(test)
+
+
+def test_s3_rejects_invalid_keys():
+    async def test(storage):
+        with pytest.raises(InvalidKey):
+            await storage.write("../outside.txt", b"x")
+
+    _run_s3(test)
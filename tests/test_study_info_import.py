@@ -0,0 +1,27 @@
+"""Reading import files: unreadable uploads are a ValueError (400), not a 500."""
+import io
+
+import pytest
+
+pytest.importorskip("sharq_models")
+
+from src.service.study_info_import import read_rows  # noqa: E402
+
+
+def test_csv_rows_are_normalized():
+    data = "User_ID , Study_Form\n7, Kunduzgi \n".encode("utf-8-sig")
+
+    assert list(read_rows(io.BytesIO(data), "a.csv")) == [
+        (2, {"user_id": "7", "study_form": "Kunduzgi"})
+    ]
+
+
+@pytest.mark.parametrize("payload", [b"not a zip file", b"PK\x03\x04truncated", b"<html></html>"])
+def test_corrupt_workbook_is_a_value_error(payload):
+    with pytest.raises(ValueError):
+        list(read_rows(io.BytesIO(payload), "applications.xlsx"))
+
+
+def test_unsupported_extension_is_a_value_error():
+    with pytest.raises(ValueError):
+        list(read_rows(io.BytesIO(b""), "applications.xls"))
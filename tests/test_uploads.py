@@ -0,0 +1,39 @@
+"""Signed links to stored files, for browsers that cannot send a bearer token."""
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.core.uploads import URL_PREFIX, signed_file_url, verify_upload_signature
+
+
+def _verify(url: str) -> bool:
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    path = parsed.path.removeprefix(URL_PREFIX)
+    return verify_upload_signature(path, query["expires"][0], query["signature"][0])
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "uploads/images/0123456789abcdef0123456789abcdef.jpg",
+        "/uploads/images/0123456789abcdef0123456789abcdef.jpg",
+        "https://api.example.uz/uploads/contracts/two_side/0123456789abcdef0123456789abcdef.pdf",
+    ],
+)
+def test_signed_file_url_verifies(path):
+    url = signed_file_url(path)
+
+    assert url.startswith(URL_PREFIX)
+    assert _verify(url)
+
+
+@pytest.mark.parametrize("path", [None, "", "../etc/passwd"])
+def test_signed_file_url_is_none_without_a_stored_file(path):
+    assert signed_file_url(path) is None
+
+
+def test_signature_is_bound_to_the_path():
+    url = signed_file_url("uploads/images/a.jpg").replace("a.jpg", "b.jpg")
+
+    assert not _verify(url)